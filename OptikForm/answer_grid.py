@@ -0,0 +1,316 @@
+from PyQt5.QtWidgets import (QTableView, QHeaderView, QAbstractItemView,
+                             QStyledItemDelegate, QStyle, QSizePolicy)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF, QSize, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter
+from answer_sheet import AnswerSheet, OPTIONS, STATE_CODES, STATE_NAMES, NO_OPTION
+from bubbles import bubble_pixmap
+
+INDICATORS = [("correct", "✓"), ("wrong", "✗"), ("empty", "○")]
+
+# Sütun düzeni: soru numarası, A-E şıkları, ✓/✗/○ göstergeleri
+NUMBER_COLUMN = 0
+FIRST_OPTION_COLUMN = 1
+FIRST_INDICATOR_COLUMN = FIRST_OPTION_COLUMN + len(OPTIONS)
+COLUMN_COUNT = FIRST_INDICATOR_COLUMN + len(INDICATORS)
+
+# Delegate'in çizim için kullandığı ek roller
+StateRole = Qt.UserRole + 1
+SelectedRole = Qt.UserRole + 2
+KindRole = Qt.UserRole + 3
+
+INDICATOR_COLORS = {
+    "correct": QColor("#4CAF50"),
+    "wrong": QColor("#f44336"),
+    "empty": QColor("#2196F3"),
+}
+
+INDICATOR_HOVER_COLORS = {
+    "correct": QColor("#4CAF50"),
+    "wrong": QColor("#f44336"),
+    "empty": QColor("#9e9e9e"),
+}
+
+
+class AnswerSheetModel(QAbstractTableModel):
+    """Cevap kağıdı modeli; her satır bir soru, sütunlar şıklar ve göstergeler"""
+
+    # Puanı etkileyen her değişiklikte yayınlanır
+    sheet_changed = pyqtSignal()
+    # Tek bir sorunun durumu veya şıkkı değiştiğinde (satır numarasıyla) yayınlanır
+    question_changed = pyqtSignal(int)
+
+    def __init__(self, sheet=None, parent=None):
+        super().__init__(parent)
+        self.sheet = sheet if sheet is not None else AnswerSheet()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.sheet)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return COLUMN_COUNT
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == NUMBER_COLUMN:
+                return f"{row + 1}."
+            if column < FIRST_INDICATOR_COLUMN:
+                return OPTIONS[column - FIRST_OPTION_COLUMN]
+            return INDICATORS[column - FIRST_INDICATOR_COLUMN][1]
+
+        if role == StateRole:
+            return STATE_NAMES[self.sheet.states[row]]
+
+        if role == KindRole:
+            if column == NUMBER_COLUMN:
+                return "number"
+            if column < FIRST_INDICATOR_COLUMN:
+                return "option"
+            return INDICATORS[column - FIRST_INDICATOR_COLUMN][0]
+
+        if role == SelectedRole:
+            if FIRST_OPTION_COLUMN <= column < FIRST_INDICATOR_COLUMN:
+                return bool(self.sheet.selected[row] == column - FIRST_OPTION_COLUMN + 1)
+            if column >= FIRST_INDICATOR_COLUMN:
+                return bool(self.sheet.states[row] == STATE_CODES[INDICATORS[column - FIRST_INDICATOR_COLUMN][0]])
+            return False
+
+        if role == Qt.ToolTipRole:
+            if column == FIRST_INDICATOR_COLUMN:
+                return "Doğru olarak işaretle"
+            if column == FIRST_INDICATOR_COLUMN + 1:
+                return "Yanlış olarak işaretle"
+            if column == FIRST_INDICATOR_COLUMN + 2:
+                return "Boş olarak işaretle"
+
+        return None
+
+    def cells_changed(self, row, old_selected, old_state):
+        """Yalnızca görünümü değişen hücrelerin yeniden çizilmesini iste
+
+        Görünüm, tek hücrelik dataChanged için yalnızca o hücreyi, daha geniş
+        bir aralık için tüm görüntü alanını yeniden çizer; bu yüzden aralık
+        yerine değişen her hücre (en fazla dört) ayrı yayınlanır.
+        """
+        selected = int(self.sheet.selected[row])
+        state = int(self.sheet.states[row])
+        columns = set()
+        if selected != old_selected:
+            columns.update(FIRST_OPTION_COLUMN + code - 1 for code in (old_selected, selected)
+                           if code != NO_OPTION)
+        if state != old_state:
+            # Seçili şıkkın rengi duruma bağlı; göstergelerden eskisi söner, yenisi yanar
+            if selected != NO_OPTION:
+                columns.add(FIRST_OPTION_COLUMN + selected - 1)
+            columns.update(self.indicator_column(code) for code in (old_state, state))
+            columns.discard(None)
+        for column in columns:
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index)
+
+    @staticmethod
+    def indicator_column(state):
+        """Durumun gösterge sütunu; işaretsiz durumun göstergesi yoktur"""
+        for position, (name, _) in enumerate(INDICATORS):
+            if STATE_CODES[name] == state:
+                return FIRST_INDICATOR_COLUMN + position
+        return None
+
+    def sheet_reloaded(self):
+        """Kağıdın tamamı değiştiğinde tek bir güncelleme yayınla"""
+        if len(self.sheet):
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(len(self.sheet) - 1, COLUMN_COUNT - 1))
+        self.sheet_changed.emit()
+
+    def activate(self, index):
+        """Tıklanan hücreye göre şık seçimi veya durum işaretleme yap"""
+        if not index.isValid():
+            return
+        column = index.column()
+        if FIRST_OPTION_COLUMN <= column < FIRST_INDICATOR_COLUMN:
+            self.select_option(index.row(), OPTIONS[column - FIRST_OPTION_COLUMN])
+        elif column >= FIRST_INDICATOR_COLUMN:
+            self.mark_state(index.row(), INDICATORS[column - FIRST_INDICATOR_COLUMN][0])
+
+    def select_option(self, row, option):
+        old_selected, old_state = int(self.sheet.selected[row]), int(self.sheet.states[row])
+        if self.sheet.select_option(row, option):
+            self.cells_changed(row, old_selected, old_state)
+            self.question_changed.emit(row)
+            self.sheet_changed.emit()
+
+    def mark_state(self, row, state):
+        old_selected, old_state = int(self.sheet.selected[row]), int(self.sheet.states[row])
+        if self.sheet.mark_state(row, state):
+            self.cells_changed(row, old_selected, old_state)
+            self.question_changed.emit(row)
+            self.sheet_changed.emit()
+
+    def set_question_count(self, count):
+        """Soru sayısını değiştir; var olan soruların durumu korunur"""
+        current = len(self.sheet)
+        if count > current:
+            self.beginInsertRows(QModelIndex(), current, count - 1)
+            self.sheet.resize(count)
+            self.endInsertRows()
+        elif count < current:
+            self.beginRemoveRows(QModelIndex(), count, current - 1)
+            self.sheet.resize(count)
+            self.endRemoveRows()
+        else:
+            return
+        self.sheet_changed.emit()
+
+    def grade(self, key):
+        """Cevap anahtarına göre tüm soruları işaretle; tek dataChanged ve tek sheet_changed yayınlanır"""
+        graded = self.sheet.grade(key)
+        self.sheet_reloaded()
+        return graded
+
+    def lock_options(self):
+        self.sheet.lock()
+
+    def reset(self, keep_locked=False):
+        """Tüm soruları tek bir güncelleme ile sıfırla"""
+        self.sheet.reset(keep_locked)
+        self.sheet_reloaded()
+
+
+class AnswerSheetDelegate(QStyledItemDelegate):
+    """Şıkları ve göstergeleri widget oluşturmadan doğrudan çizer"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.number_font = QFont()
+        self.number_font.setBold(True)
+        self.indicator_font = QFont()
+        self.indicator_font.setBold(True)
+        self.indicator_font.setPixelSize(14)
+
+    def sizeHint(self, option, index):
+        kind = index.data(KindRole)
+        if kind == "number":
+            return QSize(35, 36)
+        if kind == "option":
+            return QSize(36, 36)
+        return QSize(30, 36)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Satır arka planı (Question widget'ı ile aynı açık gri)
+        rect = option.rect.adjusted(0, 2, 0, -2)
+        painter.fillRect(rect, QColor("#f5f5f5"))
+
+        kind = index.data(KindRole)
+        text = index.data(Qt.DisplayRole)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        if kind == "number":
+            painter.setFont(self.number_font)
+            painter.setPen(QColor("#333"))
+            painter.drawText(rect, Qt.AlignCenter, text)
+        elif kind == "option":
+            self.paint_option(painter, rect, text, index.data(SelectedRole),
+                              index.data(StateRole), hovered)
+        else:
+            self.paint_indicator(painter, rect, text, kind, index.data(SelectedRole), hovered)
+
+        painter.restore()
+
+    def paint_option(self, painter, rect, text, selected, state, hovered):
+        # Balonlar OptionButton ile aynı önbellekten gelir; çizim yalnızca kopyalamadır
+        size = min(rect.width(), rect.height(), 30)
+        if selected:
+            kind = state
+        else:
+            kind = "hover" if hovered else "normal"
+        pixmap = bubble_pixmap(kind, text, size, painter.device().devicePixelRatioF())
+        painter.drawPixmap(rect.center().x() - size // 2 + 1, rect.center().y() - size // 2 + 1, pixmap)
+
+    def paint_indicator(self, painter, rect, text, kind, active, hovered):
+        size = min(rect.width(), rect.height(), 25) - 1
+        box = QRectF(rect.center().x() - size / 2 + 0.5, rect.center().y() - size / 2 + 0.5, size, size)
+
+        if active:
+            fill = INDICATOR_COLORS[kind]
+            text_color = QColor("white")
+        elif hovered:
+            fill = INDICATOR_HOVER_COLORS[kind]
+            text_color = QColor("white")
+        else:
+            fill = QColor("#e0e0e0")
+            text_color = QColor("#333")
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(fill)
+        painter.drawRoundedRect(box, size / 2, size / 2)
+        painter.setFont(self.indicator_font)
+        painter.setPen(text_color)
+        painter.drawText(box, Qt.AlignCenter, text)
+
+
+class AnswerSheetView(QTableView):
+    """Soru sayısından bağımsız, sabit sayıda widget ile cevap kağıdı görünümü"""
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(AnswerSheetDelegate(self))
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        # Seçim/düzenleme yok; hücreler buton gibi davranır
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setShowGrid(False)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WA_Hover, True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+
+        # Tüm satırlar aynı yükseklikte; Qt satır boylarını ölçmek zorunda kalmaz
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(40)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.horizontalHeader().setMinimumSectionSize(25)
+
+        self.setStyleSheet("""
+            QTableView {
+                border: none;
+                background-color: transparent;
+            }
+            QScrollBar:vertical {
+                background: #f0f0f0;
+                width: 8px;
+                margin: 0px;
+            }
+            QScrollBar::handle:vertical {
+                background: #c0c0c0;
+                min-height: 20px;
+                border-radius: 4px;
+            }
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                height: 0px;
+            }
+        """)
+
+        self.clicked.connect(model.activate)
@@ -0,0 +1,134 @@
+import os
+import json
+import threading
+
+import numpy as np
+
+from result_files import RESULTS_DIR, sync_directory
+from sheet_codes import OPTIONS, NO_OPTION, OPTION_CODES
+
+# Cevap anahtarları sınav başlığına göre tek bir dosyada tutulur. Anahtar,
+# soru başına bir harftir ("ABCDE..."); iptal edilen veya anahtarı olmayan
+# sorular "-" ile yazılır. Dosya alt klasörde olduğu için sonuç taramalarına
+# karışmaz.
+ANSWER_KEYS_PATH = os.path.join(RESULTS_DIR, "keys", "answer_keys.json")
+
+NO_KEY = "-"
+# Anahtar girilirken boşluk, virgül ve soru numaraları yok sayılır
+SEPARATORS = " \t\r\n,;:.)0123456789"
+BLANK_MARKS = "-_*?X"
+
+
+def normalize_title(title):
+    return " ".join(title.split())
+
+
+def parse_key(text):
+    """Girilen metni "AB-DE..." biçimine çevir; geçersiz karakterde ValueError"""
+    key = []
+    for char in text.upper():
+        if char in SEPARATORS:
+            continue
+        if char in OPTIONS:
+            key.append(char)
+        elif char in BLANK_MARKS:
+            key.append(NO_KEY)
+        else:
+            raise ValueError(f"Geçersiz anahtar karakteri: {char!r}")
+    return "".join(key)
+
+
+def format_key(key, group=5):
+    """Anahtarı okunabilir gruplar halinde yaz ("ABCDE ABCDE ...")"""
+    return " ".join(key[i:i + group] for i in range(0, len(key), group))
+
+
+# Harf -> şık kodu tablosu; anahtar tek seferde kod dizisine çevrilir
+_KEY_TABLE = np.zeros(256, dtype=np.uint8)
+for _option, _code in OPTION_CODES.items():
+    _KEY_TABLE[ord(_option)] = _code
+_KEY_TABLE[ord(NO_KEY)] = NO_OPTION
+
+
+def key_codes(key):
+    """Anahtarı soru başına şık kodu dizisine çevir (0 = anahtar yok)"""
+    return _KEY_TABLE[np.frombuffer(key.encode('ascii'), dtype=np.uint8)]
+
+
+def codes_to_key(codes):
+    """Şık kodu dizisinden anahtar metni oluştur (ör. seçili şıklardan anahtar)"""
+    letters = np.frombuffer((NO_KEY + "".join(OPTIONS)).encode('ascii'), dtype=np.uint8)
+    return letters[np.asarray(codes, dtype=np.uint8)].tobytes().decode('ascii')
+
+
+class AnswerKeyStore:
+    """Sınav başlığına göre cevap anahtarları; her değişiklik dosyaya atomik yazılır"""
+
+    def __init__(self, path=ANSWER_KEYS_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.keys = None
+
+    def _load(self):
+        if self.keys is not None:
+            return self.keys
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                keys = json.load(f)
+            if not isinstance(keys, dict):
+                raise ValueError("anahtar dosyası bir sözlük değil")
+        except FileNotFoundError:
+            keys = {}
+        except (OSError, ValueError) as e:
+            print(f"Cevap anahtarları okunamadı: {e}")
+            keys = {}
+        self.keys = keys
+        return keys
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        data = json.dumps(self.keys, ensure_ascii=False, indent=1, sort_keys=True).encode('utf-8')
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        sync_directory(directory or ".")
+
+    def get(self, title):
+        """Sınavın anahtarı; yoksa None"""
+        with self.lock:
+            return self._load().get(normalize_title(title))
+
+    def set(self, title, key):
+        with self.lock:
+            self._load()[normalize_title(title)] = key
+            self._save()
+
+    def remove(self, title):
+        with self.lock:
+            if self._load().pop(normalize_title(title), None) is not None:
+                self._save()
+
+    def titles(self):
+        with self.lock:
+            return sorted(self._load())
+
+
+_shared_store = None
+
+
+def shared_answer_keys():
+    """Uygulama genelinde kullanılan anahtar deposu"""
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = AnswerKeyStore()
+    return _shared_store
@@ -0,0 +1,189 @@
+import numpy as np
+
+from sheet_codes import (OPTIONS, UNMARKED, CORRECT, WRONG, EMPTY, STATE_NAMES, STATE_CODES,
+                         NO_OPTION, OPTION_CODES)
+
+
+class AnswerSheet:
+    """Cevap kağıdının durumu; sayaçlar her geçişte O(1) güncellenir"""
+
+    def __init__(self, question_count=20):
+        self.states = np.zeros(question_count, dtype=np.uint8)
+        self.selected = np.zeros(question_count, dtype=np.uint8)
+        self.is_correct = np.zeros(question_count, dtype=bool)
+        self.was_empty = np.zeros(question_count, dtype=bool)
+        self.is_locked = False
+
+        # Duruma göre soru sayıları ve işaretlenmemiş + şıkkı seçilmemiş sorular
+        self.state_counts = [question_count, 0, 0, 0]
+        self.blank_count = question_count
+
+    def __len__(self):
+        return len(self.states)
+
+    @property
+    def correct_count(self):
+        return self.state_counts[CORRECT]
+
+    @property
+    def wrong_count(self):
+        return self.state_counts[WRONG]
+
+    @property
+    def empty_count(self):
+        """Boş işaretlenenler ile hiç dokunulmamış sorular"""
+        return self.state_counts[EMPTY] + self.blank_count
+
+    def state(self, index):
+        return STATE_NAMES[self.states[index]]
+
+    def selected_option(self, index):
+        code = self.selected[index]
+        return OPTIONS[code - 1] if code else None
+
+    def _update(self, index, state, selected):
+        """Tek sorunun durumunu değiştir ve sayaçları düzelt"""
+        old_state = int(self.states[index])
+        old_selected = int(self.selected[index])
+
+        self.state_counts[old_state] -= 1
+        self.state_counts[state] += 1
+        if old_state == UNMARKED and old_selected == NO_OPTION:
+            self.blank_count -= 1
+        if state == UNMARKED and selected == NO_OPTION:
+            self.blank_count += 1
+
+        self.states[index] = state
+        self.selected[index] = selected
+
+    def select_option(self, index, option):
+        """Şık seçimi; durum değiştiyse True döner"""
+        state = int(self.states[index])
+
+        # Eğer kilitliyse ve boş değilse şık seçimi devre dışı
+        if self.is_locked and state != EMPTY:
+            return False
+
+        # Eğer doğru veya yanlış işaretlendiyse değiştirme
+        if state == CORRECT or state == WRONG:
+            return False
+
+        # Aynı şık tekrar tıklanırsa seçimi kaldır, değilse yeni şıkkı seç
+        code = OPTION_CODES[option]
+        if self.selected[index] == code:
+            code = NO_OPTION
+        self._update(index, state, code)
+        return True
+
+    def mark_state(self, index, state_name):
+        """Durum işaretleme; aynı duruma tekrar tıklanırsa işaret kaldırılır"""
+        state = STATE_CODES[state_name]
+        selected = int(self.selected[index])
+
+        if self.states[index] == state:
+            self._update(index, UNMARKED, selected)
+            return True
+
+        self._update(index, state, selected)
+        if state == CORRECT:
+            if selected:
+                self.is_correct[index] = True
+        elif state == WRONG:
+            if selected:
+                self.is_correct[index] = False
+        elif state == EMPTY:
+            self.is_correct[index] = False
+            self.was_empty[index] = True
+        return True
+
+    def lock(self):
+        """Sınavı bitir işlemi - sadece durumu kaydet, değişiklik yapma"""
+        self.is_locked = True
+
+    def reset(self, keep_locked=False):
+        """Tüm soruları sıfırla"""
+        count = len(self.states)
+        self.states[:] = UNMARKED
+        self.selected[:] = NO_OPTION
+        self.is_correct[:] = False
+        self.was_empty[:] = False
+        self.is_locked = keep_locked
+        self.state_counts = [count, 0, 0, 0]
+        self.blank_count = count
+
+    def load_state(self, states, selected, is_correct, was_empty, is_locked=False):
+        """Kaydedilmiş dizilerden durumu yükle ve sayaçları yeniden hesapla"""
+        self.states = np.array(states, dtype=np.uint8)
+        self.selected = np.array(selected, dtype=np.uint8)
+        self.is_correct = np.array(is_correct, dtype=bool)
+        self.was_empty = np.array(was_empty, dtype=bool)
+        self.is_locked = is_locked
+        self.recount()
+
+    def recount(self):
+        """Sayaçları dizilerden yeniden hesapla (toplu değişikliklerden sonra)"""
+        self.state_counts = np.bincount(self.states, minlength=len(STATE_NAMES)).tolist()
+        self.blank_count = int(np.count_nonzero((self.states == UNMARKED) & (self.selected == NO_OPTION)))
+
+    def grade(self, key):
+        """Seçili şıkları cevap anahtarıyla karşılaştırıp tüm soruları tek geçişte işaretle
+
+        key: soru başına doğru şık kodu (0 = anahtar yok). Anahtarı olan
+        sorular doğru, yanlış veya boş olarak işaretlenir; anahtarı olmayan
+        ya da anahtardan sonra kalan soruların durumu değişmez. İşaretlenen
+        soru sayısını döndürür.
+        """
+        count = min(len(key), len(self.states))
+        key = np.asarray(key[:count], dtype=np.uint8)
+        selected = self.selected[:count]
+
+        graded = key != NO_OPTION
+        answered = selected != NO_OPTION
+        matches = answered & (selected == key)
+        states = np.where(matches, CORRECT, np.where(answered, WRONG, EMPTY)).astype(np.uint8)
+
+        self.states[:count] = np.where(graded, states, self.states[:count])
+        self.is_correct[:count] = np.where(graded, matches, self.is_correct[:count])
+        self.was_empty[:count] |= graded & ~answered
+        self.recount()
+        return int(np.count_nonzero(graded))
+
+    def resize(self, question_count):
+        """Soru sayısını değiştir; var olan soruların durumu korunur"""
+        current = len(self.states)
+        if question_count < current:
+            # Kesilen soruların sayaçlara katkısını çıkar
+            for code in range(len(STATE_NAMES)):
+                self.state_counts[code] -= int(np.count_nonzero(self.states[question_count:] == code))
+            self.blank_count -= int(np.count_nonzero((self.states[question_count:] == UNMARKED) &
+                                                     (self.selected[question_count:] == NO_OPTION)))
+        elif question_count > current:
+            added = question_count - current
+            self.state_counts[UNMARKED] += added
+            self.blank_count += added
+
+        self.states = np.resize(self.states, question_count)
+        self.selected = np.resize(self.selected, question_count)
+        self.is_correct = np.resize(self.is_correct, question_count)
+        self.was_empty = np.resize(self.was_empty, question_count)
+        if question_count > current:
+            self.states[current:] = UNMARKED
+            self.selected[current:] = NO_OPTION
+            self.is_correct[current:] = False
+            self.was_empty[current:] = False
+
+    def to_questions_data(self):
+        """Kayıt dosyasındaki 'questions' listesini oluştur"""
+        options = [None] + OPTIONS
+        return [
+            {
+                "number": i + 1,
+                "selected_option": options[selected],
+                "state": STATE_NAMES[state],
+                "is_correct": is_correct,
+                "was_empty": was_empty
+            }
+            for i, (state, selected, is_correct, was_empty) in enumerate(zip(
+                self.states.tolist(), self.selected.tolist(),
+                self.is_correct.tolist(), self.was_empty.tolist()))
+        ]
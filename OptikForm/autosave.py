@@ -0,0 +1,163 @@
+import os
+import json
+import struct
+import zlib
+
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer
+
+from result_files import RESULTS_DIR, sync_directory
+
+# Devam eden sınavın otomatik kayıt günlüğü (write-ahead journal):
+#
+#   çerçeve : tür (B), uzunluk (I), crc32 (I), veri
+#   SNAPSHOT: meta uzunluğu (I) + meta JSON + durum, şık, is_correct, was_empty dizileri
+#   DELTA   : değişen her soru için soru no (I), durum, şık, is_correct, was_empty (4 x B)
+#
+# Dosya her zaman bir SNAPSHOT ile başlar, ardından DELTA çerçeveleri eklenir.
+# Yarım yazılmış son çerçeve okunurken yok sayılır. Günlük çok uzayınca yeni
+# bir SNAPSHOT ile baştan yazılır.
+AUTOSAVE_PATH = os.path.join(RESULTS_DIR, "autosave", "sheet.journal")
+
+FRAME = struct.Struct("<BII")
+META_LENGTH = struct.Struct("<I")
+DELTA = struct.Struct("<IBBBB")
+
+SNAPSHOT = 1
+DELTA_FRAME = 2
+
+
+def make_frame(kind, payload):
+    return FRAME.pack(kind, len(payload), zlib.crc32(payload)) + payload
+
+
+def encode_snapshot(meta, sheet):
+    meta = json.dumps(meta).encode('utf-8')
+    return make_frame(SNAPSHOT, b"".join([
+        META_LENGTH.pack(len(meta)), meta,
+        sheet.states.tobytes(), sheet.selected.tobytes(),
+        sheet.is_correct.astype(np.uint8).tobytes(), sheet.was_empty.astype(np.uint8).tobytes(),
+    ]))
+
+
+def encode_delta(sheet, rows):
+    return make_frame(DELTA_FRAME, b"".join(
+        DELTA.pack(row, int(sheet.states[row]), int(sheet.selected[row]),
+                   int(sheet.is_correct[row]), int(sheet.was_empty[row]))
+        for row in rows))
+
+
+def write_journal(path, data, replace):
+    """Günlüğe yaz: replace ise dosyayı atomik olarak değiştir, değilse sona ekle"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    if replace:
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        sync_directory(directory or ".")
+    else:
+        with open(path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def read_journal(path=AUTOSAVE_PATH):
+    """Günlüğü oku; (meta, durum, şık, is_correct, was_empty) veya None döndür"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    result = None
+    offset = 0
+    while offset + FRAME.size <= len(data):
+        kind, length, checksum = FRAME.unpack_from(data, offset)
+        payload = data[offset + FRAME.size:offset + FRAME.size + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            break
+        offset += FRAME.size + length
+
+        if kind == SNAPSHOT:
+            (meta_length,) = META_LENGTH.unpack_from(payload, 0)
+            start = META_LENGTH.size + meta_length
+            meta = json.loads(payload[META_LENGTH.size:start].decode('utf-8'))
+            count = meta["question_count"]
+            arrays = np.frombuffer(payload, dtype=np.uint8, count=4 * count, offset=start).reshape(4, count).copy()
+            result = (meta, arrays[0], arrays[1], arrays[2].astype(bool), arrays[3].astype(bool))
+        elif kind == DELTA_FRAME and result is not None:
+            meta, states, selected, is_correct, was_empty = result
+            for row, state, option, correct, empty in DELTA.iter_unpack(payload):
+                if row < len(states):
+                    states[row] = state
+                    selected[row] = option
+                    is_correct[row] = correct
+                    was_empty[row] = empty
+    return result
+
+
+class AutosaveJournal(QObject):
+    """Cevap kağıdındaki değişiklikleri gecikmeli ve birleştirilmiş olarak günlüğe yazar
+
+    Değişen sorular bellekte toplanır; ilk değişiklikten FLUSH_DELAY_MS
+    sonra hepsi tek çerçevede yazılır. Böylece hızlı tıklamalarda saniyede
+    en fazla birkaç fsync yapılır. Disk işleri arka plandaki yazıcıda sırayla
+    çalışır.
+    """
+
+    FLUSH_DELAY_MS = 250
+    # Bu kadar DELTA çerçevesinden sonra günlük yeni bir SNAPSHOT ile yeniden yazılır
+    CHECKPOINT_FRAMES = 200
+
+    def __init__(self, sheet, meta, writer, path=AUTOSAVE_PATH, parent=None):
+        super().__init__(parent)
+        self.sheet = sheet
+        # Sınav bilgilerini (başlık, oran, bitti mi...) döndüren fonksiyon
+        self.meta = meta
+        self.writer = writer
+        self.path = path
+
+        self.pending_rows = set()
+        self.checkpoint_pending = True
+        self.frames_since_checkpoint = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.FLUSH_DELAY_MS)
+        self.timer.timeout.connect(self.flush)
+
+    def question_changed(self, row):
+        self.pending_rows.add(row)
+        self.schedule()
+
+    def session_changed(self):
+        """Soru sayısı, başlık veya sınav durumu gibi değişikliklerde tam kopya yazılır"""
+        self.checkpoint_pending = True
+        self.pending_rows.clear()
+        self.schedule()
+
+    def schedule(self):
+        # Zamanlayıcı yeniden başlatılmaz; ilk değişiklikten en geç bir gecikme sonra yazılır
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Bekleyen değişiklikleri yazıcı kuyruğuna ver"""
+        self.timer.stop()
+        if self.checkpoint_pending or self.frames_since_checkpoint >= self.CHECKPOINT_FRAMES:
+            data = encode_snapshot(self.meta(), self.sheet)
+            self.writer.submit(write_journal, self.path, data, True)
+            self.checkpoint_pending = False
+            self.frames_since_checkpoint = 0
+        elif self.pending_rows:
+            rows = sorted(row for row in self.pending_rows if row < len(self.sheet))
+            self.writer.submit(write_journal, self.path, encode_delta(self.sheet, rows), False)
+            self.frames_since_checkpoint += 1
+        self.pending_rows.clear()
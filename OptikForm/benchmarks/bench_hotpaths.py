@@ -0,0 +1,381 @@
+"""Sık kullanılan yolların ölçümü (ekran gerekmez)
+
+    python benchmarks/bench_hotpaths.py [--questions 20,100,500,2000]
+                                        [--history 1000,10000,100000]
+                                        [--clicks 500] [--max-click-ratio 3]
+                                        [--output bench_hotpaths.json]
+
+Ölçülenler: TestTab kurulumu, tıklama başına gecikme (select_option /
+mark_state + calculate_and_show_results), reset_test, anahtara göre
+puanlama, geçmiş panelinin sentetik kayıtlarla yüklenmesi ve detay
+penceresinin açılması. Sonuçlar
+sürümler arasında karşılaştırılabilmesi için JSON olarak yazılır. Tüm
+dosyalar geçici bir klasörde oluşturulur; gerçek test_results'a dokunulmaz.
+
+İki görünüm de ölçüldüğünde tablo görünümünün tıklama gecikmesi widget
+görünümüyle karşılaştırılır; oran --max-click-ratio değerini aşarsa betik
+1 ile çıkar (tıklamada gereksiz yeniden çizim gibi gerilemeler için).
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+import platform
+import statistics
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEventLoop, QT_VERSION_STR, PYQT_VERSION_STR
+
+import answer_keys
+import results_index
+from main import TestTab
+from history_tab import HistoryTab
+from detail_window import TestDetailWindow
+from record_cache import shared_cache
+from result_files import RESULTS_DIR, load_record, scan_result_files
+from autosave import AUTOSAVE_PATH
+from generate_results import generate_results
+from sheet_codes import OPTIONS
+from theme import apply_theme
+
+RESULTS = []
+
+
+def record(name, params, unit, samples):
+    """Bir ölçümü sonuç listesine ekle ve ekrana yaz"""
+    samples = sorted(samples)
+    result = {
+        "name": name,
+        "params": params,
+        "unit": unit,
+        "rounds": len(samples),
+        "mean": round(statistics.fmean(samples), 4),
+        "median": round(statistics.median(samples), 4),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min": round(samples[0], 4),
+    }
+    RESULTS.append(result)
+    label = name + " " + " ".join(f"{key}={value}" for key, value in params.items())
+    print(f"{label:<52} {result['median']:12.3f} {unit} (p95 {result['p95']:.3f})")
+    return result
+
+
+def discard_journal(tab=None):
+    """Ölçümler arasında otomatik kayıt günlüğünü temizle (bir sonraki sekme geri yüklemesin)"""
+    if tab is not None:
+        tab.journal.timer.stop()
+        tab.writer.flush()
+    if os.path.exists(AUTOSAVE_PATH):
+        os.remove(AUTOSAVE_PATH)
+
+
+def bench_test_tab(app, engine, question_count, rounds):
+    construct, shown = [], []
+    for _ in range(rounds):
+        discard_journal()
+        start = time.perf_counter()
+        tab = TestTab(engine=engine, question_count=question_count)
+        middle = time.perf_counter()
+        tab.resize(900, 700)
+        tab.show()
+        app.processEvents()
+        end = time.perf_counter()
+        construct.append((middle - start) * 1e3)
+        shown.append((end - start) * 1e3)
+        discard_journal(tab)
+        tab.close()
+        tab.deleteLater()
+        app.processEvents()
+
+    params = {"engine": engine, "questions": question_count}
+    record("test_tab.construct", params, "ms", construct)
+    record("test_tab.construct_and_show", params, "ms", shown)
+
+
+def bench_clicks(app, engine, question_count, clicks):
+    discard_journal()
+    tab = TestTab(engine=engine, question_count=question_count)
+    tab.resize(900, 700)
+    tab.show()
+    app.processEvents()
+
+    if engine == "grid":
+        select_option = lambda option: tab.answer_model.select_option(0, option)
+        mark_state = lambda state: tab.answer_model.mark_state(0, state)
+    else:
+        question = tab.scroll_area.pool[0]
+        select_option = question.select_option
+        mark_state = question.mark_state
+
+    def measure(click, values):
+        # Isınma
+        for i in range(20):
+            click(values[i % len(values)])
+        app.processEvents()
+
+        samples = []
+        for i in range(clicks):
+            start = time.perf_counter()
+            click(values[i % len(values)])
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1e6)
+        return samples
+
+    params = {"engine": engine, "questions": question_count}
+    medians = {}
+    medians["select_option"] = record("click.select_option", params, "us",
+                                      measure(select_option, OPTIONS))["median"]
+
+    # Sınav bittikten sonra her işaretleme sonuçları yeniden hesaplar
+    tab.finish_test()
+    medians["mark_state"] = record("click.mark_state", params, "us",
+                                   measure(mark_state, ["correct", "wrong", "empty"]))["median"]
+
+    discard_journal(tab)
+    tab.close()
+    tab.deleteLater()
+    app.processEvents()
+    return medians
+
+
+def compare_clicks(clicks, max_ratio):
+    """Tablo görünümünün tıklama gecikmesini widget görünümüyle karşılaştır; aşılan oranları döndür
+
+    clicks: {(görünüm, soru sayısı): {tıklama türü: medyan us}}
+    """
+    exceeded = []
+    for (engine, question_count), medians in sorted(clicks.items()):
+        baseline = clicks.get(("widgets", question_count))
+        if engine != "grid" or baseline is None:
+            continue
+        for name, median in medians.items():
+            ratio = median / baseline[name]
+            RESULTS.append({
+                "name": f"click.{name}.grid_vs_widgets",
+                "params": {"questions": question_count},
+                "unit": "x",
+                "ratio": round(ratio, 3),
+                "max_ratio": max_ratio,
+            })
+            label = f"click.{name}.grid_vs_widgets questions={question_count}"
+            print(f"{label:<52} {ratio:12.2f} x")
+            if ratio > max_ratio:
+                exceeded.append(f"{label}: {ratio:.1f}x > {max_ratio}x")
+    return exceeded
+
+
+def bench_reset(app, engine, question_count, rounds):
+    discard_journal()
+    tab = TestTab(engine=engine, question_count=question_count)
+    tab.resize(900, 700)
+    tab.show()
+    app.processEvents()
+
+    rng = random.Random(question_count)
+    samples = []
+    for _ in range(rounds):
+        for row in range(question_count):
+            tab.answer_model.select_option(row, rng.choice(OPTIONS))
+        tab.finish_test()
+        app.processEvents()
+
+        start = time.perf_counter()
+        tab.reset_test()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1e3)
+
+    record("test_tab.reset_test", {"engine": engine, "questions": question_count}, "ms", samples)
+    discard_journal(tab)
+    tab.close()
+    tab.deleteLater()
+    app.processEvents()
+
+
+def bench_grade(app, engine, question_count, rounds):
+    """Anahtara göre puanlama: karşılaştırma, tek toplu güncelleme ve sonuç hesabı"""
+    discard_journal()
+    tab = TestTab(engine=engine, question_count=question_count)
+    tab.resize(900, 700)
+    tab.show()
+    app.processEvents()
+
+    rng = random.Random(question_count)
+    store = answer_keys.AnswerKeyStore(os.path.join(RESULTS_DIR, "keys", f"bench_{question_count}.json"))
+    store.set(tab.title_input.text(), "".join(rng.choice(OPTIONS) for _ in range(question_count)))
+    answer_keys._shared_store = store
+
+    samples = []
+    for _ in range(rounds):
+        tab.reset_test()
+        for row in range(question_count):
+            tab.answer_model.select_option(row, rng.choice(OPTIONS))
+        app.processEvents()
+
+        start = time.perf_counter()
+        tab.grade_with_key()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1e3)
+
+    record("test_tab.grade_with_key", {"engine": engine, "questions": question_count}, "ms", samples)
+    answer_keys._shared_store = None
+    discard_journal(tab)
+    tab.close()
+    tab.deleteLater()
+    app.processEvents()
+
+
+def wait_for_history(app, tab):
+    """Tarama bitene kadar olayları işle; ilk satırların geldiği anı da döndür"""
+    first_rows = None
+    while tab.loader is not None:
+        app.processEvents(QEventLoop.AllEvents | QEventLoop.WaitForMoreEvents)
+        if first_rows is None and tab.history_model.rowCount() > 0:
+            first_rows = time.perf_counter()
+    return first_rows
+
+
+def bench_history(app, count, workdir):
+    # Her boyut kendi klasöründe; paylaşılan dizin ve önbellek baştan açılır
+    directory = os.path.join(workdir, f"history_{count}")
+    os.makedirs(directory)
+    os.chdir(directory)
+
+    # Aynı tohumla her çalıştırmada aynı kayıtlar üretilir
+    start = time.perf_counter()
+    generate_results(RESULTS_DIR, count, seed=count)
+    print(f"  {count} sentetik kayıt yazıldı ({time.perf_counter() - start:.1f} s)")
+
+    for phase in ("cold", "warm"):
+        if results_index._shared_index is not None:
+            results_index._shared_index.close()
+            results_index._shared_index = None
+        shared_cache().clear()
+
+        start = time.perf_counter()
+        tab = HistoryTab()
+        constructed = time.perf_counter()
+        tab.resize(400, 700)
+        tab.show()
+        first_rows = wait_for_history(app, tab)
+        end = time.perf_counter()
+
+        params = {"files": count, "phase": phase}
+        record("history.construct", params, "ms", [(constructed - start) * 1e3])
+        if first_rows is not None:
+            record("history.first_rows", params, "ms", [(first_rows - start) * 1e3])
+        record("history.load_complete", params, "ms", [(end - start) * 1e3])
+
+        tab.stop_loading()
+        tab.close()
+        tab.deleteLater()
+        app.processEvents()
+
+    os.chdir(workdir)
+
+
+def bench_detail_window(app, question_count, rounds, workdir):
+    directory = os.path.join(workdir, f"detail_{question_count}")
+    generate_results(directory, 1, seed=question_count, question_counts=(question_count,), workers=1)
+    test_data = load_record(scan_result_files(directory)[0][0])
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        window = TestDetailWindow(test_data)
+        window.show()
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1e3)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+    record("detail_window.open", {"questions": question_count}, "ms", samples)
+
+
+def number_list(text):
+    return [int(value) for value in text.split(",") if value]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaplan Optik Form performans ölçümleri")
+    parser.add_argument("--questions", type=number_list, default=[20, 100, 500, 2000],
+                        help="ölçülecek soru sayıları (virgülle ayrılmış)")
+    parser.add_argument("--history", type=number_list, default=[1000, 10000, 100000],
+                        help="geçmiş paneli için sentetik kayıt sayıları")
+    parser.add_argument("--engines", default="widgets,grid", help="ölçülecek görünümler")
+    parser.add_argument("--clicks", type=int, default=500, help="tıklama ölçümündeki tıklama sayısı")
+    parser.add_argument("--max-click-ratio", type=float, default=3.0,
+                        help="tablo/widget tıklama gecikmesi oranının üst sınırı")
+    parser.add_argument("--rounds", type=int, default=5, help="kurulum/sıfırlama ölçümlerindeki tekrar sayısı")
+    parser.add_argument("--output", default="bench_hotpaths.json", help="JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    engines = [engine for engine in args.engines.split(",") if engine]
+
+    app = QApplication(sys.argv[:1])
+    apply_theme(app)
+
+    with tempfile.TemporaryDirectory(prefix="optikform_bench_") as workdir:
+        os.chdir(workdir)
+
+        clicks = {}
+        for engine in engines:
+            for question_count in args.questions:
+                bench_test_tab(app, engine, question_count, args.rounds)
+                clicks[engine, question_count] = bench_clicks(app, engine, question_count, args.clicks)
+                bench_reset(app, engine, question_count, args.rounds)
+                bench_grade(app, engine, question_count, args.rounds)
+
+        exceeded = compare_clicks(clicks, args.max_click_ratio)
+
+        for question_count in args.questions:
+            bench_detail_window(app, question_count, args.rounds, workdir)
+
+        for count in args.history:
+            bench_history(app, count, workdir)
+
+        if results_index._shared_index is not None:
+            results_index._shared_index.close()
+            results_index._shared_index = None
+
+    report = {
+        "benchmark": "hotpaths",
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "pyqt": PYQT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+        },
+        "settings": {
+            "questions": args.questions,
+            "history": args.history,
+            "engines": engines,
+            "clicks": args.clicks,
+            "max_click_ratio": args.max_click_ratio,
+            "rounds": args.rounds,
+        },
+        "results": RESULTS,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"Sonuçlar yazıldı: {output}")
+
+    if exceeded:
+        print("Tıklama gecikmesi gerilemesi:", file=sys.stderr)
+        for line in exceeded:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Optik okuyucu ölçümü: sayfa/saniye ve okuma doğruluğu (Qt gerekmez)
+
+    python benchmarks/bench_omr.py [--sheets 200] [--questions 160] [--dpi 200]
+                                   [--workers N] [--output bench_omr.json]
+
+Form geometrisinden (form_layout) rastgele işaretli sayfalar çizilir; her
+sayfa hafifçe döndürülüp kaydırılarak, gürültü eklenerek ve JPEG olarak
+kaydedilerek taranmış görüntüye benzetilir. Sayfalar önce tek işlemde,
+sonra işlem havuzuyla okunur; okunan şıklar çizilenlerle karşılaştırılır.
+Tüm dosyalar geçici bir klasörde oluşturulur.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+import platform
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+import omr
+from form_layout import (FormLayout, PAGE_WIDTH, PAGE_HEIGHT, MARK_SIZE, PAGE_CODE_SIZE,
+                         BUBBLE_DIAMETER, OPTION_COUNT, mark_centers, page_code_centers, page_code)
+from sheet_codes import OPTIONS
+
+
+def draw_page(layout, page, selected, dpi, rng):
+    """Sayfayı işaretlenmiş olarak çiz; selected soru başına 0-5"""
+    scale = dpi / 25.4
+    image = Image.new("L", (round(PAGE_WIDTH * scale), round(PAGE_HEIGHT * scale)), 255)
+    draw = ImageDraw.Draw(image)
+
+    def box(x, y, size):
+        half = size / 2
+        return [(x - half) * scale, (y - half) * scale, (x + half) * scale, (y + half) * scale]
+
+    for x, y in mark_centers():
+        draw.rectangle(box(x, y, MARK_SIZE), fill=0)
+    for (x, y), bit in zip(page_code_centers(), page_code(page)):
+        draw.rectangle(box(x, y, PAGE_CODE_SIZE), outline=0, width=2, fill=0 if bit else None)
+
+    for index in layout.page_questions(page):
+        x, y, width, height = layout.number_rect(index)
+        draw.text(((x + 1) * scale, (y + 1) * scale), f"{index + 1}.", fill=0)
+        for option in range(OPTION_COUNT):
+            cx, cy = layout.bubble_center(index, option)
+            draw.ellipse(box(cx, cy, BUBBLE_DIAMETER), outline=60, width=2)
+            draw.text(((cx - 0.8) * scale, (cy - 1.2) * scale), OPTIONS[option], fill=90)
+        if selected[index]:
+            # Kurşun kalem: tam siyah değil, kenarlara tam oturmayan dolgu
+            cx, cy = layout.bubble_center(index, selected[index] - 1)
+            shift = rng.uniform(-0.3, 0.3)
+            draw.ellipse(box(cx + shift, cy - shift, BUBBLE_DIAMETER * rng.uniform(0.8, 1.0)),
+                         fill=rng.randint(20, 80))
+        elif rng.random() < 0.1:
+            # Silinmiş eski işaret: soluk dolgu, okunmamalı
+            cx, cy = layout.bubble_center(index, rng.randrange(OPTION_COUNT))
+            draw.ellipse(box(cx, cy, BUBBLE_DIAMETER * 0.8), fill=215)
+    return image
+
+
+def scan(image, rng, np_rng):
+    """Taranmış görüntüye benzet: döndür, tarayıcı yüzeyine kaydır, gürültü ekle"""
+    image = image.rotate(rng.uniform(-2.0, 2.0), resample=Image.BILINEAR, expand=True, fillcolor=255)
+    border = int(image.width * 0.03)
+    canvas = Image.new("L", (image.width + 2 * border, image.height + 2 * border), 235)
+    canvas.paste(image, (rng.randint(0, 2 * border), rng.randint(0, 2 * border)))
+    pixels = np.asarray(canvas, dtype=np.float32)
+    pixels = pixels * rng.uniform(0.85, 1.0) + np_rng.normal(0.0, 8.0, pixels.shape)
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+
+def make_sheets(directory, count, layout, dpi, seed):
+    """Sayfaları üret; (yol, sayfa, doğru seçimler) listesi döndür"""
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    sheets = []
+    for k in range(count):
+        page = k % layout.pages
+        selected = np.zeros(layout.question_count, dtype=np.uint8)
+        for index in layout.page_questions(page):
+            if rng.random() < 0.9:
+                selected[index] = rng.randint(1, OPTION_COUNT)
+        path = os.path.join(directory, f"sheet_{k:05d}.jpg")
+        scan(draw_page(layout, page, selected, dpi, rng), rng, np_rng).save(path, quality=85)
+        sheets.append((path, page, selected))
+    return sheets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Optik okuyucu performans ölçümü")
+    parser.add_argument("--sheets", type=int, default=200, help="okunacak sayfa sayısı")
+    parser.add_argument("--questions", type=int, default=160, help="formdaki soru sayısı")
+    parser.add_argument("--dpi", type=int, default=200, help="üretilen taramaların çözünürlüğü")
+    parser.add_argument("--workers", type=int, help="işlem sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--seed", type=int, default=0, help="rastgelelik tohumu")
+    parser.add_argument("--output", default="bench_omr.json", help="JSON sonuç dosyası")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output)
+    layout = FormLayout(args.questions)
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="optikform_omr_") as directory:
+        start = time.perf_counter()
+        sheets = make_sheets(directory, args.sheets, layout, args.dpi, args.seed)
+        print(f"{len(sheets)} tarama üretildi ({time.perf_counter() - start:.1f} s)")
+
+        # Tek işlem: sayfa başına süre ve doğruluk
+        wrong = multiple = 0
+        samples = []
+        for path, page, truth in sheets:
+            began = time.perf_counter()
+            result = omr.read_sheet(path, layout)
+            samples.append((time.perf_counter() - began) * 1e3)
+            questions = result["questions"]
+            wrong += int(np.count_nonzero(result["selected"] != truth[questions.start:questions.stop]))
+            multiple += int(np.count_nonzero(result["multiple"]))
+            if result["page"] != page:
+                wrong += len(questions)
+        total_questions = sum(len(layout.page_questions(page)) for _, page, _ in sheets)
+        elapsed = sum(samples) / 1e3
+        samples.sort()
+        results.append({
+            "name": "omr.read_sheet",
+            "params": {"questions": args.questions, "dpi": args.dpi},
+            "sheets": len(sheets),
+            "sheets_per_second": round(len(sheets) / elapsed, 2),
+            "median_ms": round(samples[len(samples) // 2], 3),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            "misread_questions": wrong,
+            "multiple_marks": multiple,
+            "accuracy": round(1 - wrong / total_questions, 6),
+        })
+        print(f"omr.read_sheet            {len(sheets) / elapsed:8.1f} sayfa/s "
+              f"(medyan {samples[len(samples) // 2]:.1f} ms), {wrong}/{total_questions} hatalı soru")
+
+        # İşlem havuzu: klasör modu
+        start = time.perf_counter()
+        failed = sum(1 for *_, error in omr.read_folder([path for path, _, _ in sheets],
+                                                        args.questions, args.workers) if error)
+        elapsed = time.perf_counter() - start
+        workers = args.workers or os.cpu_count()
+        results.append({
+            "name": "omr.read_folder",
+            "params": {"questions": args.questions, "dpi": args.dpi, "workers": workers},
+            "sheets": len(sheets),
+            "sheets_per_second": round(len(sheets) / elapsed, 2),
+            "failed": failed,
+        })
+        print(f"omr.read_folder workers={workers:<3} {len(sheets) / elapsed:8.1f} sayfa/s, {failed} okunamadı")
+
+    report = {
+        "benchmark": "omr",
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pillow": Image.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "settings": vars(args),
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"Sonuçlar yazıldı: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QHBoxLayout, QSizePolicy
+
+from main import Question
+from answer_sheet import AnswerSheet
+from answer_grid import AnswerSheetModel
+from theme import apply_theme
+
+# Eski yöntem: her tıklamada 8 butona satır içi CSS yazılıyordu
+LEGACY_OPTION_STYLE = """
+    QPushButton {
+        border: 1px solid #ccc;
+        border-radius: 15px;
+        padding: 0px;
+        background-color: #f8f9fa;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton:checked {
+        background-color: #4CAF50;
+        color: white;
+        border-color: #388E3C;
+    }
+    QPushButton:hover {
+        background-color: #e9ecef;
+    }
+"""
+
+LEGACY_SELECTED_STYLE = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: 1px solid #ddd;
+        border-radius: 15px;
+        padding: 0px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    QPushButton:checked {
+        background-color: #4CAF50;
+        color: white;
+        border-color: #388E3C;
+    }
+"""
+
+LEGACY_INDICATOR_STYLE = """
+    QPushButton {
+        background-color: #e0e0e0;
+        color: #333;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #4CAF50;
+        color: white;
+    }
+"""
+
+
+class LegacyQuestion(QWidget):
+    """Eski Question satırının kopyası: satır içi CSS'li QPushButton şıklar ve göstergeler
+
+    Bugünkü Question şıkları kendini çizen ve stil sayfası kullanmayan
+    OptionButton'lardır; karşılaştırma anlamlı olsun diye eski satır burada
+    ayrıca kurulur.
+    """
+
+    def __init__(self, question_number):
+        super().__init__()
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(5, 5, 5, 5)
+        layout.setSpacing(3)
+
+        label = QLabel(f"{question_number}.")
+        layout.addWidget(label)
+
+        self.options = {}
+        for option in ['A', 'B', 'C', 'D', 'E']:
+            btn = QPushButton(option)
+            btn.setCheckable(True)
+            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            btn.setMinimumSize(25, 25)
+            btn.setMaximumSize(30, 30)
+            btn.setStyleSheet(LEGACY_OPTION_STYLE)
+            self.options[option] = btn
+            layout.addWidget(btn)
+
+        self.indicators = {}
+        for state, text in [("correct", "✓"), ("wrong", "✗"), ("empty", "○")]:
+            btn = QPushButton(text)
+            btn.setMinimumSize(20, 20)
+            btn.setMaximumSize(25, 25)
+            btn.setStyleSheet(LEGACY_INDICATOR_STYLE)
+            self.indicators[state] = btn
+            layout.addWidget(btn)
+
+        self.setStyleSheet("background-color: #f5f5f5; border-radius: 5px;")
+
+
+def legacy_click(question, option):
+    """Eski select_option/mark_state'in yaptığı yeniden stillendirme"""
+    for opt, btn in question.options.items():
+        btn.setChecked(opt == option)
+        btn.setStyleSheet(LEGACY_SELECTED_STYLE if opt == option else LEGACY_OPTION_STYLE)
+    for btn in question.indicators.values():
+        btn.setStyleSheet(LEGACY_INDICATOR_STYLE)
+
+
+def measure(app, label, click, rounds):
+    options = ['A', 'B', 'C', 'D', 'E']
+    # Isınma
+    for i in range(20):
+        click(options[i % 5])
+    app.processEvents()
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        click(options[i % 5])
+        app.processEvents()
+    elapsed = time.perf_counter() - start
+    per_click = elapsed / rounds * 1e6
+    print(f"{label:<28} {per_click:10.1f} µs/tıklama")
+    return per_click
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    app = QApplication(sys.argv)
+
+    # Eski sürümde uygulama genelinde stil sayfası yoktu; tema yalnızca yeni yol için yüklenir
+    legacy_question = LegacyQuestion(1)
+    legacy_question.show()
+    legacy = measure(app, "satır içi setStyleSheet", lambda opt: legacy_click(legacy_question, opt), rounds)
+    legacy_question.close()
+
+    apply_theme(app)
+    sheet = AnswerSheet(1)
+    model = AnswerSheetModel(sheet)
+
+    question = Question(1)
+    # select_option satırı kendisi yeniler; dataChanged'e ayrıca bağlanmaz ki
+    # iki yol da tıklama başına bir kez yeniden stillendirsin
+    question.bind(model, 0)
+    question.show()
+    themed = measure(app, "tema + özel çizim", lambda opt: question.select_option(opt), rounds)
+
+    print(f"Hızlanma: {legacy / themed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+
+# Şık balonlarının renkleri: (dolgu, kenar, yazı)
+BUBBLE_COLORS = {
+    "normal": (QColor("#f8f9fa"), QColor("#ccc"), QColor("black")),
+    "hover": (QColor("#e9ecef"), QColor("#ccc"), QColor("black")),
+    # Seçili şık; renk sorunun durumuna göre değişir
+    "unmarked": (QColor("#4CAF50"), QColor("#388E3C"), QColor("white")),
+    "correct": (QColor("#4CAF50"), QColor("#388E3C"), QColor("white")),
+    "wrong": (QColor("#f44336"), QColor("#B71C1C"), QColor("white")),
+    "empty": (QColor("#2196F3"), QColor("#1565C0"), QColor("white")),
+}
+
+# (tür, harf, boyut, DPI oranı, karalama rengi) -> önceden çizilmiş QPixmap
+_pixmap_cache = {}
+
+
+def bubble_pixmap(kind, letter, size, device_pixel_ratio=1.0, scribble_color=None):
+    """Balonu bir kez çiz, sonraki çağrılarda önbellekten döndür
+
+    scribble_color verilirse balon o renkle doldurulur (karalama efekti).
+    """
+    color_key = scribble_color.rgba() if scribble_color is not None else None
+    key = (kind, letter, size, device_pixel_ratio, color_key)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is not None:
+        return pixmap
+
+    if scribble_color is not None:
+        fill, border, text_color = scribble_color, scribble_color, QColor("white")
+        border_width = 2
+    else:
+        fill, border, text_color = BUBBLE_COLORS[kind]
+        border_width = 1
+
+    pixels = max(1, int(round(size * device_pixel_ratio)))
+    pixmap = QPixmap(pixels, pixels)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+
+    inset = border_width / 2 + 0.5
+    circle = QRectF(inset, inset, size - 2 * inset, size - 2 * inset)
+    painter.setPen(QPen(border, border_width))
+    painter.setBrush(fill)
+    painter.drawEllipse(circle)
+
+    font = QFont()
+    font.setBold(True)
+    font.setPixelSize(11)
+    painter.setFont(font)
+    painter.setPen(text_color)
+    painter.drawText(circle, Qt.AlignCenter, letter)
+    painter.end()
+
+    _pixmap_cache[key] = pixmap
+    return pixmap
+
+
+def clear_cache():
+    _pixmap_cache.clear()
@@ -0,0 +1,236 @@
+"""Bir sınıfın cevaplarını CSV/TSV dosyasından toplu puanlama (Qt gerektirmez)
+
+Her satır bir öğrencidir: öğrenci adı/numarası ve cevap metni ("ABCD-E...",
+cevap anahtarıyla aynı kurallar: boşluklar yok sayılır, boş sorular "-").
+Satırlar sabit boyutlu parçalar halinde okunur ve işlemlere dağıtılır; aynı
+anda en fazla birkaç parça bellekte bulunduğu için dosya boyutundan bağımsız
+olarak bellek kullanımı sabittir. Her parça tek bir (öğrenci x soru)
+matrisinde anahtarla karşılaştırılır; puan TestTab ile aynı kuralla
+hesaplanır ve her öğrenci için test_results biçiminde bir kayıt yazılır.
+"""
+import os
+import csv
+import json
+import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from answer_keys import BLANK_MARKS, SEPARATORS
+from record_format import encode_codes, decode_record, STATE_SHIFT, IS_CORRECT_BIT, WAS_EMPTY_BIT
+from result_files import BINARY_EXTENSION, result_path, save_record, sync_directory
+from scoring import compute_score, count_states
+from sheet_codes import UNMARKED, CORRECT, WRONG, EMPTY, NO_OPTION, OPTION_CODES
+
+CHUNK_ROWS = 2000
+# Bir işlem başına kuyrukta bekleyen en fazla parça sayısı
+CHUNKS_IN_FLIGHT = 2
+
+STUDENT_COLUMNS = ("öğrenci", "ogrenci", "student", "ad", "ad soyad", "isim", "name", "numara", "no", "id")
+ANSWER_COLUMNS = ("cevaplar", "cevap", "yanıtlar", "answers", "answer")
+# grade_rows sonuçlarının alanları (özet CSV'nin başlığı)
+RESULT_FIELDS = ("line", "student", "title", "score", "correct", "wrong", "empty", "path", "error")
+
+# Cevap metni baytlarını şık kodlarına çeviren tablo; tanınmayan karakterler INVALID olur
+INVALID = 255
+_ANSWER_TABLE = bytearray([INVALID]) * 256
+for _option, _code in OPTION_CODES.items():
+    _ANSWER_TABLE[ord(_option)] = _code
+    _ANSWER_TABLE[ord(_option.lower())] = _code
+for _mark in BLANK_MARKS:
+    _ANSWER_TABLE[ord(_mark)] = NO_OPTION
+    _ANSWER_TABLE[ord(_mark.lower())] = NO_OPTION
+ANSWER_TABLE = bytes(_ANSWER_TABLE)
+ANSWER_SEPARATORS = SEPARATORS.encode('ascii')
+
+
+def answer_codes(answers):
+    """Cevap metnini şık kodu baytlarına çevir; geçersiz karakterde ValueError"""
+    codes = answers.encode('utf-8').translate(ANSWER_TABLE, ANSWER_SEPARATORS)
+    if INVALID in codes:
+        raise ValueError(f"Geçersiz cevap karakteri: {answers!r}")
+    return codes
+
+
+def grade_matrix(selected, key):
+    """(öğrenci x soru) seçim matrisini anahtarla karşılaştır; soru kodlarını döndür
+
+    Sonuç, boş bir kağıtta AnswerSheet.grade ile elde edilen işaretlemeyle
+    aynıdır: anahtarı olan sorular doğru/yanlış/boş, olmayanlar işaretsiz.
+    """
+    graded = key != NO_OPTION
+    answered = selected != NO_OPTION
+    matches = answered & (selected == key)
+    blank = graded & ~answered
+    states = np.where(graded, np.where(matches, CORRECT, np.where(answered, WRONG, EMPTY)),
+                      UNMARKED).astype(np.uint8)
+    codes = (selected | (states << STATE_SHIFT)
+             | np.where(matches, IS_CORRECT_BIT, 0).astype(np.uint8)
+             | np.where(blank, WAS_EMPTY_BIT, 0).astype(np.uint8))
+    return codes, states
+
+
+def record_title(title, student):
+    return f"{title} - {student}" if student else title
+
+
+def grade_chunk(task):
+    """Bir parçadaki öğrencileri puanla ve kayıtlarını yaz
+
+    Kayıtlar save_record ile atomik olarak yazılır; klasör parça sonunda bir
+    kez diske aktarılır. results_dir None ise kayıtlar yazılmaz, sıkıştırılmış
+    veri olarak döndürülür (kayıt günlüğüne ana işlem parça parça ekler). Satır başına
+    (satır no, öğrenci, başlık, puan, doğru, yanlış, boş, yol veya veri,
+    hata) döndürür.
+    """
+    rows, key, title, wrong_ratio, when, results_dir, extension = task
+    key = np.frombuffer(key, dtype=np.uint8)
+    question_count = len(key)
+
+    selected = np.zeros((len(rows), question_count), dtype=np.uint8)
+    errors = {}
+    for i, (line, student, answers) in enumerate(rows):
+        try:
+            codes = answer_codes(answers)
+        except ValueError as e:
+            errors[i] = str(e)
+            continue
+        if len(codes) > question_count:
+            errors[i] = f"{len(codes)} cevap var, anahtar {question_count} soru"
+            continue
+        selected[i, :len(codes)] = np.frombuffer(codes, dtype=np.uint8)
+
+    codes, states = grade_matrix(selected, key)
+    correct, wrong, empty, _ = (values.tolist() for values in count_states(states, selected))
+    date = when.strftime("%Y-%m-%d %H:%M")
+
+    results = []
+    for i, (line, student, answers) in enumerate(rows):
+        if i in errors:
+            results.append((line, student, None, None, None, None, None, None, errors[i]))
+            continue
+        name = record_title(title, student)
+        score = compute_score(correct[i], wrong[i], question_count, wrong_ratio)
+        data = encode_codes(name, date, score, wrong_ratio, correct[i], wrong[i], empty[i],
+                            codes[i].tobytes())
+        if results_dir is None:
+            target = data
+        else:
+            # Öğrenci adı result_path'te dosya adına güvenli hale getirilir (alt klasör oluşmaz);
+            # aynı adlı öğrenciler çakışmasın diye satır numarası eklenir
+            stem, _ = os.path.splitext(result_path(name, when, results_dir))
+            target = f"{stem}_{line}{extension}"
+            if extension != BINARY_EXTENSION:
+                data = json.dumps(decode_record(data)).encode('utf-8')
+            save_record(target, data, sync=False)
+        results.append((line, student, name, score, correct[i], wrong[i], empty[i], target, None))
+    if results_dir is not None and len(errors) < len(rows):
+        sync_directory(results_dir)
+    return results
+
+
+def detect_delimiter(path, first_line):
+    if path.lower().endswith(".tsv") or "\t" in first_line:
+        return "\t"
+    if first_line.count(";") > first_line.count(","):
+        return ";"
+    return ","
+
+
+def column_index(folded, wanted, names, default):
+    """Sütunu başlık adından veya 1'den başlayan numarasından bul"""
+    if wanted is not None:
+        if wanted.isdigit():
+            return int(wanted) - 1
+        if wanted.casefold() in folded:
+            return folded.index(wanted.casefold())
+        raise ValueError(f"Sütun bulunamadı: {wanted}")
+    for name in names:
+        if name in folded:
+            return folded.index(name)
+    return default
+
+
+def read_rows(path, student_column=None, answers_column=None, delimiter=None):
+    """Dosyayı satır satır oku; (satır no, öğrenci, cevaplar) üretir
+
+    İlk satır bilinen bir sütun adı içeriyorsa başlık kabul edilir. Sütunlar
+    verilmezse öğrenci ilk, cevaplar son sütundur.
+    """
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        first_line = f.readline()
+        f.seek(0)
+        reader = csv.reader(f, delimiter=delimiter or detect_delimiter(path, first_line))
+
+        header = next(reader, None)
+        if header is None:
+            return
+        folded = [cell.strip().casefold() for cell in header]
+        has_header = any(cell in STUDENT_COLUMNS or cell in ANSWER_COLUMNS for cell in folded) or \
+            any(wanted and not wanted.isdigit() for wanted in (student_column, answers_column))
+        student = column_index(folded, student_column, STUDENT_COLUMNS if has_header else (), 0)
+        answers = column_index(folded, answers_column, ANSWER_COLUMNS if has_header else (), len(header) - 1)
+
+        rows = reader if has_header else _prepend(header, reader)
+        for row in rows:
+            if not any(cell.strip() for cell in row):
+                continue
+            name = row[student].strip() if student < len(row) and student != answers else ""
+            text = row[answers] if answers < len(row) else ""
+            yield reader.line_num, name, text
+
+
+def _prepend(first, rows):
+    yield first
+    yield from rows
+
+
+def chunked(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def grade_chunks(rows, key, title, wrong_ratio=4, results_dir=None, when=None,
+                 extension=BINARY_EXTENSION, workers=None, chunk_rows=CHUNK_ROWS):
+    """Satırları parçalar halinde puanla; her parçanın sonuç listesini girdi sırasıyla üretir
+
+    Kuyrukta en fazla workers x CHUNKS_IN_FLIGHT parça bulunur; sonuçları
+    tüketilmeyen parça kalmadığı için uzun dosyalarda bellek sabit kalır.
+    """
+    key = bytes(key)
+    when = when or datetime.datetime.now()
+    if results_dir is not None:
+        os.makedirs(results_dir, exist_ok=True)
+    tasks = ((chunk, key, title, wrong_ratio, when, results_dir, extension)
+             for chunk in chunked(rows, chunk_rows))
+
+    if workers == 1:
+        for task in tasks:
+            yield grade_chunk(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        limit = (workers or os.cpu_count() or 1) * CHUNKS_IN_FLIGHT
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(grade_chunk, task))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def grade_rows(rows, key, title, wrong_ratio=4, results_dir=None, when=None,
+               extension=BINARY_EXTENSION, workers=None, chunk_rows=CHUNK_ROWS):
+    """grade_chunks sonuçlarını satır satır üretir"""
+    for results in grade_chunks(rows, key, title, wrong_ratio, results_dir, when, extension,
+                                workers, chunk_rows):
+        yield from results
+
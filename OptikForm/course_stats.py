@@ -0,0 +1,269 @@
+import os
+import re
+import sqlite3
+import datetime
+
+from result_files import RESULTS_DIR, cache_path
+
+STATS_FILENAME = "stats.sqlite3"
+# Önceki sürümlerde dosya doğrudan sonuç klasöründeydi
+LEGACY_STATS_FILENAME = ".stats.sqlite3"
+SCHEMA_VERSION = 1
+
+# Her sınav grubu için toplanabilir toplamlar tutulur (n, Σpuan, Σpuan², Σt, Σt², Σt·puan);
+# t, denemenin gün cinsinden zamanıdır. Ortalama, sapma ve eğilim bu toplamlardan
+# hesaplanır; medyan ve en iyi puan üyeler tablosundaki dizinden okunur.
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS members (
+        key TEXT PRIMARY KEY,
+        course TEXT,
+        exam TEXT,
+        score REAL,
+        day REAL
+    );
+    CREATE INDEX IF NOT EXISTS members_by_group ON members (course, exam, score);
+    CREATE INDEX IF NOT EXISTS members_by_day ON members (course, exam, day);
+    CREATE TABLE IF NOT EXISTS groups (
+        course TEXT,
+        exam TEXT,
+        n INTEGER,
+        sum_score REAL,
+        sum_score_sq REAL,
+        sum_day REAL,
+        sum_day_sq REAL,
+        sum_day_score REAL,
+        last_day REAL,
+        PRIMARY KEY (course, exam)
+    );
+"""
+
+EXAM_TYPES = ("Vize", "Final", "Bütünleme", "Büt", "Mazeret", "Ara Sınav", "Quiz")
+
+# "Ağ Yönetimi ve Bilgi Güvenliği 2018 Bahar Vize", "Ağ Yön. ve Bil. Sis. 2023-2024 Güz Final"
+TITLE_PATTERN = re.compile(r"^(?P<course>.*?)\s+(?P<year>(?:19|20)\d\d(?:\s*[-/]\s*(?:19|20)?\d\d)?)(?:\s+|$)(?P<rest>.*)$")
+
+# Eğilim puan/ay olarak gösterilir
+DAYS_PER_MONTH = 30.0
+# Günler 2000-01-01'den itibaren sayılır; küçük değerler toplamlarda hassasiyeti korur
+DAY_EPOCH = 946684800
+
+
+def split_exam(text):
+    """Metnin sonundaki sınav türünü ayır: (kalan, sınav türü)"""
+    folded = text.casefold()
+    for exam in EXAM_TYPES:
+        if folded == exam.casefold():
+            return "", exam
+        if folded.endswith(" " + exam.casefold()):
+            return text[:-len(exam)].strip(), exam
+    return text, ""
+
+
+def parse_title(title):
+    """Test başlığından (ders, sınav türü) çıkar
+
+    Yıl ve dönem (ör. "2018 Bahar") gruplamaya katılmaz; aynı dersin farklı
+    yıllardaki vizeleri tek grupta toplanır.
+    """
+    title = " ".join(title.split())
+    match = TITLE_PATTERN.match(title)
+    if match and match.group("course"):
+        return match.group("course"), split_exam(match.group("rest"))[1]
+    course, exam = split_exam(title)
+    return course or title, exam
+
+
+def summary_day(summary):
+    """Denemenin zamanı (gün); tarih okunamazsa dosya zamanı kullanılır"""
+    try:
+        stamp = datetime.datetime.strptime(summary.get("date") or "", "%Y-%m-%d %H:%M").timestamp()
+    except ValueError:
+        stamp = summary.get("mtime") or 0.0
+    return (stamp - DAY_EPOCH) / 86400.0
+
+
+class CourseStats:
+    """Ders ve sınav türüne göre gruplanmış, artımlı güncellenen puan istatistikleri
+
+    Kayıt eklenince veya silinince yalnızca ilgili grubun toplamları
+    güncellenir; tüm kayıtlar yeniden okunmaz. Toplamlar sonuç klasörünün
+    .cache alt klasöründeki ayrı bir SQLite dosyasında saklanır.
+    """
+
+    def __init__(self, results_dir=RESULTS_DIR, db_path=None):
+        self.results_dir = results_dir
+        self.db_path = db_path or cache_path(results_dir, STATS_FILENAME, LEGACY_STATS_FILENAME)
+        self.connection = self.open_database()
+
+    def open_database(self):
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            connection = self.connect(self.db_path)
+        except (OSError, sqlite3.DatabaseError) as e:
+            # Bozuk dosya yeniden oluşturulur; o da olmazsa bellekte tutulur
+            print(f"İstatistik dosyası açılamadı, yeniden oluşturuluyor: {e}")
+            try:
+                if os.path.exists(self.db_path):
+                    os.remove(self.db_path)
+                connection = self.connect(self.db_path)
+            except (OSError, sqlite3.DatabaseError):
+                connection = self.connect(":memory:")
+        return connection
+
+    @staticmethod
+    def connect(path):
+        connection = sqlite3.connect(path)
+        connection.row_factory = sqlite3.Row
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS members")
+            connection.execute("DROP TABLE IF EXISTS groups")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.executescript(SCHEMA)
+        connection.commit()
+        return connection
+
+    def close(self):
+        self.connection.close()
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+    def _apply(self, course, exam, score, day, sign):
+        """Grubun toplamlarına bir denemeyi ekle (sign=1) veya çıkar (sign=-1)"""
+        self.connection.execute(
+            "INSERT INTO groups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (course, exam) DO UPDATE SET "
+            "n = n + excluded.n, sum_score = sum_score + excluded.sum_score, "
+            "sum_score_sq = sum_score_sq + excluded.sum_score_sq, sum_day = sum_day + excluded.sum_day, "
+            "sum_day_sq = sum_day_sq + excluded.sum_day_sq, "
+            "sum_day_score = sum_day_score + excluded.sum_day_score, "
+            "last_day = MAX(last_day, excluded.last_day)",
+            (course, exam, sign, sign * score, sign * score * score, sign * day,
+             sign * day * day, sign * day * score, day if sign > 0 else 0.0))
+        if sign < 0:
+            row = self.connection.execute(
+                "SELECT n, last_day FROM groups WHERE course = ? AND exam = ?", (course, exam)).fetchone()
+            if row["n"] <= 0:
+                self.connection.execute("DELETE FROM groups WHERE course = ? AND exam = ?", (course, exam))
+            elif day >= row["last_day"]:
+                # Grubun son denemesi silindi
+                self.connection.execute(
+                    "UPDATE groups SET last_day = (SELECT MAX(day) FROM members "
+                    "WHERE course = ? AND exam = ?) WHERE course = ? AND exam = ?",
+                    (course, exam, course, exam))
+
+    def _remove(self, key):
+        row = self.connection.execute(
+            "SELECT course, exam, score, day FROM members WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return
+        self.connection.execute("DELETE FROM members WHERE key = ?", (key,))
+        self._apply(row["course"], row["exam"], row["score"], row["day"], -1)
+
+    def add(self, summaries):
+        """Yeni veya değişmiş kayıtları ekle; özetlerde 'path' anahtarı bulunmalı"""
+        with self.connection:
+            for summary in summaries:
+                key = summary["path"]
+                self._remove(key)
+                course, exam = parse_title(summary.get("title") or "")
+                score = float(summary.get("score") or 0.0)
+                day = summary_day(summary)
+                self.connection.execute("INSERT INTO members VALUES (?, ?, ?, ?, ?)",
+                                        (key, course, exam, score, day))
+                self._apply(course, exam, score, day, 1)
+
+    def remove(self, keys):
+        """Silinen kayıtları gruplarından çıkar"""
+        if isinstance(keys, str):
+            keys = [keys]
+        with self.connection:
+            for key in keys:
+                self._remove(key)
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM members")
+            self.connection.execute("DELETE FROM groups")
+
+    def rebuild(self, summaries):
+        """Tüm grupları verilen özetlerden yeniden kur (ilk açılışta veya tutarsızlıkta)
+
+        Üyeler topluca yazılır, toplamlar tek bir GROUP BY sorgusuyla hesaplanır.
+        """
+        rows = []
+        for summary in summaries:
+            course, exam = parse_title(summary.get("title") or "")
+            rows.append((summary["path"], course, exam, float(summary.get("score") or 0.0),
+                         summary_day(summary)))
+
+        with self.connection:
+            self.connection.execute("DELETE FROM members")
+            self.connection.execute("DELETE FROM groups")
+            self.connection.executemany("INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?)", rows)
+            self.connection.execute(
+                "INSERT INTO groups SELECT course, exam, COUNT(*), SUM(score), SUM(score * score), "
+                "SUM(day), SUM(day * day), SUM(day * score), MAX(day) FROM members GROUP BY course, exam")
+
+    def median(self, course, exam=None):
+        where, values = self._where(course, exam)
+        n = self.connection.execute(f"SELECT COUNT(*) FROM members WHERE {where}", values).fetchone()[0]
+        if n == 0:
+            return None
+        rows = self.connection.execute(
+            f"SELECT score FROM members WHERE {where} ORDER BY score LIMIT ? OFFSET ?",
+            values + (2 - n % 2, (n - 1) // 2)).fetchall()
+        return sum(row[0] for row in rows) / len(rows)
+
+    def best(self, course, exam=None):
+        where, values = self._where(course, exam)
+        return self.connection.execute(f"SELECT MAX(score) FROM members WHERE {where}", values).fetchone()[0]
+
+    @staticmethod
+    def _where(course, exam):
+        if exam is None:
+            return "course = ?", (course,)
+        return "course = ? AND exam = ?", (course, exam)
+
+    def groups(self, by_exam=True):
+        """Grup istatistikleri; by_exam False ise sınav türleri ders altında birleştirilir
+
+        Her grup için: ders, sınav, deneme sayısı, ortalama, medyan, en iyi,
+        standart sapma, eğilim (puan/ay, en az iki farklı günde deneme varsa)
+        ve son deneme tarihi.
+        """
+        if by_exam:
+            query = "SELECT * FROM groups"
+        else:
+            query = ("SELECT course, '' AS exam, SUM(n) AS n, SUM(sum_score) AS sum_score, "
+                     "SUM(sum_score_sq) AS sum_score_sq, SUM(sum_day) AS sum_day, "
+                     "SUM(sum_day_sq) AS sum_day_sq, SUM(sum_day_score) AS sum_day_score, "
+                     "MAX(last_day) AS last_day FROM groups GROUP BY course")
+
+        result = []
+        for row in self.connection.execute(query).fetchall():
+            n = row["n"]
+            mean = row["sum_score"] / n
+            variance = max(row["sum_score_sq"] / n - mean * mean, 0.0)
+
+            # En küçük kareler eğimi: (nΣts - ΣtΣs) / (nΣt² - (Σt)²)
+            trend = None
+            spread = n * row["sum_day_sq"] - row["sum_day"] ** 2
+            if n > 1 and spread > 1e-6 * n * n:
+                slope = (n * row["sum_day_score"] - row["sum_day"] * row["sum_score"]) / spread
+                trend = slope * DAYS_PER_MONTH
+
+            exam = row["exam"] if by_exam else None
+            result.append({
+                "course": row["course"],
+                "exam": row["exam"],
+                "attempts": n,
+                "mean": mean,
+                "median": self.median(row["course"], exam),
+                "best": self.best(row["course"], exam),
+                "std": variance ** 0.5,
+                "trend": trend,
+                "last_date": datetime.datetime.fromtimestamp(DAY_EPOCH + row["last_day"] * 86400.0).strftime("%Y-%m-%d"),
+            })
+        return result
@@ -0,0 +1,117 @@
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QCheckBox, QTableWidget, QHeaderView, QAbstractItemView)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor
+
+from history_model import score_color
+from widgets import SortableItem
+
+HEADERS = ['Ders', 'Sınav', 'Deneme', 'Ortalama', 'Medyan', 'En İyi', 'Std. Sapma', 'Eğilim (puan/ay)', 'Son Deneme']
+
+
+# Ders Analizi Penceresi
+class CourseStatsWindow(QMainWindow):
+    def __init__(self, course_stats, parent=None):
+        super().__init__(parent)
+        self.course_stats = course_stats
+
+        self.setWindowTitle("Ders Analizi")
+        self.setMinimumSize(900, 500)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+
+        # Üst bilgi ve gruplama seçeneği
+        top_layout = QHBoxLayout()
+        self.summary_label = QLabel()
+        top_layout.addWidget(self.summary_label)
+        top_layout.addStretch()
+
+        self.by_exam_check = QCheckBox("Sınav türlerine ayır (Vize, Final...)")
+        self.by_exam_check.setChecked(True)
+        self.by_exam_check.toggled.connect(self.refresh)
+        top_layout.addWidget(self.by_exam_check)
+        main_layout.addLayout(top_layout)
+
+        # Grup tablosu; başlığa tıklanarak sıralanır
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(HEADERS))
+        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.setColumnWidth(0, 260)
+        self.table.setStyleSheet("""
+            QTableWidget {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                font-size: 12px;
+            }
+            QHeaderView::section {
+                background-color: #f0f0f0;
+                padding: 4px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                font-size: 12px;
+            }
+        """)
+        main_layout.addWidget(self.table)
+
+        # Butonlar
+        btn_layout = QHBoxLayout()
+        refresh_btn = QPushButton("Yenile")
+        refresh_btn.clicked.connect(self.refresh)
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.close)
+        btn_layout.addStretch()
+        btn_layout.addWidget(refresh_btn)
+        btn_layout.addWidget(close_btn)
+        main_layout.addLayout(btn_layout)
+
+        self.refresh()
+
+    def refresh(self):
+        """Grupları istatistik dosyasından yeniden oku (kayıtlar taranmaz)"""
+        groups = self.course_stats.groups(by_exam=self.by_exam_check.isChecked())
+
+        sort_column = self.table.horizontalHeader().sortIndicatorSection()
+        sort_order = self.table.horizontalHeader().sortIndicatorOrder()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(groups))
+
+        for row, group in enumerate(groups):
+            trend = group['trend']
+            if trend is None:
+                trend_text, trend_key = "--", 0.0
+            else:
+                arrow = "↑" if trend > 0.05 else "↓" if trend < -0.05 else "→"
+                trend_text, trend_key = f"{trend:+.2f} {arrow}", trend
+
+            cells = [
+                SortableItem(group['course'], group['course'].casefold()),
+                SortableItem(group['exam'] or "--", group['exam']),
+                SortableItem(str(group['attempts']), group['attempts']),
+                SortableItem(f"{group['mean']:.1f}", group['mean']),
+                SortableItem(f"{group['median']:.1f}", group['median']),
+                SortableItem(f"{group['best']:.1f}", group['best']),
+                SortableItem(f"{group['std']:.1f}", group['std']),
+                SortableItem(trend_text, trend_key),
+                SortableItem(group['last_date'], group['last_date']),
+            ]
+            cells[3].setBackground(score_color(group['mean']))
+            if trend is not None and abs(trend) > 0.05:
+                cells[7].setForeground(QColor("#2E7D32") if trend > 0 else QColor("#C62828"))
+            for column, item in enumerate(cells):
+                if column >= 2:
+                    item.setTextAlignment(Qt.AlignCenter)
+                self.table.setItem(row, column, item)
+
+        self.table.setSortingEnabled(True)
+        self.table.sortItems(sort_column, sort_order)
+
+        attempts = sum(group['attempts'] for group in groups)
+        self.summary_label.setText(f"<b>{len(groups)}</b> grup, <b>{attempts}</b> deneme")
@@ -0,0 +1,382 @@
+import math
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QGridLayout, QFrame, QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView,
+                            QTabWidget, QAbstractItemView)
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QPainter
+from widgets import SortableItem
+
+DIFFICULTY_HEADERS = ['Soru No', 'Deneme', 'Doğru %', 'Hata %', 'Boş %', 'Boş → Cevap %', 'Gelişim', 'Bu Denemede']
+
+# Test Detay Penceresi
+class TestDetailWindow(QMainWindow):
+    def __init__(self, test_data, parent=None, difficulty=None):
+        super().__init__(parent)
+        self.test_data = test_data
+        
+        # Pencere özellikleri
+        self.setWindowTitle(f"Test Detayları: {test_data['title']}")
+        self.setMinimumSize(800, 600)
+        
+        # Ana widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # Üst bilgi alanı
+        info_frame = QFrame()
+        info_frame.setFrameShape(QFrame.StyledPanel)
+        info_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
+        info_layout = QGridLayout(info_frame)
+        
+        # Bilgi etiketleri
+        title_label = QLabel(f"<b>Test Adı:</b> {test_data['title']}")
+        date_label = QLabel(f"<b>Tarih:</b> {test_data['date']}")
+        score_label = QLabel(f"<b>Puan:</b> {test_data['score']:.1f}/100")
+        
+        # Puanı renklendir
+        score_value = test_data['score']
+        if score_value >= 85:
+            score_label.setStyleSheet("color: #2E7D32;")  # Koyu yeşil
+        elif score_value >= 70:
+            score_label.setStyleSheet("color: #388E3C;")  # Yeşil
+        elif score_value >= 60:
+            score_label.setStyleSheet("color: #FBC02D;")  # Sarı
+        elif score_value >= 50:
+            score_label.setStyleSheet("color: #F57F17;")  # Turuncu
+        else:
+            score_label.setStyleSheet("color: #C62828;")  # Kırmızı
+            
+        correct_label = QLabel(f"<b>Doğru:</b> {test_data['correct']}")
+        correct_label.setStyleSheet("color: #4CAF50;")
+        
+        wrong_label = QLabel(f"<b>Yanlış:</b> {test_data['wrong']}")
+        wrong_label.setStyleSheet("color: #F44336;")
+        
+        empty_label = QLabel(f"<b>Boş:</b> {test_data['empty']}")
+        empty_label.setStyleSheet("color: #2196F3;")
+        
+        ratio_label = QLabel(f"<b>Yanlış Götürme Oranı:</b> {test_data['wrong_ratio']}")
+        
+        # Düzene ekle
+        info_layout.addWidget(title_label, 0, 0)
+        info_layout.addWidget(date_label, 0, 1)
+        info_layout.addWidget(score_label, 1, 0)
+        info_layout.addWidget(correct_label, 1, 1)
+        info_layout.addWidget(wrong_label, 2, 0)
+        info_layout.addWidget(empty_label, 2, 1)
+        info_layout.addWidget(ratio_label, 3, 0, 1, 2)
+        
+        main_layout.addWidget(info_frame)
+        
+        # Soru detayları tablosu
+        question_frame = QFrame()
+        question_frame.setFrameShape(QFrame.StyledPanel)
+        question_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
+        question_layout = QVBoxLayout(question_frame)
+        self.question_layout = question_layout
+        
+        # Tablo başlığı
+        table_title = QLabel("<b>Soru Detayları</b>")
+        table_title.setAlignment(Qt.AlignCenter)
+        question_layout.addWidget(table_title)
+        
+        # Soru detayları tablosu
+        self.question_table = QTableWidget()
+        self.question_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.question_table.setColumnCount(4)
+        self.question_table.setHorizontalHeaderLabels(['Soru No', 'Seçilen Şık', 'Durum', 'Açıklama'])
+        
+        # Sütunların manuel olarak boyutlandırılabilmesi için:
+        self.question_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        
+        # İlk başta uygun genişlikler ayarla
+        self.question_table.setColumnWidth(0, 60)    # Soru No
+        self.question_table.setColumnWidth(1, 80)    # Seçilen Şık
+        self.question_table.setColumnWidth(2, 80)    # Durum
+        
+        # Son sütunun geri kalan alanı doldurmasını sağla
+        self.question_table.horizontalHeader().setStretchLastSection(True)
+        
+        self.question_table.setStyleSheet("""
+            QTableWidget {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                font-size: 12px;
+            }
+            QHeaderView::section {
+                background-color: #f0f0f0;
+                padding: 4px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QTableWidget::item {
+                padding: 4px;
+            }
+            QTableWidget::item:selected {
+                background-color: #e0f2f1;
+            }
+        """)
+        
+        # Sorular varsa yükle
+        if 'questions' in test_data:
+            self.load_questions_data(test_data['questions'])
+        else:
+            # Eski formatta kaydedilmiş testler için
+            no_data_row = self.question_table.rowCount()
+            self.question_table.insertRow(no_data_row)
+            self.question_table.setItem(no_data_row, 0, QTableWidgetItem("--"))
+            self.question_table.setItem(no_data_row, 1, QTableWidgetItem("--"))
+            self.question_table.setItem(no_data_row, 2, QTableWidgetItem("--"))
+            self.question_table.setItem(no_data_row, 3, QTableWidgetItem("Bu test için soru detayları mevcut değil"))
+        
+        # Aynı sınavın tüm denemelerinden hesaplanan soru zorluğu hazır olunca ayrı sekmede gösterilir
+        question_layout.addWidget(self.question_table)
+        self.difficulty_table = None
+        self.difficulty_loader = None
+        self.show_difficulty(difficulty)
+        main_layout.addWidget(question_frame)
+        
+        # Grafik gösterimi için bir resim ekleyebiliriz
+        chart_frame = QFrame()
+        chart_frame.setFrameShape(QFrame.StyledPanel)
+        chart_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
+        chart_layout = QVBoxLayout(chart_frame)
+        
+        # Grafik başlığı
+        chart_title = QLabel("<b>Test Sonuç Grafiği</b>")
+        chart_title.setAlignment(Qt.AlignCenter)
+        chart_layout.addWidget(chart_title)
+        
+        # Sonuç grafiği (basit bir görsel temsil)
+        chart_widget = QWidget()
+        chart_widget.setMinimumHeight(150)
+        chart_layout.addWidget(chart_widget)
+        
+        # Grafik çizimi
+        chart_widget.paintEvent = lambda event, d=test_data: self.draw_chart(event, d, chart_widget)
+        
+        main_layout.addWidget(chart_frame)
+        
+        # Layout ağırlıkları
+        main_layout.setStretch(0, 1)  # Bilgi alanı
+        main_layout.setStretch(1, 3)  # Soru detayları
+        main_layout.setStretch(2, 2)  # Grafik
+        
+        # Kapat butonu
+        btn_layout = QHBoxLayout()
+        close_btn = QPushButton("Kapat")
+        close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f0f0f0;
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 8px 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+        """)
+        close_btn.clicked.connect(self.close)
+        btn_layout.addStretch()
+        btn_layout.addWidget(close_btn)
+        
+        main_layout.addLayout(btn_layout)
+    
+    def load_questions_data(self, questions_data):
+        """Soru verilerini tabloya yükle"""
+        self.question_table.setRowCount(0)
+        
+        for question in questions_data:
+            row = self.question_table.rowCount()
+            self.question_table.insertRow(row)
+            
+            # Soru numarası
+            self.question_table.setItem(row, 0, QTableWidgetItem(str(question['number'])))
+            
+            # Seçilen şık
+            selected_option = question.get('selected_option', '-')
+            self.question_table.setItem(row, 1, QTableWidgetItem(str(selected_option) if selected_option else '-'))
+            
+            # Durum
+            state = question.get('state', 'unmarked')
+            state_item = QTableWidgetItem(self.get_state_text(state))
+            self.question_table.setItem(row, 2, state_item)
+            
+            # Durum rengini ayarla
+            if state == 'correct':
+                state_item.setBackground(QColor(200, 255, 200))  # Açık yeşil
+                state_item.setForeground(QColor(0, 100, 0))      # Koyu yeşil yazı
+            elif state == 'wrong':
+                state_item.setBackground(QColor(255, 200, 200))  # Açık kırmızı
+                state_item.setForeground(QColor(150, 0, 0))      # Koyu kırmızı yazı
+            elif state == 'empty':
+                state_item.setBackground(QColor(200, 220, 255))  # Açık mavi
+                state_item.setForeground(QColor(0, 0, 150))      # Koyu mavi yazı
+            
+            # Açıklama
+            description = self.get_question_description(question)
+            self.question_table.setItem(row, 3, QTableWidgetItem(description))
+    
+    def show_difficulty(self, difficulty):
+        """Soru zorluğunu "Bu Deneme" tablosunun yanında ayrı sekmede göster
+
+        Pencere açıldıktan sonra arka plan hesabı bitince de çağrılabilir;
+        sonuç yoksa (soru detaylı deneme yok) tablo tek başına kalır.
+        """
+        if difficulty is None or self.difficulty_table is not None:
+            return
+        position = self.question_layout.indexOf(self.question_table)
+        self.question_layout.removeWidget(self.question_table)
+        tabs = QTabWidget()
+        tabs.addTab(self.question_table, "Bu Deneme")
+        self.difficulty_table = self.build_difficulty_table(difficulty)
+        tabs.addTab(self.difficulty_table, f"Soru Zorluğu ({difficulty['sessions']} deneme)")
+        self.question_layout.insertWidget(position, tabs)
+    
+    def build_difficulty_table(self, difficulty):
+        """Soru başına denemeler boyunca oranlar; başlığa tıklanarak sıralanır"""
+        table = QTableWidget()
+        table.setColumnCount(len(DIFFICULTY_HEADERS))
+        table.setHorizontalHeaderLabels(DIFFICULTY_HEADERS)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.setStyleSheet(self.question_table.styleSheet())
+        
+        def percent(value):
+            # Tanımsız oranlar "--" gösterilir ve sıralamada en alta düşer
+            if math.isnan(value):
+                return SortableItem("--", -1.0)
+            return SortableItem(f"{value * 100:.0f}", value)
+        
+        questions = self.test_data.get('questions') or []
+        count = len(difficulty['attempts'])
+        table.setRowCount(count)
+        for row in range(count):
+            improvement = float(difficulty['improvement'][row])
+            if math.isnan(improvement):
+                improvement_item = SortableItem("--", -2.0)
+            else:
+                improvement_item = SortableItem(f"{improvement * 100:+.0f}", improvement)
+                if abs(improvement) >= 0.05:
+                    improvement_item.setForeground(QColor(0, 100, 0) if improvement > 0 else QColor(150, 0, 0))
+            
+            state = questions[row].get('state', 'unmarked') if row < len(questions) else None
+            error_rate = float(difficulty['error_rate'][row])
+            cells = [
+                SortableItem(str(row + 1), row + 1),
+                SortableItem(str(int(difficulty['attempts'][row])), int(difficulty['attempts'][row])),
+                percent(float(difficulty['correct_rate'][row])),
+                percent(error_rate),
+                percent(float(difficulty['empty_rate'][row])),
+                percent(float(difficulty['recovered_rate'][row])),
+                improvement_item,
+                SortableItem(self.get_state_text(state) if state else "-", state or ""),
+            ]
+            # Hata oranı arttıkça hücre kırmızılaşır
+            if not math.isnan(error_rate):
+                shade = int(255 - 80 * error_rate)
+                cells[3].setBackground(QColor(255, shade, shade))
+            for column, item in enumerate(cells):
+                item.setTextAlignment(Qt.AlignCenter)
+                table.setItem(row, column, item)
+        
+        table.setSortingEnabled(True)
+        table.sortItems(3, Qt.DescendingOrder)
+        return table
+    
+    def get_state_text(self, state):
+        """Durum metnini döndür"""
+        if state == 'correct':
+            return 'Doğru'
+        elif state == 'wrong':
+            return 'Yanlış'
+        elif state == 'empty':
+            return 'Boş'
+        else:
+            return 'İşaretlenmemiş'
+    
+    def get_question_description(self, question):
+        """Soru durumuna göre açıklama oluştur"""
+        state = question.get('state', 'unmarked')
+        selected = question.get('selected_option', None)
+        
+        if state == 'correct':
+            return f"{selected} işaretlendi - Doğru"
+        elif state == 'wrong':
+            return f"{selected} işaretlendi - Yanlış"
+        elif state == 'empty':
+            if selected:
+                return f"{selected} işaretlendi - Boş bırakıldı olarak değerlendirildi"
+            else:
+                return "Boş bırakıldı"
+        else:
+            if selected:
+                return f"{selected} işaretlendi - Değerlendirilmedi"
+            else:
+                return "İşaretlenmedi"
+    
+    def draw_chart(self, event, data, widget):
+        """Basit sonuç grafiği çizimi"""
+        painter = QPainter(widget)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Grafik alanı
+        width = widget.width()
+        height = widget.height()
+        margin = 20
+        
+        # Renkleri tanımla
+        colors = {
+            'correct': QColor('#4CAF50'),
+            'wrong': QColor('#F44336'),
+            'empty': QColor('#2196F3')
+        }
+        
+        # Toplam soru sayısı
+        total = data['correct'] + data['wrong'] + data['empty']
+        if total == 0:
+            return
+        
+        # Çubuk grafik çiz
+        bar_width = int((width - 2 * margin) / 3)
+        bar_spacing = 10
+        
+        # Doğrular
+        correct_height = int((data['correct'] / total) * (height - 2 * margin))
+        x = margin
+        y = int(height - margin - correct_height)
+        painter.setBrush(colors['correct'])
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(x, y, bar_width - bar_spacing, correct_height)
+        painter.setPen(Qt.black)
+        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
+                         Qt.AlignCenter, f"Doğru ({data['correct']})")
+        
+        # Yanlışlar
+        wrong_height = int((data['wrong'] / total) * (height - 2 * margin))
+        x = margin + bar_width
+        y = int(height - margin - wrong_height)
+        painter.setBrush(colors['wrong'])
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(x, y, bar_width - bar_spacing, wrong_height)
+        painter.setPen(Qt.black)
+        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
+                         Qt.AlignCenter, f"Yanlış ({data['wrong']})")
+        
+        # Boşlar
+        empty_height = int((data['empty'] / total) * (height - 2 * margin))
+        x = margin + 2 * bar_width
+        y = int(height - margin - empty_height)
+        painter.setBrush(colors['empty'])
+        painter.setPen(Qt.NoPen)
+        painter.drawRect(x, y, bar_width - bar_spacing, empty_height)
+        painter.setPen(Qt.black)
+        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
+                         Qt.AlignCenter, f"Boş ({data['empty']})")
@@ -0,0 +1,155 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from record_format import (is_binary_record, encode_record, question_codes, OPTION_MASK,
+                           STATE_SHIFT, WAS_EMPTY_BIT)
+from result_files import parse_record
+from scoring import PADDING
+from sheet_codes import UNMARKED, CORRECT, WRONG, EMPTY, NO_OPTION
+
+# Aynı sınavın tüm denemeleri (deneme x soru) boyutlu bir kod matrisinde
+# toplanır; hücreler kayıt biçimindeki soru kodlarıdır (şık, durum,
+# was_empty bitleri). Kısa denemelerin eksik hücreleri PADDING olur.
+
+
+def read_file(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def record_codes(data):
+    """Kayıt verisindeki soru kodları; JSON kayıtlar önce sıkıştırılmış biçime çevrilir"""
+    if not is_binary_record(data):
+        data = encode_record(parse_record(data))
+    return question_codes(data)
+
+
+def build_matrix(code_rows):
+    """Soru kodu dizilerini tek seferde (deneme x soru) matrisine yerleştir"""
+    lengths = np.array([len(row) for row in code_rows], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    if width and lengths.min() == width:
+        # Tüm denemeler aynı uzunlukta: kopyalamadan yeniden şekillendir
+        return np.frombuffer(b"".join(code_rows), dtype=np.uint8).reshape(len(code_rows), width)
+    matrix = np.full((len(code_rows), width), PADDING, dtype=np.uint8)
+    if width:
+        flat = np.frombuffer(b"".join(code_rows), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(code_rows)), lengths)
+        starts = np.cumsum(lengths) - lengths
+        columns = np.arange(len(flat)) - np.repeat(starts, lengths)
+        matrix[rows, columns] = flat
+    return matrix
+
+
+def question_difficulty(matrix):
+    """Her soru için denemeler boyunca oranlar (satırlar eskiden yeniye sıralı olmalı)
+
+    attempts       : soruyu içeren deneme sayısı
+    correct_rate   : doğru işaretlenme oranı
+    error_rate     : yanlış işaretlenme oranı
+    empty_rate     : boş bırakılma oranı (boş işaretli veya hiç dokunulmamış)
+    recovered_rate : önce boş bırakılıp sonra şıkkı seçilen denemelerin, boş
+                     bırakılan denemelere oranı (sonradan doldurulup mavi
+                     gösterilen, durumu hâlâ boş olan sorular dahil)
+    improvement    : son yarıdaki doğru oranı ile ilk yarıdaki doğru oranı farkı
+
+    Tanımsız oranlar NaN olur.
+    """
+    present = matrix != PADDING
+    states = (matrix >> STATE_SHIFT) & 0x03
+    options = matrix & OPTION_MASK
+
+    correct = present & (states == CORRECT)
+    wrong = present & (states == WRONG)
+    empty = present & ((states == EMPTY) | ((states == UNMARKED) & (options == NO_OPTION)))
+    was_empty = present & ((matrix & WAS_EMPTY_BIT) != 0)
+    recovered = was_empty & (options != NO_OPTION)
+
+    attempts = np.count_nonzero(present, axis=0)
+    # Her sütunda denemenin sırası; ilk yarı / son yarı ayrımı için
+    if attempts.size and attempts.min() == len(matrix):
+        rank = np.arange(len(matrix), dtype=np.int32)[:, None]
+    else:
+        rank = np.cumsum(present, axis=0, dtype=np.int32) - 1
+    late = present & (rank >= (attempts // 2))
+    early = present & ~late
+
+    def total(mask):
+        return np.count_nonzero(mask, axis=0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        count = attempts.astype(np.float64)
+        improvement = total(correct & late) / total(late) - total(correct & early) / total(early)
+        return {
+            "attempts": attempts,
+            "correct_rate": total(correct) / count,
+            "error_rate": total(wrong) / count,
+            "empty_rate": total(empty) / count,
+            "recovered_rate": total(recovered) / total(was_empty),
+            "improvement": np.where(attempts > 1, improvement, np.nan),
+        }
+
+
+class DifficultyCache:
+    """Sınav başlığına göre önbelleğe alınmış soru zorluğu sonuçları
+
+    Denemelerin (anahtar, mtime, boyut) listesi değişmediyse sonuç aynen
+    döner. Değiştiyse yalnızca yeni veya değişmiş denemeler okunur, matris
+    ve oranlar yeniden hesaplanır.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, title, attempts, read_data=read_file):
+        """attempts: eskiden yeniye (anahtar, mtime, boyut); read_data(anahtar) ham veriyi döndürür"""
+        fingerprint = tuple(attempts)
+        with self.lock:
+            entry = self.entries.get(title)
+            if entry is not None:
+                self.entries.move_to_end(title)
+                if entry[0] == fingerprint:
+                    return entry[2]
+            known = entry[1] if entry is not None else {}
+
+        codes = {}
+        for attempt in fingerprint:
+            if attempt in known:
+                codes[attempt] = known[attempt]
+                continue
+            try:
+                codes[attempt] = record_codes(read_data(attempt[0]))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Deneme okunamadı: {attempt[0]}: {e}")
+                codes[attempt] = None
+
+        # Soru detayı olmayan eski kayıtlar matrise katılmaz
+        rows = [row for row in codes.values() if row]
+        matrix = build_matrix(rows)
+        result = dict(question_difficulty(matrix), title=title, sessions=len(rows))
+
+        with self.lock:
+            self.entries[title] = (fingerprint, codes, result)
+            self.entries.move_to_end(title)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+_shared_cache = None
+
+
+def shared_difficulty_cache():
+    """Uygulama genelinde kullanılan zorluk önbelleği"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = DifficultyCache()
+    return _shared_cache
@@ -0,0 +1,107 @@
+import math
+
+# Basılı optik formun geometrisi (milimetre, sol üst köşe başlangıç). Form
+# üreticisi (çizim) ve optik okuyucu (örnekleme) aynı koordinatları buradan
+# alır; bir ölçü değişirse ikisi birlikte değişir. Qt veya NumPy gerektirmez.
+#
+#   - Dört köşede dolu kare hizalama işaretleri: taranan görüntüde sayfanın
+#     konumu, ölçeği ve eğikliği bunlardan bulunur
+#   - Üst kenarda sayfa numarası kutucukları (ikili kod, dolu = 1)
+#   - Başlık alanı: sınav adı, ad soyad, öğrenci numarası
+#   - Soru ızgarası: sütunlar yukarıdan aşağı doldurulur; her satırda soru
+#     numarası ve uygulamadaki Question satırı gibi A-E balonları
+PAGE_WIDTH = 210.0
+PAGE_HEIGHT = 297.0
+MARGIN = 10.0
+
+MARK_SIZE = 7.0
+
+PAGE_CODE_BITS = 6
+PAGE_CODE_SIZE = 4.0
+PAGE_CODE_PITCH = 6.0
+PAGE_CODE_LEFT = MARGIN + MARK_SIZE + 8.0
+
+HEADER_TOP = MARGIN + MARK_SIZE + 4.0
+HEADER_HEIGHT = 38.0
+
+GRID_TOP = HEADER_TOP + HEADER_HEIGHT + 6.0
+GRID_LEFT = MARGIN
+COLUMNS = 4
+ROWS = 40
+ROW_HEIGHT = 5.25
+COLUMN_WIDTH = (PAGE_WIDTH - 2 * MARGIN) / COLUMNS
+QUESTIONS_PER_PAGE = COLUMNS * ROWS
+
+NUMBER_WIDTH = 11.0
+BUBBLE_DIAMETER = 4.4
+BUBBLE_PITCH = 6.6
+OPTION_COUNT = 5
+
+# Başlık alanındaki yazı kutuları: (ad, etiket, x, y, genişlik, yükseklik)
+FIELDS = (
+    ("title", "Sınav", MARGIN, HEADER_TOP + 8.0, PAGE_WIDTH - 2 * MARGIN, 9.0),
+    ("name", "Ad Soyad", MARGIN, HEADER_TOP + 19.0, 120.0, 9.0),
+    ("student_id", "Öğrenci No", MARGIN + 125.0, HEADER_TOP + 19.0, PAGE_WIDTH - 2 * MARGIN - 125.0, 9.0),
+)
+
+
+def mark_centers():
+    """Hizalama işaretlerinin merkezleri: sol üst, sağ üst, sağ alt, sol alt"""
+    near = MARGIN + MARK_SIZE / 2
+    return [
+        (near, near),
+        (PAGE_WIDTH - near, near),
+        (PAGE_WIDTH - near, PAGE_HEIGHT - near),
+        (near, PAGE_HEIGHT - near),
+    ]
+
+
+def page_code_centers():
+    """Sayfa numarası kutucuklarının merkezleri (en düşük bit solda)"""
+    y = MARGIN + MARK_SIZE / 2
+    return [(PAGE_CODE_LEFT + PAGE_CODE_SIZE / 2 + bit * PAGE_CODE_PITCH, y)
+            for bit in range(PAGE_CODE_BITS)]
+
+
+def page_code(page):
+    """Sayfa numarasının kutucuklara yazılacak bitleri"""
+    return [bool(page >> bit & 1) for bit in range(PAGE_CODE_BITS)]
+
+
+class FormLayout:
+    """Belirli bir soru sayısı için formun sayfaları ve soru konumları"""
+
+    def __init__(self, question_count):
+        if question_count < 1:
+            raise ValueError("Soru sayısı en az 1 olmalı")
+        self.question_count = question_count
+        self.pages = math.ceil(question_count / QUESTIONS_PER_PAGE)
+        if self.pages > 1 << PAGE_CODE_BITS:
+            raise ValueError(f"En fazla {QUESTIONS_PER_PAGE << PAGE_CODE_BITS} soru desteklenir")
+
+    def page_questions(self, page):
+        """Sayfadaki soruların (0'dan başlayan) sıraları"""
+        first = page * QUESTIONS_PER_PAGE
+        return range(first, min(first + QUESTIONS_PER_PAGE, self.question_count))
+
+    def row_origin(self, index):
+        """Sorunun satırının sol üst köşesi (sayfa içinde)"""
+        slot = index % QUESTIONS_PER_PAGE
+        column, row = divmod(slot, ROWS)
+        return GRID_LEFT + column * COLUMN_WIDTH, GRID_TOP + row * ROW_HEIGHT
+
+    def number_rect(self, index):
+        """Soru numarasının yazılacağı kutu (x, y, genişlik, yükseklik)"""
+        x, y = self.row_origin(index)
+        return x, y, NUMBER_WIDTH, ROW_HEIGHT
+
+    def bubble_center(self, index, option):
+        """option: 0-4 (A-E)"""
+        x, y = self.row_origin(index)
+        return (x + NUMBER_WIDTH + 1.0 + BUBBLE_DIAMETER / 2 + option * BUBBLE_PITCH,
+                y + ROW_HEIGHT / 2)
+
+    def bubble_centers(self, page):
+        """Sayfadaki tüm balonların merkezleri; soru sırasıyla, her soru için A-E"""
+        return [self.bubble_center(index, option)
+                for index in self.page_questions(page) for option in range(OPTION_COUNT)]
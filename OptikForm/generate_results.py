@@ -0,0 +1,245 @@
+"""Yük ve ölçek testleri için sentetik sınav geçmişi üretir
+
+    python generate_results.py --count 100000 [--dir synthetic_results] [--seed 0]
+                               [--questions 20,40,80] [--scores normal:60:15]
+                               [--start 2018-09-01] [--end 2025-06-30]
+                               [--format okr|json] [--workers N]
+
+Kayıtlar TestTab.save_test_results ile aynı yapıdadır; başlıklar gerçek
+kayıtlardaki gibi "Veritabanı Programlama 2018 Bahar Vize" biçimindedir.
+Kayıtlar sabit boyutlu parçalara bölünüp işlemlere dağıtılır; her parça
+kendi tohumundan üretildiği için çıktı işlem sayısından bağımsız olarak
+aynı tohumla her zaman aynıdır.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from record_format import (encode_codes, decode_record, STATE_SHIFT, IS_CORRECT_BIT,
+                           WAS_EMPTY_BIT)
+from result_files import BINARY_EXTENSION, JSON_EXTENSION, result_path
+from scoring import compute_score
+from sheet_codes import OPTIONS, UNMARKED, CORRECT, WRONG, EMPTY
+
+DEFAULT_DIR = "synthetic_results"
+
+COURSES = [
+    "Veritabanı Programlama",
+    "Ağ Yönetimi ve Bilgi Güvenliği",
+    "Nesne Tabanlı Programlama",
+    "Veri Yapıları ve Algoritmalar",
+    "İşletim Sistemleri",
+    "Bilgisayar Ağları",
+    "Web Tasarımı ve Programlama",
+    "Mobil Programlama",
+    "Sistem Analizi ve Tasarımı",
+    "Yazılım Mühendisliği",
+    "Matematik",
+    "Temel Bilgi Teknolojileri",
+    "İstatistik ve Olasılık",
+    "Türk Dili",
+    "Atatürk İlkeleri ve İnkılap Tarihi",
+    "İngilizce",
+]
+YEARS = range(2018, 2025)
+TERMS = ["Güz", "Bahar", "Yaz"]
+EXAMS = ["Vize", "Final", "Bütünleme"]
+
+SCORE_DISTRIBUTIONS = {
+    "normal": (60.0, 15.0),   # ortalama, standart sapma
+    "uniform": (20.0, 95.0),  # alt, üst sınır
+    "beta": (5.0, 3.0),       # a, b (0-100 aralığına ölçeklenir)
+}
+WRONG_RATIOS = [2, 3, 4, 5]
+
+# Her parça kendi tohumuyla üretilir; parça boyutu değişirse çıktı da değişir
+CHUNK_SIZE = 5000
+
+
+def parse_distribution(text):
+    """"normal:60:15" gibi bir tanımı (ad, a, b) olarak çözümle"""
+    name, *values = text.split(":")
+    if name not in SCORE_DISTRIBUTIONS:
+        raise ValueError(f"Bilinmeyen dağılım: {name}")
+    if values and len(values) != 2:
+        raise ValueError(f"Dağılım iki parametre almalı: {text}")
+    a, b = (float(value) for value in values) if values else SCORE_DISTRIBUTIONS[name]
+    return name, a, b
+
+
+def build_catalog(seed, question_counts):
+    """Tüm sınav başlıkları; her sınavın soru sayısı ve zorluğu tohumdan belirlenir"""
+    rng = np.random.default_rng([seed, 0xCA7A])
+    titles = [f"{course} {year} {term} {exam}"
+              for course in COURSES for year in YEARS for term in TERMS for exam in EXAMS]
+    counts = rng.choice(question_counts, size=len(titles))
+    # Zorluk, beklenen doğru oranına eklenen puan farkıdır
+    difficulty = rng.normal(0.0, 8.0, size=len(titles))
+    return [(title, int(count), float(shift)) for title, count, shift in zip(titles, counts, difficulty)]
+
+
+def draw_abilities(rng, distribution, size):
+    """Oturum başına beklenen doğru oranı (0-100)"""
+    name, a, b = distribution
+    if name == "normal":
+        values = rng.normal(a, b, size)
+    elif name == "uniform":
+        values = rng.uniform(a, b, size)
+    else:
+        values = rng.beta(a, b, size) * 100
+    return values
+
+
+def generate_chunk(task):
+    """Bir parçadaki kayıtları üret ve yaz; (kayıt sayısı, bayt) döndürür
+
+    Soru kodları tüm parça için tek seferde (kayıt x soru) matrisinde
+    hesaplanır ve doğrudan sıkıştırılmış biçime yazılır.
+    """
+    (results_dir, extension, seed, chunk, first, count, total,
+     catalog, distribution, start, span) = task
+    rng = np.random.default_rng([seed, chunk])
+
+    picks = rng.integers(0, len(catalog), count)
+    question_counts = np.array([catalog[pick][1] for pick in picks])
+    shifts = np.array([catalog[pick][2] for pick in picks])
+    p_correct = np.clip((draw_abilities(rng, distribution, count) + shifts) / 100, 0.02, 0.98)[:, None]
+    ratios = rng.choice(WRONG_RATIOS, count)
+    # Doğru olmayanların bir kısmı boş bırakılır
+    blank_share = rng.uniform(0.0, 0.4, count)[:, None]
+
+    # Zaman aralığı kayıtlar arasında eşit dilimlere bölünür; her kayıt kendi
+    # diliminde rastgele bir saniyeye düşer, böylece dosya adları çakışmaz
+    step = span / total
+    slots = np.floor(np.arange(first, first + count + 1) * step)
+    stamps = start + slots[:-1] + np.floor(rng.random(count) * (slots[1:] - slots[:-1]))
+
+    width = int(question_counts.max())
+    rolls = rng.random((count, width))
+    options = rng.integers(1, len(OPTIONS) + 1, (count, width), dtype=np.uint8)
+    # Boşların bir kısmı "boş" olarak işaretlenir, kalanına hiç dokunulmaz
+    marked = rng.random((count, width)) < 0.7
+
+    states = np.full((count, width), WRONG, dtype=np.uint8)
+    states[rolls < p_correct] = CORRECT
+    blank = rolls >= 1 - (1 - p_correct) * blank_share
+    states[blank] = np.where(marked[blank], EMPTY, UNMARKED)
+    options[blank] = 0
+
+    codes = (options | (states << STATE_SHIFT)
+             | np.where(states == CORRECT, IS_CORRECT_BIT, 0).astype(np.uint8)
+             | np.where(states == EMPTY, WAS_EMPTY_BIT, 0).astype(np.uint8))
+
+    in_sheet = np.arange(width) < question_counts[:, None]
+    correct_counts = np.count_nonzero((states == CORRECT) & in_sheet, axis=1).tolist()
+    wrong_counts = np.count_nonzero((states == WRONG) & in_sheet, axis=1).tolist()
+
+    written = 0
+    for k in range(count):
+        title, question_count, _ = catalog[picks[k]]
+        stamp = int(stamps[k])
+        when = datetime.datetime.fromtimestamp(stamp)
+        correct, wrong, wrong_ratio = correct_counts[k], wrong_counts[k], int(ratios[k])
+
+        data = encode_codes(title, when.strftime("%Y-%m-%d %H:%M"),
+                            compute_score(correct, wrong, question_count, wrong_ratio),
+                            wrong_ratio, correct, wrong, question_count - correct - wrong,
+                            codes[k, :question_count].tobytes())
+        if extension == JSON_EXTENSION:
+            data = json.dumps(decode_record(data)).encode('utf-8')
+
+        # Veri tohumdan yeniden üretilebildiği için fsync yapılmaz
+        path = result_path(title, when, results_dir)
+        with open(path, "wb") as f:
+            f.write(data)
+        os.utime(path, (stamp, stamp))
+        written += len(data)
+    return count, written
+
+
+def generate_results(results_dir=DEFAULT_DIR, count=1000, seed=0, question_counts=(20, 40, 80),
+                     distribution="normal", start="2018-09-01", end="2025-06-30",
+                     extension=BINARY_EXTENSION, workers=None, progress=None):
+    """Klasöre 'count' adet sentetik kayıt yaz; (kayıt sayısı, toplam bayt) döndürür
+
+    Aynı parametrelerle her çağrı aynı dosyaları üretir.
+    """
+    if isinstance(distribution, str):
+        distribution = parse_distribution(distribution)
+    start = datetime.datetime.strptime(start, "%Y-%m-%d").timestamp()
+    end = datetime.datetime.strptime(end, "%Y-%m-%d").timestamp()
+    span = end - start
+    if span < count:
+        raise ValueError("Tarih aralığı kayıt sayısı için çok kısa (kayıt başına en az 1 saniye)")
+    os.makedirs(results_dir, exist_ok=True)
+
+    catalog = build_catalog(seed, list(question_counts))
+    tasks = [(results_dir, extension, seed, chunk, first, min(CHUNK_SIZE, count - first), count,
+              catalog, distribution, start, span)
+             for chunk, first in enumerate(range(0, count, CHUNK_SIZE))]
+
+    done = total_bytes = 0
+    if workers == 1 or len(tasks) <= 1:
+        results = map(generate_chunk, tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(generate_chunk, tasks)
+    try:
+        for written, size in results:
+            done += written
+            total_bytes += size
+            if progress is not None:
+                progress(done, count)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return done, total_bytes
+
+
+def number_list(text):
+    return [int(value) for value in text.split(",") if value]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik sınav geçmişi üretici")
+    parser.add_argument("--count", type=int, default=1000, help="kayıt sayısı")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help=f"çıktı klasörü (varsayılan: {DEFAULT_DIR})")
+    parser.add_argument("--seed", type=int, default=0, help="rastgelelik tohumu")
+    parser.add_argument("--questions", type=number_list, default=[20, 40, 80],
+                        help="sınavlara dağıtılacak soru sayıları (virgülle ayrılmış)")
+    parser.add_argument("--scores", default="normal", help="puan dağılımı: normal[:ort:sapma], "
+                        "uniform[:alt:üst] veya beta[:a:b]")
+    parser.add_argument("--start", default="2018-09-01", help="ilk kayıt tarihi (YYYY-AA-GG)")
+    parser.add_argument("--end", default="2025-06-30", help="son kayıt tarihi (YYYY-AA-GG)")
+    parser.add_argument("--format", choices=("okr", "json"), default="okr", help="kayıt biçimi")
+    parser.add_argument("--workers", type=int, help="işlem sayısı (varsayılan: işlemci sayısı)")
+    args = parser.parse_args(argv)
+
+    extension = BINARY_EXTENSION if args.format == "okr" else JSON_EXTENSION
+
+    def progress(done, count):
+        print(f"\r{done}/{count}", end="", file=sys.stderr, flush=True)
+
+    began = time.perf_counter()
+    try:
+        count, size = generate_results(args.dir, args.count, args.seed, args.questions, args.scores,
+                                       args.start, args.end, extension, args.workers, progress)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - began
+    print(file=sys.stderr)
+    print(f"{count} kayıt yazıldı: {args.dir} ({size / 1e6:.1f} MB, {elapsed:.1f} s, "
+          f"{count / elapsed:.0f} kayıt/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from result_files import RESULTS_DIR, scan_result_files, load_record, summarize
+
+
+class HistoryLoaderSignals(QObject):
+    """Arka plan taramasının sonuçlarını arayüz iş parçacığına taşır
+
+    Her sinyal taramanın kuşak (generation) numarasını da taşır; eski bir
+    taramadan gelen geç sinyaller alıcı tarafında yok sayılabilir.
+    """
+
+    # (kuşak, [(yol, özet, mtime, boyut), ...])
+    batch_ready = pyqtSignal(int, list)
+    # (kuşak, klasörde artık bulunmayan yollar)
+    finished = pyqtSignal(int, list)
+
+
+class HistoryLoader(QRunnable):
+    """Sonuç klasörünü tarayıp yeni/değişmiş kayıtları ayrıştıran iş
+
+    SQLite bağlantısı iş parçacıkları arasında paylaşılamadığı için dizine
+    yazmaz; bilinen (mtime, boyut) bilgileri başta verilir, ayrıştırılan
+    özetler ise parti parti sinyal ile gönderilir.
+    """
+
+    BATCH_SIZE = 100
+
+    def __init__(self, generation, known, results_dir=RESULTS_DIR, cache=None):
+        super().__init__()
+        self.generation = generation
+        self.known = dict(known)
+        self.results_dir = results_dir
+        # Verilirse kayıtlar paylaşılan önbellek üzerinden okunur
+        self.cache = cache
+        self.cancelled = False
+        self.signals = HistoryLoaderSignals()
+
+    def cancel(self):
+        """Taramayı durdur; yarım kalan parti gönderilmez"""
+        self.cancelled = True
+
+    def run(self):
+        known = self.known
+        batch = []
+
+        for path, mtime, size in scan_result_files(self.results_dir):
+            if self.cancelled:
+                return
+            fingerprint = known.pop(path, None)
+            if fingerprint == (mtime, size):
+                continue
+            try:
+                if self.cache is not None:
+                    record = self.cache.get(path, mtime, size)
+                else:
+                    record = load_record(path)
+            except Exception as e:
+                print(f"Error loading test result {path}: {e}")
+                continue
+            batch.append((path, summarize(record), mtime, size))
+            if len(batch) >= self.BATCH_SIZE:
+                self.signals.batch_ready.emit(self.generation, batch)
+                batch = []
+
+        if self.cancelled:
+            return
+        if batch:
+            self.signals.batch_ready.emit(self.generation, batch)
+        self.signals.finished.emit(self.generation, list(known))
+
+
+class DifficultyLoaderSignals(QObject):
+    """Soru zorluğu hesabının sonucunu arayüz iş parçacığına taşır"""
+
+    # Sonuç sözlüğü; soru detaylı deneme yoksa veya hesap başarısızsa None
+    finished = pyqtSignal(object)
+
+
+class DifficultyLoader(QRunnable):
+    """Aynı başlıklı denemelerden soru zorluğunu hesaplayan iş
+
+    Deneme listesi (dizin veya günlük sorgusu) arayüz iş parçacığında
+    alınıp verilir; burada yalnızca kayıtlar okunur ve matris hesaplanır.
+    Sonuçlar sınav başına paylaşılan önbellekte tutulur.
+    """
+
+    def __init__(self, title, attempts, read_data):
+        super().__init__()
+        self.title = title
+        self.attempts = attempts
+        self.read_data = read_data
+        self.signals = DifficultyLoaderSignals()
+
+    def run(self):
+        from exam_analysis import shared_difficulty_cache
+        try:
+            difficulty = shared_difficulty_cache().get(self.title, self.attempts, self.read_data)
+        except Exception as e:
+            print(f"Soru zorluğu hesaplanamadı: {e}")
+            difficulty = None
+        # Soru detaylı deneme yoksa sekme gösterilmez
+        if difficulty is not None and not difficulty['sessions']:
+            difficulty = None
+        self.signals.finished.emit(difficulty)
+
+
+class LogCompaction(QRunnable):
+    """Kayıt günlüğünü arka planda sıkıştıran iş"""
+
+    def __init__(self, results_log):
+        super().__init__()
+        self.results_log = results_log
+
+    def run(self):
+        try:
+            self.results_log.compact()
+        except Exception as e:
+            print(f"Günlük sıkıştırılamadı: {e}")
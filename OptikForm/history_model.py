@@ -0,0 +1,160 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor
+
+HEADERS = ['Test Adı', 'Puan', 'D/Y/B', 'Tarih']
+
+# Puan aralığına göre arka plan renkleri (alt sınır, renk)
+SCORE_BANDS = [
+    (85, QColor(200, 255, 200)),  # Light green
+    (70, QColor(220, 255, 220)),  # Lighter green
+    (60, QColor(255, 255, 200)),  # Light yellow
+    (50, QColor(255, 230, 200)),  # Light orange
+]
+LOWEST_BAND = QColor(255, 200, 200)  # Light red
+
+
+def score_color(score):
+    for lower_bound, color in SCORE_BANDS:
+        if score >= lower_bound:
+            return color
+    return LOWEST_BAND
+
+
+class HistoryModel(QAbstractTableModel):
+    """Test geçmişi; özetler kaydırdıkça sayfa sayfa dizinden okunur"""
+
+    PAGE_SIZE = 200
+
+    def __init__(self, results_index, parent=None):
+        super().__init__(parent)
+        self.results_index = results_index
+        self.rows = []
+        self.total = 0
+
+    def reload(self):
+        """Listeyi baştan yükle; ilk sayfa görünüm istediğinde okunur"""
+        self.beginResetModel()
+        self.rows = []
+        self.total = self.results_index.count()
+        self.endResetModel()
+
+    @staticmethod
+    def sort_key(summary):
+        return (summary['mtime'], summary['path'])
+
+    def insert_position(self, summary):
+        """Yeniden eskiye sıralı listede özetin gireceği satır"""
+        key = self.sort_key(summary)
+        low, high = 0, len(self.rows)
+        while low < high:
+            middle = (low + high) // 2
+            if self.sort_key(self.rows[middle]) > key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def row_of(self, path):
+        for row, summary in enumerate(self.rows):
+            if summary['path'] == path:
+                return row
+        return -1
+
+    def merge_rows(self, summaries):
+        """Dizine yeni yazılmış özetleri tabloya yerleştir
+
+        Yüklenmiş sayfaların arasına düşen satırlar hemen eklenir; daha
+        eskiler sırası gelince fetchMore ile dizinden okunur.
+        """
+        # Tablonun sonuna eklemek yalnızca dizinin tamamı yüklüyse sırayı bozmaz
+        fully_loaded = len(self.rows) >= self.total
+        # Yüklü satır sayısı büyümez; sona taşan satırlar fetchMore ile yeniden okunur
+        limit = max(len(self.rows), self.PAGE_SIZE)
+
+        for summary in summaries:
+            row = self.row_of(summary['path'])
+            if row >= 0:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.rows[row]
+                self.endRemoveRows()
+
+            position = self.insert_position(summary)
+            if position < len(self.rows) or fully_loaded:
+                self.beginInsertRows(QModelIndex(), position, position)
+                self.rows.insert(position, summary)
+                self.endInsertRows()
+
+        if len(self.rows) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self.rows) - 1)
+            del self.rows[limit:]
+            self.endRemoveRows()
+        self.total = max(len(self.rows), self.results_index.count())
+
+    def remove_paths(self, paths):
+        """Silinen kayıtların satırlarını çıkar; diğer satırlara dokunulmaz"""
+        paths = set(paths)
+        for row in range(len(self.rows) - 1, -1, -1):
+            if self.rows[row]['path'] in paths:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.rows[row]
+                self.endRemoveRows()
+        self.total = max(len(self.rows), self.results_index.count())
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return len(self.rows) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        page = self.results_index.page(self.PAGE_SIZE, self.rows[-1] if self.rows else None)
+        if not page:
+            # Dizin beklenenden kısa; daha fazla istenmesin
+            self.total = len(self.rows)
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+        self.rows.extend(page)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        data = self.rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return data['title']
+            if column == 1:
+                return f"{data['score']:.1f}"
+            if column == 2:
+                return f"{data['correct']}/{data['wrong']}/{data['empty']}"
+            return data['date']
+
+        if role == Qt.BackgroundRole and column == 1:
+            return score_color(data['score'])
+
+        return None
+
+    def path_at(self, row):
+        """Satırdaki kaydın dosya yolu"""
+        if 0 <= row < len(self.rows):
+            return self.rows[row]['path']
+        return None
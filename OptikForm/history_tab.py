@@ -0,0 +1,450 @@
+import os
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox,
+                            QSizePolicy, QTableView, QAbstractItemView, QHeaderView)
+from PyQt5.QtCore import QThreadPool, QTimer, QFileSystemWatcher
+from result_files import scan_result_files
+from results_index import shared_index
+from record_cache import shared_cache
+from history_model import HistoryModel
+from history_loader import HistoryLoader, DifficultyLoader, LogCompaction
+from course_stats import CourseStats
+
+class HistoryTab(QWidget):
+    # Klasör değişikliği bildiriminden sonra taramaya kadar beklenen süre
+    REFRESH_DELAY_MS = 300
+    
+    def __init__(self, parent=None, results_log=None):
+        super().__init__(parent)
+        self.main_layout = QVBoxLayout()
+        self.main_layout.setContentsMargins(3, 3, 3, 3)
+        self.main_layout.setSpacing(5)
+        self.setLayout(self.main_layout)
+        
+        # Table for showing test history
+        # Kayıt günlüğü verilirse özetler doğrudan onun dizininden okunur;
+        # klasör taranmaz ve izlenmez
+        self.results_log = results_log
+        if results_log is None:
+            # Özetler SQLite dizininden okunur; dosyalar yalnızca değiştiğinde ayrıştırılır
+            self.results_index = shared_index()
+            
+            # Ayrıştırılmış kayıtlar tablo ve detay penceresi arasında paylaşılır
+            self.record_cache = shared_cache()
+        
+        # Ders/sınav istatistikleri kayıt eklenip silindikçe artımlı güncellenir
+        self.course_stats = CourseStats(results_log.directory if results_log is not None
+                                        else self.results_index.results_dir)
+        self.course_stats_window = None
+        
+        # Satırlar kaydırdıkça sayfa sayfa yüklenir (fetchMore)
+        self.history_model = HistoryModel(results_log or self.results_index, self)
+        
+        self.table = QTableView()
+        self.table.setModel(self.history_model)
+        self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        
+        # Sütunların manuel olarak boyutlandırılabilmesi için:
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        
+        # İlk başta uygun genişlikler ayarla
+        self.table.setColumnWidth(0, 150)  # Test Adı - daha geniş
+        self.table.setColumnWidth(1, 50)   # Puan 
+        self.table.setColumnWidth(2, 70)   # D/Y/B
+        self.table.setColumnWidth(3, 90)   # Tarih
+        
+        # Son sütunun geri kalan alanı doldurmasını sağla
+        self.table.horizontalHeader().setStretchLastSection(True)
+        
+        self.table.setStyleSheet("""
+            QTableView {
+                background-color: white;
+                border: 1px solid #ddd;
+                border-radius: 5px;
+                font-size: 11px;
+            }
+            QHeaderView::section {
+                background-color: #f0f0f0;
+                padding: 3px;
+                border: 1px solid #ddd;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QTableView::item {
+                padding: 2px;
+            }
+            QTableView::item:selected {
+                background-color: #e0f2f1;
+                color: black;
+            }
+        """)
+        self.main_layout.addWidget(self.table)
+        
+        # Çift tıklamayı bağla
+        self.table.doubleClicked.connect(self.open_test_details)
+        
+        # Butonlar
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setSpacing(3)
+        
+        # Yenile butonu
+        self.refresh_button = QPushButton("Yenile")
+        self.refresh_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.refresh_button.setStyleSheet("""
+            QPushButton {
+                background-color: #f0f0f0;
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 3px 5px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+        """)
+        self.refresh_button.clicked.connect(self.load_history)
+        buttons_layout.addWidget(self.refresh_button)
+        
+        # Detay Göster butonu
+        self.show_details_button = QPushButton("Detayları Göster")
+        self.show_details_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.show_details_button.setStyleSheet("""
+            QPushButton {
+                background-color: #2196F3;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 3px 5px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: #1976D2;
+            }
+        """)
+        self.show_details_button.clicked.connect(self.show_selected_test_details)
+        buttons_layout.addWidget(self.show_details_button)
+        
+        # Ders Analizi butonu
+        self.course_stats_button = QPushButton("Ders Analizi")
+        self.course_stats_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.course_stats_button.setStyleSheet("""
+            QPushButton {
+                background-color: #4CAF50;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 3px 5px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: #388E3C;
+            }
+        """)
+        self.course_stats_button.clicked.connect(self.show_course_stats)
+        buttons_layout.addWidget(self.course_stats_button)
+        
+        # Sil butonu
+        self.delete_button = QPushButton("Seçili Testi Sil")
+        self.delete_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.delete_button.setStyleSheet("""
+            QPushButton {
+                background-color: #f44336;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 3px 5px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: #d32f2f;
+            }
+        """)
+        self.delete_button.clicked.connect(self.delete_selected_test)
+        buttons_layout.addWidget(self.delete_button)
+        
+        # Tüm Kayıtları Sil butonu
+        self.delete_all_button = QPushButton("Tüm Test Geçmişini Sil")
+        self.delete_all_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.delete_all_button.setStyleSheet("""
+            QPushButton {
+                background-color: #d32f2f;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 3px 5px;
+                font-weight: bold;
+                font-size: 11px;
+            }
+            QPushButton:hover {
+                background-color: #b71c1c;
+            }
+        """)
+        self.delete_all_button.clicked.connect(self.delete_all_tests)
+        buttons_layout.addWidget(self.delete_all_button)
+        
+        self.main_layout.addLayout(buttons_layout)
+        
+        # Klasör taraması arka planda yapılır; yenisi başlarken eskisi iptal edilir
+        self.loader = None
+        self.loader_generation = 0
+        
+        if results_log is not None:
+            self.history_model.reload()
+            self.check_course_stats()
+            return
+        
+        # Klasördeki değişiklikler izlenir; art arda gelen bildirimler tek taramada toplanır.
+        # Tarama yalnızca (mtime, boyut) bilgisi değişen dosyaları yeniden okur.
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self.refresh_timer.timeout.connect(self.load_history)
+        
+        self.watcher = QFileSystemWatcher(self)
+        if os.path.isdir(self.results_index.results_dir):
+            self.watcher.addPath(self.results_index.results_dir)
+        self.watcher.directoryChanged.connect(self.schedule_refresh)
+        
+        # Dizindeki özetler hemen gösterilir, klasördeki değişiklikler tarama bitince gelir
+        self.history_model.reload()
+        self.load_history()
+    
+    def schedule_refresh(self, path=None):
+        """Klasör değiştiğinde kısa bir beklemeden sonra tara"""
+        self.refresh_timer.start()
+    
+    def load_history(self):
+        """Sonuç klasörünü arka planda tara; yeni/değişmiş kayıtlar parti parti eklenir"""
+        if self.results_log is not None:
+            self.history_model.reload()
+            return
+        
+        self.refresh_timer.stop()
+        self.stop_loading()
+        self.loader_generation += 1
+        
+        loader = HistoryLoader(self.loader_generation, self.results_index.fingerprints(),
+                               self.results_index.results_dir, self.record_cache)
+        loader.signals.batch_ready.connect(self.on_history_batch)
+        loader.signals.finished.connect(self.on_history_finished)
+        self.loader = loader
+        
+        self.refresh_button.setText("Yenileniyor...")
+        QThreadPool.globalInstance().start(loader)
+    
+    def stop_loading(self):
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader = None
+            self.refresh_button.setText("Yenile")
+    
+    def on_history_batch(self, generation, items):
+        # İptal edilmiş taramadan gelen geç partiler yok sayılır
+        if generation != self.loader_generation:
+            return
+        rows = self.results_index.store(items)
+        self.course_stats.add(rows)
+        self.history_model.merge_rows(rows)
+        self.course_stats_changed()
+    
+    def on_result_saved(self, key):
+        """Günlüğe eklenen kaydı tabloya yerleştir (dosya deposunda izleyici ekler)"""
+        if self.results_log is not None:
+            summary = self.results_log.summary(key)
+            self.course_stats.add([summary])
+            self.history_model.merge_rows([summary])
+            self.course_stats_changed()
+    
+    def compact_log_if_needed(self):
+        """Silmelerden sonra ölü veri çoğaldıysa günlüğü arka planda sıkıştır"""
+        if self.results_log is not None and self.results_log.needs_compaction():
+            QThreadPool.globalInstance().start(LogCompaction(self.results_log))
+    
+    def on_history_finished(self, generation, removed):
+        if generation != self.loader_generation:
+            return
+        if removed:
+            self.results_index.remove(removed)
+            self.record_cache.invalidate(removed)
+            self.course_stats.remove(removed)
+            self.history_model.remove_paths(removed)
+            self.course_stats_changed()
+        self.loader = None
+        self.refresh_button.setText("Yenile")
+        self.check_course_stats()
+    
+    def check_course_stats(self):
+        """İstatistikler dizinle uyuşmuyorsa (ilk açılış, yarım kalan yazma) özetlerden yeniden kur"""
+        store = self.results_log if self.results_log is not None else self.results_index
+        count = store.count()
+        if self.course_stats.count() == count:
+            return
+        if self.results_log is not None:
+            summaries = self.results_log.page(count)
+        else:
+            summaries = self.results_index.summaries()
+        self.course_stats.rebuild(summaries)
+        self.course_stats_changed()
+    
+    def course_stats_changed(self):
+        if self.course_stats_window is not None and self.course_stats_window.isVisible():
+            self.course_stats_window.refresh()
+    
+    def show_course_stats(self):
+        """Ders ve sınav türüne göre gruplanmış istatistikleri göster"""
+        if self.course_stats_window is None:
+            # Pencere modülü ilk açılışta yüklenir
+            from course_stats_window import CourseStatsWindow
+            self.course_stats_window = CourseStatsWindow(self.course_stats, self)
+        else:
+            self.course_stats_window.refresh()
+        self.course_stats_window.show()
+        self.course_stats_window.raise_()
+    
+    def delete_selected_test(self):
+        file_path = self.history_model.path_at(self.table.currentIndex().row())
+        if file_path:
+            
+            reply = QMessageBox.question(
+                self, 'Testi Sil',
+                'Seçili testi silmek istediğinize emin misiniz?',
+                QMessageBox.Yes | QMessageBox.No
+            )
+            
+            if reply == QMessageBox.Yes:
+                try:
+                    if self.results_log is not None:
+                        self.results_log.delete(file_path)
+                        self.compact_log_if_needed()
+                    else:
+                        os.remove(file_path)
+                        self.results_index.remove(file_path)
+                        self.record_cache.invalidate(file_path)
+                    self.course_stats.remove(file_path)
+                    self.history_model.remove_paths([file_path])
+                    self.course_stats_changed()
+                    QMessageBox.information(self, "Başarılı", "Test başarıyla silindi.", QMessageBox.Ok)
+                except Exception as e:
+                    QMessageBox.warning(self, "Hata", f"Test silinirken hata oluştu: {e}", QMessageBox.Ok)
+    
+    def delete_all_tests(self):
+        if self.results_log is not None:
+            test_files = None
+            test_count = self.results_log.count()
+        else:
+            # Test dosyalarını yeniden yükle - en güncel listeyi almak için
+            results_dir = self.results_index.results_dir
+            if not os.path.exists(results_dir):
+                QMessageBox.information(self, "Bilgi", "Silinecek test kaydı bulunmamaktadır.", QMessageBox.Ok)
+                return
+                
+            # Yeniden dosyaları oku
+            test_files = [path for path, mtime, size in scan_result_files(results_dir)]
+            test_count = len(test_files)
+        
+        if test_count == 0:
+            QMessageBox.information(self, "Bilgi", "Silinecek test kaydı bulunmamaktadır.", QMessageBox.Ok)
+            return
+            
+        reply = QMessageBox.question(
+            self, 'Tüm Test Geçmişini Sil',
+            'TÜM test kayıtlarını silmek istediğinize emin misiniz? Bu işlem geri alınamaz!',
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            confirm_reply = QMessageBox.warning(
+                self, 'Son Uyarı',
+                'Bu işlem TÜM test kayıtlarınızı KALICI olarak silecektir. Devam etmek istiyor musunuz?',
+                QMessageBox.Yes | QMessageBox.No
+            )
+            
+            if confirm_reply == QMessageBox.Yes:
+                if self.results_log is not None:
+                    try:
+                        # Tek bir CLEAR çerçevesi; eski segmentler sıkıştırmada silinir
+                        self.results_log.clear()
+                        self.course_stats.clear()
+                        self.history_model.reload()
+                        self.course_stats_changed()
+                        self.compact_log_if_needed()
+                        QMessageBox.information(self, "Başarılı", "Tüm test kayıtları başarıyla silindi.", QMessageBox.Ok)
+                    except Exception as e:
+                        QMessageBox.warning(self, "Hata", f"Testler silinirken bir hata oluştu: {e}", QMessageBox.Ok)
+                    return
+                
+                error_count = 0
+                try:
+                    removed = []
+                    for file_path in test_files:
+                        try:
+                            os.remove(file_path)
+                            removed.append(file_path)
+                        except Exception as e:
+                            print(f"Dosya silinirken hata: {file_path}, {str(e)}")
+                            error_count += 1
+                    
+                    self.results_index.remove(removed)
+                    self.record_cache.invalidate(removed)
+                    self.course_stats.remove(removed)
+                    self.history_model.remove_paths(removed)
+                    self.course_stats_changed()
+                    
+                    if error_count > 0:
+                        QMessageBox.warning(self, "Kısmi Başarı", f"{len(test_files) - error_count} test kaydı silindi, {error_count} kayıt silinemedi.", QMessageBox.Ok)
+                    else:
+                        QMessageBox.information(self, "Başarılı", "Tüm test kayıtları başarıyla silindi.", QMessageBox.Ok)
+                except Exception as e:
+                    QMessageBox.warning(self, "Hata", f"Testler silinirken bir hata oluştu: {e}", QMessageBox.Ok)
+
+    def show_selected_test_details(self):
+        """Seçili testin detaylarını göster"""
+        current_index = self.table.currentIndex()
+        if current_index.isValid():
+            self.open_test_details(current_index)
+    
+    def load_difficulty(self, window, title):
+        """Aynı başlıklı tüm denemelerden soru zorluğunu arka planda hesapla; bitince pencerede gösterilir"""
+        from exam_analysis import read_file
+        try:
+            if self.results_log is not None:
+                attempts, read_data = self.results_log.attempts(title), self.results_log.load_data
+            else:
+                attempts, read_data = self.results_index.attempts(title), read_file
+        except Exception as e:
+            print(f"Soru zorluğu hesaplanamadı: {e}")
+            return
+        
+        loader = DifficultyLoader(title, attempts, read_data)
+        loader.signals.finished.connect(window.show_difficulty)
+        # Sinyal nesnesi iş bitene kadar pencereyle birlikte yaşar
+        window.difficulty_loader = loader
+        QThreadPool.globalInstance().start(loader)
+    
+    def open_test_details(self, index):
+        """Test detaylarını göster"""
+        file_path = self.history_model.path_at(index.row())
+        if file_path:
+            
+            try:
+                if self.results_log is not None:
+                    test_data = self.results_log.load(file_path)
+                else:
+                    test_data = self.record_cache.get(file_path)
+                
+                # Detay penceresi modülü ilk açılışta yüklenir
+                from detail_window import TestDetailWindow
+                
+                # Test detaylarını göster
+                test_window = TestDetailWindow(test_data, self)
+                test_window.show()
+                self.load_difficulty(test_window, test_data.get('title', ''))
+            except Exception as e:
+                QMessageBox.warning(self, "Hata", f"Test detayları yüklenirken bir sorun oluştu: {e}", QMessageBox.Ok)
@@ -1,127 +1,89 @@
+import startup_trace
 import sys
 import os
-import json
 import datetime
-import glob
-import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                            QHBoxLayout, QLabel, QPushButton, QGridLayout, 
-                            QScrollArea, QTabWidget, QLineEdit, QComboBox, 
-                            QMessageBox, QFrame, QSizePolicy, QTableWidget,
-                            QTableWidgetItem, QHeaderView, QSplitter)
-from PyQt5.QtCore import Qt, QSize, QRect
-from PyQt5.QtGui import QIcon, QFont, QColor, QPixmap, QPainter, QPen
+                            QHBoxLayout, QLabel, QPushButton, QAbstractButton, 
+                            QAbstractScrollArea, QLineEdit, QComboBox, 
+                            QSpinBox, QMessageBox, QInputDialog, QFileDialog, QFrame,
+                            QSizePolicy, QSplitter)
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QFont, QColor, QPainter, QPen
+startup_trace.mark("Qt modülleri")
+from answer_sheet import AnswerSheet
+from scoring import compute_score
+from answer_grid import AnswerSheetModel, AnswerSheetView
+from theme import apply_theme, set_style_property
+from bubbles import bubble_pixmap
+from result_files import RESULTS_DIR, result_path, save_record
+from result_writer import shared_writer
+from autosave import AutosaveJournal, read_journal
+# Geçmiş paneli (history_tab) ve detay penceresi (detail_window) ilk kullanımda yüklenir
+startup_trace.mark("uygulama modülleri")
 
-class OptionButton(QPushButton):
+class OptionButton(QAbstractButton):
+    """Stil sayfası kullanmadan, önbellekteki balon resmiyle çizilen şık butonu"""
+    
     def __init__(self, text, parent=None):
-        super().__init__(text, parent)
+        super().__init__(parent)
+        self.setText(text)
         self.setCheckable(True)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(25, 25)
         self.setMaximumSize(30, 30)
+        self.setAttribute(Qt.WA_Hover, True)  # Üzerine gelince yeniden çiz
+        self.setCursor(Qt.PointingHandCursor)
         
-        self.setStyleSheet("""
-            QPushButton {
-                border: 1px solid #ccc;
-                border-radius: 15px;
-                padding: 0px;
-                background-color: #f8f9fa;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:checked {
-                background-color: #4CAF50;
-                color: white;
-                border-color: #388E3C;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-            }
-        """)
+        self.is_selected = False
+        self.state = "unmarked"
+        self.is_scribbled = False
+        self.scribble_color = None
+    
+    def sizeHint(self):
+        return QSize(30, 30)
+    
+    def set_visual(self, selected, state):
+        """Seçim ve durum değiştiyse yeniden çiz"""
+        if selected == self.is_selected and state == self.state:
+            return
+        self.is_selected = selected
+        self.state = state
+        self.update()
     
     def set_scribbled(self, scribbled, color=None):
         """Karalama efektini etkinleştir/devre dışı bırak"""
         self.is_scribbled = scribbled
-        
-        if scribbled:
-            self.scribble_color = color or QColor(255, 0, 0)  # Varsayılan kırmızı
-            self.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #ccc;
-                    border-radius: 15px;
-                    padding: 0px;
-                    background-color: #f8f9fa;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-color: #388E3C;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-                """)
-            # Karalama efekti için arka plan rengini değiştir
-            if self.is_scribbled:
-                color_str = f"rgb({self.scribble_color.red()}, {self.scribble_color.green()}, {self.scribble_color.blue()})"
-                self.setStyleSheet(f"""
-                    QPushButton {{
-                        border: 2px solid {color_str};
-                        border-radius: 15px;
-                        padding: 0px;
-                        background-color: {color_str};
-                        font-weight: bold;
-                        font-size: 11px;
-                        color: white;
-                    }}
-                    QPushButton:checked {{
-                        background-color: {color_str};
-                        color: white;
-                        border-color: {color_str};
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color_str};
-                        opacity: 0.8;
-                    }}
-                """)
-        else:
-            # Normal stil
-            self.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #ccc;
-                    border-radius: 15px;
-                    padding: 0px;
-                    background-color: #f8f9fa;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-color: #388E3C;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-            """)
+        self.scribble_color = color or QColor(255, 0, 0)  # Varsayılan kırmızı
         
         # Güncelleme için yeniden çiz
         self.update()
+    
+    def paintEvent(self, event):
+        if self.is_scribbled:
+            kind = "scribble"
+        elif self.is_selected:
+            kind = self.state
+        elif self.underMouse():
+            kind = "hover"
+        else:
+            kind = "normal"
+        
+        size = min(self.width(), self.height())
+        pixmap = bubble_pixmap(kind, self.text(), size, self.devicePixelRatioF(),
+                               self.scribble_color if self.is_scribbled else None)
+        
+        painter = QPainter(self)
+        painter.drawPixmap((self.width() - size) // 2, (self.height() - size) // 2, pixmap)
+        painter.end()
 
 class Question(QWidget):
+    """Bir soru satırının görünümü; durum AnswerSheet'te tutulur"""
+    
     def __init__(self, question_number, parent=None):
         super().__init__(parent)
         self.question_number = question_number
-        self.selected_option = None
-        self.correct_answer = None
-        self.is_locked = False
-        self.is_correct = False
-        self.is_checked = False
-        self.was_empty = False
-        self.test_tab = None  # TestTab referansı
-        self.state = "unmarked"  # unmarked, correct, wrong, empty olabilir
+        self.model = None  # Bağlı olduğu AnswerSheetModel
+        self.index = None  # Modeldeki satır
         
         main_layout = QHBoxLayout()
         main_layout.setContentsMargins(5, 5, 5, 5)  # Daha az boşluk
@@ -170,607 +132,184 @@ class Question(QWidget):
         indicators_layout.setContentsMargins(0, 0, 0, 0)
         indicators_layout.setSpacing(3)
         
-        # Doğru işaret
-        self.correct_btn = QPushButton("✓")
-        self.correct_btn.setMinimumSize(20, 20)
-        self.correct_btn.setMaximumSize(25, 25)
-        self.correct_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.correct_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #4CAF50;
-                color: white;
-            }
-        """)
-        self.correct_btn.setToolTip("Doğru olarak işaretle")
-        self.correct_btn.clicked.connect(lambda: self.mark_state("correct"))
-        indicators_layout.addWidget(self.correct_btn)
-        
-        # Yanlış işaret
-        self.wrong_btn = QPushButton("✗")
-        self.wrong_btn.setMinimumSize(20, 20)
-        self.wrong_btn.setMaximumSize(25, 25)
-        self.wrong_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.wrong_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #f44336;
-                color: white;
-            }
-        """)
-        self.wrong_btn.setToolTip("Yanlış olarak işaretle")
-        self.wrong_btn.clicked.connect(lambda: self.mark_state("wrong"))
-        indicators_layout.addWidget(self.wrong_btn)
-        
-        # Boş işaret
-        self.empty_btn = QPushButton("○")
-        self.empty_btn.setMinimumSize(20, 20)
-        self.empty_btn.setMaximumSize(25, 25)
-        self.empty_btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.empty_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2196F3;
-                color: white;
-            }
-        """)
-        self.empty_btn.setToolTip("Boş olarak işaretle")
-        self.empty_btn.clicked.connect(lambda: self.mark_state("empty"))
-        indicators_layout.addWidget(self.empty_btn)
+        self.indicators = {}
+        for state, symbol, tooltip in [("correct", "✓", "Doğru olarak işaretle"),
+                                       ("wrong", "✗", "Yanlış olarak işaretle"),
+                                       ("empty", "○", "Boş olarak işaretle")]:
+            btn = QPushButton(symbol)
+            btn.setMinimumSize(20, 20)
+            btn.setMaximumSize(25, 25)
+            btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            btn.setProperty("indicator", state)
+            btn.setProperty("active", False)
+            btn.setToolTip(tooltip)
+            btn.clicked.connect(lambda checked, s=state: self.mark_state(s))
+            self.indicators[state] = btn
+            indicators_layout.addWidget(btn)
+        
+        self.correct_btn = self.indicators["correct"]
+        self.wrong_btn = self.indicators["wrong"]
+        self.empty_btn = self.indicators["empty"]
         
         main_layout.addWidget(self.indicators_container)
         
-        # Arka planı hafif gri yapalım
-        self.setStyleSheet("background-color: #f5f5f5; border-radius: 5px;")
+        # Arka plan uygulama stil sayfasındaki Question kuralından gelir
+        self.setAttribute(Qt.WA_StyledBackground, True)
         
         # Layout boşluklarını ayarlayalım
         main_layout.setStretch(0, 1)  # Soru numarası
         main_layout.setStretch(1, 3)  # Şıklar
         main_layout.setStretch(2, 2)  # Durum göstergeleri
+    
+    def bind(self, model, index):
+        """Widget'ı bir soruya bağla (kaydırma sırasında yeniden kullanılır)"""
+        self.model = model
+        self.index = index
+        if index + 1 != self.question_number:
+            self.question_number = index + 1
+            self.question_label.setText(f"{self.question_number}.")
+        self.refresh()
+    
+    def unbind(self):
+        self.model = None
+        self.index = None
         
     def select_option(self, option):
-        # Eğer kilitliyse ve boş değilse şık seçimi devre dışı
-        if self.is_locked and self.state != "empty":
-            return
+        if self.model is not None:
+            self.model.select_option(self.index, option)
         
-        # Eğer doğru veya yanlış işaretlendiyse değiştirme
-        if self.state == "correct" or self.state == "wrong":
-            return
-            
-        # Eğer aynı şık tekrar tıklanırsa, seçimi kaldır
-        if self.selected_option == option:
-            # Seçimi temizle
-            self.selected_option = None
-            
-            # Tüm şıkları normale çevir
-            for opt, btn in self.options.items():
-                btn.setChecked(False)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        border: 1px solid #ccc;
-                        border-radius: 15px;
-                        padding: 0px;
-                        background-color: #f8f9fa;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #4CAF50;
-                        color: white;
-                        border-color: #388E3C;
-                    }
-                    QPushButton:hover {
-                        background-color: #e9ecef;
-                    }
-                """)
-            
-            # TestTab'ı bilgilendir
-            if self.test_tab:
-                self.test_tab.calculate_and_show_results()
-            return
-            
-        # Eğer durum boş olarak işaretlendiyse, özel durumu ele al
-        if self.state == "empty":
-            # Önce diğer tüm şıkları temizle
-            for opt, btn in self.options.items():
-                if opt != option:
-                    btn.setChecked(False)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            border: 1px solid #ccc;
-                            border-radius: 15px;
-                            padding: 0px;
-                            background-color: #f8f9fa;
-                            font-weight: bold;
-                            font-size: 11px;
-                        }
-                        QPushButton:checked {
-                            background-color: #4CAF50;
-                            color: white;
-                            border-color: #388E3C;
-                        }
-                        QPushButton:hover {
-                            background-color: #e9ecef;
-                        }
-                    """)
-                
-            # Şimdi seçilen şıkkı işaretle ve mavi yap
-            self.options[option].setChecked(True)
-            self.options[option].setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border: 1px solid #ccc;
-                    border-radius: 15px;
-                    padding: 0px;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:checked {
-                    background-color: #2196F3;
-                    color: white;
-                    border-color: #1565C0;
-                }
-            """)
-            
-            self.selected_option = option
-            
-            # TestTab'ı bilgilendir
-            if self.test_tab:
-                self.test_tab.calculate_and_show_results()
-            
-            return
-            
-        # Normal şık seçimi (boş değilse)
-        if self.state != "empty":
-            # Eğer yanlış olarak işaretlendiyse
-            if self.state == "wrong" and self.selected_option:
-                # Yanlış işaretli şıkkı kırmızıda bırak
-                # Ve doğru şıkkı işaretle
-                self.correct_answer = option
-                self.options[option].setChecked(True)
-                self.options[option].setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: 1px solid #ddd;
-                        border-radius: 15px;
-                        padding: 0px;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #4CAF50;
-                        color: white;
-                        border-color: #388E3C;
-                    }
-                """)
-                return
-                
-            # Normal şık seçimi - önceki seçimleri temizle
-            for opt, btn in self.options.items():
-                if opt != option:
-                    btn.setChecked(False)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            border: 1px solid #ccc;
-                            border-radius: 15px;
-                            padding: 0px;
-                            background-color: #f8f9fa;
-                            font-weight: bold;
-                            font-size: 11px;
-                        }
-                        QPushButton:checked {
-                            background-color: #4CAF50;
-                            color: white;
-                            border-color: #388E3C;
-                        }
-                        QPushButton:hover {
-                            background-color: #e9ecef;
-                        }
-                    """)
-                else:
-                    btn.setChecked(True)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #4CAF50;
-                            color: white;
-                            border: 1px solid #ddd;
-                            border-radius: 15px;
-                            padding: 0px;
-                            font-weight: bold;
-                            font-size: 11px;
-                        }
-                        QPushButton:checked {
-                            background-color: #4CAF50;
-                            color: white;
-                            border-color: #388E3C;
-                        }
-                    """)
-                    
-            self.selected_option = option
-            self.options[option].setChecked(True)
+        # Reddedilen tıklamalarda da Qt'nin değiştirdiği checked durumunu geri al
+        self.refresh()
     
     def mark_state(self, state):
         """Sorunun durumunu işaretle (doğru, yanlış, boş)"""
+        if self.model is not None:
+            self.model.mark_state(self.index, state)
+    
+    def refresh(self):
+        """Butonları bağlı sorunun durumuna göre güncelle"""
+        if self.model is not None:
+            state = self.model.sheet.state(self.index)
+            selected = self.model.sheet.selected_option(self.index)
+        else:
+            state = "unmarked"
+            selected = None
         
-        # Eğer aynı duruma tekrar tıklandıysa, durumu normale döndür
-        if self.state == state:
-            # Durumu sıfırla (unmarked)
-            self.state = "unmarked"
-            
-            # Tüm gösterge butonlarını normale döndür
-            self.correct_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #4CAF50;
-                    color: white;
-                }
-            """)
-            self.wrong_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #f44336;
-                    color: white;
-                }
-            """)
-            self.empty_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #9e9e9e;
-                    color: white;
-                }
-            """)
-            
-            # Seçilen şıkkı normal yap (eğer varsa)
-            if self.selected_option:
-                # Normal seçili şık stili
-                self.options[self.selected_option].setChecked(True)
-                self.options[self.selected_option].setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: 1px solid #ddd;
-                        border-radius: 15px;
-                        padding: 0px;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #4CAF50;
-                        color: white;
-                        border-color: #388E3C;
-                    }
-                """)
-            
-            # TestTab'ı bilgilendir
-            if self.test_tab:
-                self.test_tab.calculate_and_show_results()
-                
-            return
-            
-        # Normal state değiştirme (farklı bir state seçildiğinde)
-        self.state = state
+        for opt, btn in self.options.items():
+            is_selected = opt == selected
+            btn.setChecked(is_selected)
+            btn.set_visual(is_selected, state)
         
-        # İşaretlerine göre butonların renklerini güncelle
-        if state == "correct":
-            self.correct_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-            """)
-            self.wrong_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #f44336;
-                    color: white;
-                }
-            """)
-            self.empty_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #9e9e9e;
-                    color: white;
-                }
-            """)
-            
-            # Seçilen şıkkı yeşil yap
-            if self.selected_option:
-                self.correct_answer = self.selected_option
-                self.is_correct = True
-                self.options[self.selected_option].setStyleSheet("""
-                    QPushButton {
-                        background-color: #4CAF50;
-                        color: white;
-                        border: 1px solid #ddd;
-                        border-radius: 15px;
-                        padding: 0px;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #4CAF50;
-                        color: white;
-                        border-color: #388E3C;
-                    }
-                """)
-        
-        elif state == "wrong":
-            self.correct_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #4CAF50;
-                    color: white;
-                }
-            """)
-            self.wrong_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f44336;
-                    color: white;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-            """)
-            self.empty_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #9e9e9e;
-                    color: white;
-                }
-            """)
-            
-            # Seçilen şıkkı kırmızı yap
-            if self.selected_option:
-                self.is_correct = False
-                self.options[self.selected_option].setStyleSheet("""
-                    QPushButton {
-                        background-color: #f44336;
-                        color: white;
-                        border: 1px solid #ddd;
-                        border-radius: 15px;
-                        padding: 0px;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #f44336;
-                        color: white;
-                        border-color: #B71C1C;
-                    }
-                """)
-        
-        elif state == "empty":
-            self.correct_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #4CAF50;
-                    color: white;
-                }
-            """)
-            self.wrong_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #e0e0e0;
-                    color: #333;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-                QPushButton:hover {
-                    background-color: #f44336;
-                    color: white;
-                }
-            """)
-            self.empty_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2196F3;
-                    color: white;
-                    border-radius: 12px;
-                    font-weight: bold;
-                    font-size: 14px;
-                }
-            """)
-            
-            # Eğer seçilmiş bir şık varsa onu mavi yap
-            if self.selected_option:
-                self.options[self.selected_option].setStyleSheet("""
-                    QPushButton {
-                        background-color: #2196F3;
-                        color: white;
-                        border: 1px solid #ccc;
-                        border-radius: 15px;
-                        padding: 0px;
-                        font-weight: bold;
-                        font-size: 11px;
-                    }
-                    QPushButton:checked {
-                        background-color: #2196F3;
-                        color: white;
-                        border-color: #1565C0;
-                    }
-                """)
-            
-            # Diğer şıkları sıfırla
-            for opt, btn in self.options.items():
-                if opt != self.selected_option:
-                    btn.setChecked(False)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            border: 1px solid #ccc;
-                            border-radius: 15px;
-                            padding: 0px;
-                            background-color: #f8f9fa;
-                            font-weight: bold;
-                            font-size: 11px;
-                        }
-                        QPushButton:checked {
-                            background-color: #4CAF50;
-                            color: white;
-                            border-color: #388E3C;
-                        }
-                        QPushButton:hover {
-                            background-color: #e9ecef;
-                        }
-                    """)
-            
-            self.is_correct = False
-            self.was_empty = True
-            
-        # TestTab'ı bilgilendir
-        if self.test_tab:
-            self.test_tab.calculate_and_show_results()
+        for kind, btn in self.indicators.items():
+            set_style_property(btn, "active", state == kind)
+
+class QuestionListArea(QAbstractScrollArea):
+    """Yalnızca görünen sorular için widget tutan, kaydırdıkça onları yeniden kullanan alan"""
     
-    def lock_options(self):
-        """Sınavı bitir işlemi - sadece durumu kaydet, değişiklik yapma"""
-        self.is_locked = True
-        
-    def reset(self):
-        """Soruyu sıfırla"""
-        self.selected_option = None
-        self.correct_answer = None
-        self.is_locked = False
-        self.is_correct = False
-        self.is_checked = False
-        self.was_empty = False
-        self.state = "unmarked"
+    ROW_HEIGHT = 46  # Soru yüksekliği + ayırıcı çizgi
+    QUESTION_HEIGHT = 40
+    
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.pool = []  # Yeniden kullanılan Question widget'ları
         
-        # Şıkları sıfırla
-        for opt, btn in self.options.items():
-            btn.setChecked(False)
-            btn.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #ccc;
-                    border-radius: 15px;
-                    padding: 0px;
-                    background-color: #f8f9fa;
-                    font-weight: bold;
-                    font-size: 11px;
-                }
-                QPushButton:checked {
-                    background-color: #4CAF50;
-                    color: white;
-                    border-color: #388E3C;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-            """)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(self.ROW_HEIGHT // 2)
+        self.verticalScrollBar().valueChanged.connect(self.layout_rows)
         
-        # İşaretleri sıfırla
-        self.correct_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #4CAF50;
-                color: white;
-            }
-        """)
-        self.wrong_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #f44336;
-                color: white;
-            }
-        """)
-        self.empty_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e0e0e0;
-                color: #333;
-                border-radius: 12px;
-                font-weight: bold;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #9e9e9e;
-                color: white;
-            }
-        """)
+        self.model.dataChanged.connect(self.on_data_changed)
+        self.model.modelReset.connect(self.update_rows)
+        self.model.rowsInserted.connect(self.update_rows)
+        self.model.rowsRemoved.connect(self.update_rows)
+    
+    def update_rows(self, *args):
+        """Satır sayısı değiştiğinde kaydırma aralığını ve widget'ları güncelle"""
+        total_height = len(self.model.sheet) * self.ROW_HEIGHT
+        page = self.viewport().height()
+        self.verticalScrollBar().setPageStep(page)
+        self.verticalScrollBar().setRange(0, max(0, total_height - page))
+        self.layout_rows()
+    
+    def ensure_pool(self):
+        """Görünür alanı dolduracak kadar Question widget'ı oluştur"""
+        needed = self.viewport().height() // self.ROW_HEIGHT + 2
+        while len(self.pool) < needed:
+            question = Question(len(self.pool) + 1, self.viewport())
+            question.hide()
+            self.pool.append(question)
+    
+    def layout_rows(self, *args):
+        self.ensure_pool()
+        offset = self.verticalScrollBar().value()
+        first = offset // self.ROW_HEIGHT
+        shift = offset % self.ROW_HEIGHT
+        width = self.viewport().width()
+        count = len(self.model.sheet)
+        
+        for k, question in enumerate(self.pool):
+            index = first + k
+            if index < count:
+                question.bind(self.model, index)
+                question.setGeometry(3, k * self.ROW_HEIGHT - shift + 3, width - 6, self.QUESTION_HEIGHT)
+                question.show()
+            else:
+                question.unbind()
+                question.hide()
+        
+        self.viewport().update()
+    
+    def on_data_changed(self, top_left, bottom_right, roles=None):
+        top = top_left.row()
+        bottom = bottom_right.row()
+        for question in self.pool:
+            if question.index is not None and top <= question.index <= bottom:
+                question.refresh()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_rows()
+    
+    def paintEvent(self, event):
+        # Sorular arasındaki ince ayırıcı çizgiler
+        painter = QPainter(self.viewport())
+        painter.setPen(QPen(QColor("#e0e0e0"), 1))
+        offset = self.verticalScrollBar().value()
+        first = offset // self.ROW_HEIGHT
+        shift = offset % self.ROW_HEIGHT
+        width = self.viewport().width()
+        last = len(self.model.sheet) - 1
+        
+        for k in range(len(self.pool)):
+            if first + k >= last:
+                break
+            y = (k + 1) * self.ROW_HEIGHT - shift
+            painter.drawLine(3, y, width - 3, y)
+        painter.end()
 
 class TestTab(QWidget):
-    def __init__(self, parent=None):
+    # Soru görünümü: "widgets" her soru için ayrı widget ağacı kurar,
+    # "grid" ise model/view ile sabit sayıda widget kullanır
+    ENGINES = ("widgets", "grid")
+
+    MAX_QUESTIONS = 2000
+
+    # Kaydedilen sonucun yolu (günlük deposunda kayıt anahtarı)
+    result_saved = pyqtSignal(str)
+
+    def __init__(self, parent=None, engine="widgets", question_count=20, results_log=None):
         super().__init__(parent)
-        self.questions = []
+        if engine not in self.ENGINES:
+            raise ValueError(f"Bilinmeyen görünüm: {engine}")
+        self.engine = engine
+        # Verilirse sonuçlar tek tek dosyalar yerine kayıt günlüğüne eklenir
+        self.results_log = results_log
+        
+        # Kayıtlar arka planda yazılır; tamamlanınca on_save_finished çağrılır
+        self.writer = shared_writer()
+        self.writer.finished.connect(self.on_save_finished)
+        self.pending_save = None
+        self.question_count = question_count
         self.is_test_completed = False
         self.wrong_ratio = 4  # Default: 4 wrong answers cancel 1 correct
         self.test_saved = False  # Test kaydedildi mi?
@@ -852,64 +391,116 @@ class TestTab(QWidget):
         
         settings_layout.addWidget(ratio_container, 2)
         
+        # Soru sayısı ayarı
+        count_container = QWidget()
+        count_container.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
+        count_layout = QHBoxLayout(count_container)
+        count_layout.setContentsMargins(0, 0, 0, 0)
+        count_layout.setSpacing(3)
+        
+        self.count_label = QLabel("Soru Sayısı:")
+        self.count_label.setStyleSheet("font-weight: bold;")
+        count_layout.addWidget(self.count_label)
+        
+        self.count_spin = QSpinBox()
+        self.count_spin.setRange(1, self.MAX_QUESTIONS)
+        self.count_spin.setValue(self.question_count)
+        self.count_spin.setKeyboardTracking(False)  # Yazarken her rakamda yeniden kurma
+        self.count_spin.valueChanged.connect(self.update_question_count)
+        self.count_spin.setStyleSheet("""
+            QSpinBox {
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 3px;
+                background-color: #f8f9fa;
+            }
+        """)
+        count_layout.addWidget(self.count_spin)
+        
+        settings_layout.addWidget(count_container, 1)
+        
+        # Sınavın cevap anahtarı (başlığa göre bir kez kaydedilir)
+        self.answer_key_button = QPushButton("Cevap Anahtarı")
+        self.answer_key_button.setToolTip("Bu sınavın cevap anahtarını gir veya düzenle")
+        self.answer_key_button.setStyleSheet("""
+            QPushButton {
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                padding: 3px 8px;
+                background-color: #f8f9fa;
+            }
+            QPushButton:hover {
+                background-color: #EDE7F6;
+            }
+        """)
+        self.answer_key_button.clicked.connect(self.edit_answer_key)
+        settings_layout.addWidget(self.answer_key_button)
+        
+        # Taranmış formdan şıkları okuma
+        self.scan_button = QPushButton("Görüntüden Oku")
+        self.scan_button.setToolTip("Taranmış veya fotoğrafı çekilmiş optik formdaki işaretleri oku")
+        self.scan_button.setStyleSheet(self.answer_key_button.styleSheet())
+        self.scan_button.clicked.connect(self.read_scanned_sheet)
+        settings_layout.addWidget(self.scan_button)
+        
+        # Bu sınav için basılabilir boş optik form
+        self.print_form_button = QPushButton("Form Yazdır")
+        self.print_form_button.setToolTip("Soru sayısına uygun boş optik formu PDF olarak kaydet")
+        self.print_form_button.setStyleSheet(self.answer_key_button.styleSheet())
+        self.print_form_button.clicked.connect(self.print_blank_form)
+        settings_layout.addWidget(self.print_form_button)
+        
         self.main_layout.addWidget(settings_frame)
         
         # Test Soruları Bölümü
         questions_frame = QFrame()
+        questions_frame.setObjectName("questionsFrame")
         questions_frame.setFrameShape(QFrame.StyledPanel)
-        questions_frame.setStyleSheet("background-color: white; border-radius: 8px;")
+        # Seçici ile sınırlı; soru butonlarının tema kurallarını ezmemeli
+        questions_frame.setStyleSheet("""
+            #questionsFrame, #questionsFrame QAbstractScrollArea > QWidget {
+                background-color: white;
+                border-radius: 8px;
+            }
+        """)
         questions_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         questions_layout = QVBoxLayout(questions_frame)
         questions_layout.setContentsMargins(5, 5, 5, 5)  # Daha az iç boşluk
         questions_layout.setSpacing(5)
         
-        # Sorular için bir scroll alanı
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background: #f0f0f0;
-                width: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #c0c0c0;
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # Soruların durumu tek bir dizide tutulur; widget'lar yalnızca görünümdür
+        self.sheet = AnswerSheet(self.question_count)
+        self.answer_model = AnswerSheetModel(self.sheet, self)
+        self.answer_model.sheet_changed.connect(self.calculate_and_show_results)
         
-        self.questions_widget = QWidget()
-        self.questions_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.questions_layout = QVBoxLayout(self.questions_widget)
-        self.questions_layout.setContentsMargins(3, 3, 3, 3)  # Daha az iç boşluk
-        self.questions_layout.setSpacing(5)  # Sorular arası mesafeyi azalt
-        
-        # Create questions
-        for i in range(1, 21):
-            question = Question(i)
-            question.test_tab = self  # Test tab referansını soruya ver
-            self.questions.append(question)
-            self.questions_layout.addWidget(question)
-            
-            # Add a separator line except for the last question
-            if i < 20:
-                line = QFrame()
-                line.setFrameShape(QFrame.HLine)
-                line.setFrameShadow(QFrame.Sunken)
-                line.setStyleSheet("color: #e0e0e0; max-height: 1px;")  # İnce çizgi
-                self.questions_layout.addWidget(line)
-        
-        self.scroll_area.setWidget(self.questions_widget)
-        questions_layout.addWidget(self.scroll_area)
+        if self.engine == "grid":
+            # Tek bir tablo görünümü; şıklar delegate tarafından çizilir
+            self.answer_view = AnswerSheetView(self.answer_model)
+            questions_layout.addWidget(self.answer_view)
+        else:
+            # Sorular için bir scroll alanı; yalnızca görünen sorular widget olarak bulunur
+            self.scroll_area = QuestionListArea(self.answer_model)
+            self.scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            self.scroll_area.setStyleSheet("""
+                QAbstractScrollArea {
+                    border: none;
+                    background-color: transparent;
+                }
+                QScrollBar:vertical {
+                    background: #f0f0f0;
+                    width: 8px;
+                    margin: 0px;
+                }
+                QScrollBar::handle:vertical {
+                    background: #c0c0c0;
+                    min-height: 20px;
+                    border-radius: 4px;
+                }
+                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+                    height: 0px;
+                }
+            """)
+            questions_layout.addWidget(self.scroll_area)
         
         self.main_layout.addWidget(questions_frame)
         
@@ -951,6 +542,30 @@ class TestTab(QWidget):
         self.finish_button.clicked.connect(self.finish_test)
         buttons_layout.addWidget(self.finish_button)
         
+        # Anahtara Göre Puanla Butonu
+        self.grade_button = QPushButton("Anahtara Göre Puanla")
+        self.grade_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.grade_button.setMinimumWidth(80)
+        self.grade_button.setStyleSheet("""
+            QPushButton {
+                background-color: #673AB7;
+                color: white;
+                border: none;
+                border-radius: 4px;
+                padding: 6px 12px;
+                font-weight: bold;
+                font-size: 12px;
+            }
+            QPushButton:hover {
+                background-color: #5E35B1;
+            }
+            QPushButton:pressed {
+                background-color: #4527A0;
+            }
+        """)
+        self.grade_button.clicked.connect(self.grade_with_key)
+        buttons_layout.addWidget(self.grade_button)
+        
         # Sınavı Kaydet Butonu
         self.save_button = QPushButton("Sınavı Kaydet")
         self.save_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
@@ -1045,90 +660,296 @@ class TestTab(QWidget):
         self.main_layout.setStretch(0, 1)  # Settings
         self.main_layout.setStretch(1, 8)  # Questions
         self.main_layout.setStretch(2, 1)  # Controls
+        
+        # Devam eden sınav otomatik olarak günlüğe yazılır; açılışta kaldığı yerden sürer
+        self.journal = AutosaveJournal(self.sheet, self.session_meta, self.writer, parent=self)
+        self.restore_autosave()
+        self.answer_model.question_changed.connect(self.journal.question_changed)
+        self.title_input.textChanged.connect(self.journal.session_changed)
+    
+    def session_meta(self):
+        """Otomatik kayıt günlüğüne yazılan sınav bilgileri"""
+        return {
+            "question_count": len(self.sheet),
+            "title": self.title_input.text(),
+            "wrong_ratio": self.wrong_ratio,
+            "locked": self.sheet.is_locked,
+            "completed": self.is_test_completed,
+            "saved": self.test_saved,
+        }
+    
+    def restore_autosave(self):
+        """Önceki oturumdan kalan kaydedilmemiş sınavı geri yükle"""
+        try:
+            state = read_journal(self.journal.path)
+        except Exception as e:
+            print(f"Otomatik kayıt okunamadı: {e}")
+            return
+        if state is None:
+            return
+        
+        meta, states, selected, is_correct, was_empty = state
+        count = meta.get("question_count", 0)
+        # Kaydedilmiş sınav yeniden açılmaz
+        if meta.get("saved") or not 1 <= count <= self.MAX_QUESTIONS:
+            return
+        
+        self.count_spin.blockSignals(True)
+        self.count_spin.setValue(count)
+        self.count_spin.blockSignals(False)
+        self.question_count = count
+        self.answer_model.set_question_count(count)
+        self.sheet.load_state(states, selected, is_correct, was_empty, meta.get("locked", False))
+        self.answer_model.sheet_reloaded()
+        
+        self.title_input.setText(meta.get("title", self.title_input.text()))
+        ratio_index = self.ratio_combo.findText(str(meta.get("wrong_ratio")))
+        if ratio_index >= 0:
+            self.ratio_combo.setCurrentIndex(ratio_index)
+        
+        if meta.get("completed"):
+            self.is_test_completed = True
+            self.finish_button.setEnabled(False)
+            self.count_spin.setEnabled(False)
+            self.save_button.setEnabled(True)
+            self.calculate_and_show_results()
     
     def update_wrong_ratio(self, index):
         self.wrong_ratio = int(self.ratio_combo.currentText())
         self.calculate_and_show_results()
+        self.journal.session_changed()
+    
+    def update_question_count(self, count):
+        """Soru sayısını değiştir; mevcut işaretlemeler korunur"""
+        self.question_count = count
+        self.answer_model.set_question_count(count)
+        self.journal.session_changed()
     
     def finish_test(self):
         if not self.is_test_completed:
             # Lock questions and show correct answers
-            for question in self.questions:
-                question.lock_options()
+            self.answer_model.lock_options()
             
             self.is_test_completed = True
             self.finish_button.setEnabled(False)
+            self.count_spin.setEnabled(False)
             
             # Artık sonuçları hesapla ve göster
             self.calculate_and_show_results()
             
             # Kaydet butonu aktif
             self.save_button.setEnabled(True)
+            self.journal.session_changed()
+    
+    def edit_answer_key(self):
+        """Sınavın cevap anahtarını gir; anahtar yoksa seçili şıklarla doldurulur"""
+        from answer_keys import shared_answer_keys, parse_key, format_key, codes_to_key
+        
+        title = self.title_input.text()
+        store = shared_answer_keys()
+        key = store.get(title)
+        if key is None:
+            key = codes_to_key(self.sheet.selected)
+        
+        text, ok = QInputDialog.getMultiLineText(
+            self, "Cevap Anahtarı",
+            f"\"{title}\" için cevap anahtarı ({len(self.sheet)} soru).\n"
+            "Soru başına bir harf (A-E); anahtarı olmayan sorular için \"-\".\n"
+            "Boşluk ve satır sonları yok sayılır. Anahtarı silmek için boş bırakın.",
+            format_key(key))
+        if not ok:
+            return
+        
+        try:
+            key = parse_key(text)
+        except ValueError as e:
+            QMessageBox.warning(self, "Hata", str(e), QMessageBox.Ok)
+            return
+        
+        try:
+            if key:
+                store.set(title, key)
+            else:
+                store.remove(title)
+        except OSError as e:
+            QMessageBox.warning(self, "Hata", f"Cevap anahtarı kaydedilemedi: {e}", QMessageBox.Ok)
+            return
+        
+        if key and len(key) != len(self.sheet):
+            QMessageBox.information(
+                self, "Cevap Anahtarı",
+                f"Anahtar {len(key)} soru, sınav {len(self.sheet)} soru içeriyor. "
+                "Yalnızca anahtarı olan sorular puanlanır.", QMessageBox.Ok)
+    
+    def grade_with_key(self):
+        """Seçili şıkları kayıtlı anahtarla tek geçişte karşılaştırıp sınavı bitir"""
+        from answer_keys import shared_answer_keys, key_codes
+        
+        key = shared_answer_keys().get(self.title_input.text())
+        if key is None:
+            QMessageBox.information(
+                self, "Cevap Anahtarı",
+                "Bu sınav için kayıtlı bir cevap anahtarı yok. Önce \"Cevap Anahtarı\" ile girin.",
+                QMessageBox.Ok)
+            return
+        
+        # Tek dataChanged: görünüm bir kez yenilenir. Sınav henüz bitmediyse
+        # sonuç burada hesaplanmaz, finish_test ile bir kez hesaplanır.
+        self.answer_model.grade(key_codes(key))
+        self.journal.session_changed()
+        if not self.is_test_completed:
+            self.finish_test()
+    
+    def read_scanned_sheet(self):
+        """Taranmış form sayfalarındaki işaretli şıkları sınava yükle"""
+        if self.is_test_completed:
+            QMessageBox.information(self, "Görüntüden Oku",
+                                    "Bitmiş bir sınava işaretleme okunamaz. Önce \"Yeni Test\" başlatın.",
+                                    QMessageBox.Ok)
+            return
+        
+        paths, _ = QFileDialog.getOpenFileNames(
+            self, "Taranmış Formu Seç", "", "Görüntüler (*.png *.jpg *.jpeg *.tif *.tiff *.bmp)")
+        if not paths:
+            return
+        
+        import numpy as np
+        from omr import read_sheet, merge_pages
+        from form_layout import FormLayout
+        
+        layout = FormLayout(len(self.sheet))
+        results = []
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            for path in paths:
+                results.append(read_sheet(path, layout))
+        except (OSError, ValueError, np.linalg.LinAlgError) as e:
+            QMessageBox.warning(self, "Hata", f"Form okunamadı: {os.path.basename(path)}: {e}", QMessageBox.Ok)
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        # Okunan şıklar tek seferde yüklenir; görünüm bir kez yenilenir
+        selected, multiple = merge_pages(layout, results)
+        count = len(self.sheet)
+        self.sheet.load_state(np.zeros(count, dtype=np.uint8), selected,
+                              np.zeros(count, dtype=bool), np.zeros(count, dtype=bool))
+        self.answer_model.sheet_reloaded()
+        self.journal.session_changed()
+        
+        missing = layout.pages - len({result["page"] for result in results})
+        message = f"{int(np.count_nonzero(selected))} soruda işaret okundu."
+        if multiple:
+            numbers = ", ".join(str(index + 1) for index in multiple[:20])
+            message += f"\nBirden fazla işaretli sorular boş bırakıldı: {numbers}"
+            if len(multiple) > 20:
+                message += "..."
+        if missing > 0:
+            message += f"\nFormun {missing} sayfası okunmadı."
+        QMessageBox.information(self, "Görüntüden Oku", message, QMessageBox.Ok)
+    
+    def print_blank_form(self):
+        """Sınavın başlığı ve soru sayısıyla boş optik formu PDF olarak kaydet"""
+        title = self.title_input.text()
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Optik Formu Kaydet", f"{title or 'optik_form'}.pdf", "PDF (*.pdf)")
+        if not path:
+            return
+        
+        from form_printer import write_forms
+        
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            pages = write_forms(path, len(self.sheet), title=title, vector=True)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Hata", f"Form kaydedilemedi: {e}", QMessageBox.Ok)
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        QMessageBox.information(self, "Form Yazdır", f"{pages} sayfalık form kaydedildi:\n{path}",
+                                QMessageBox.Ok)
     
     def save_test(self):
         if not self.is_test_completed:
             return
             
         # Calculate score
-        total_questions = 20
-        correct_count = sum(1 for q in self.questions if q.state == "correct")
-        wrong_count = sum(1 for q in self.questions if q.state == "wrong")
-        empty_count = sum(1 for q in self.questions if q.state == "empty" or (not q.selected_option and q.state == "unmarked"))
+        correct_count = self.sheet.correct_count
+        wrong_count = self.sheet.wrong_count
+        empty_count = self.sheet.empty_count
+        score = compute_score(correct_count, wrong_count, len(self.sheet), self.wrong_ratio)
         
-        score = ((correct_count - (wrong_count / self.wrong_ratio)) / total_questions) * 100
-        score = max(0, score)  # Prevent negative scores
+        # Kayıt arka planda yazılır; sonuç on_save_finished ile gelir
+        self.save_button.setEnabled(False)
+        self.save_button.setText("Kaydediliyor...")
+        self.pending_save = self.save_test_results(score, correct_count, wrong_count, empty_count)
+    
+    def on_save_finished(self, job_id, result, error):
+        """Arka plandaki yazma tamamlandığında çağrılır"""
+        if job_id != self.pending_save:
+            return
+        self.pending_save = None
         
-        # Save the test results
-        self.save_test_results(score, correct_count, wrong_count, empty_count)
+        if error:
+            self.save_button.setEnabled(self.is_test_completed)
+            self.save_button.setText("Sınavı Kaydet")
+            QMessageBox.warning(self, "Hata", f"Sınav kaydedilirken bir sorun oluştu: {error}", QMessageBox.Ok)
+            return
         
         # Test kaydedildi olarak işaretle
         self.test_saved = True
-        self.save_button.setEnabled(False)
         self.save_button.setText("Kaydedildi ✓")
+        self.journal.session_changed()
+        self.result_saved.emit(result)
         
-        QMessageBox.information(self, "Sınav Kaydedildi", "Sınav sonuçlarınız başarıyla kaydedildi.", QMessageBox.Ok)
+        # Kapanış sırasında tamamlanan kayıt için mesaj gösterilmez
+        if self.isVisible():
+            QMessageBox.information(self, "Sınav Kaydedildi", "Sınav sonuçlarınız başarıyla kaydedildi.", QMessageBox.Ok)
+    
+    def finish_writes(self):
+        """Kapanışta bekleyen kayıt ve otomatik kayıt yazmalarını eşzamanlı bitir
+
+        Kaydın bittiğini bildiren sinyal kuyrukta bekler ve olay döngüsü artık
+        dönmediği için burada teslim edilir. Böylece kaydedilen sınav günlüğe
+        son bir tam kopyayla "kaydedildi" olarak yazılır ve sonraki açılışta
+        kaydedilmemiş gibi geri yüklenmez.
+        """
+        self.journal.flush()
+        self.writer.flush()
+        QApplication.sendPostedEvents()
+        self.journal.flush()
+        self.writer.flush()
     
     def reset_test(self):
         # Yeni test için sıfırla
-        for question in self.questions:
-            question.reset()
+        self.answer_model.reset()
         
         self.is_test_completed = False
         self.test_saved = False
         self.finish_button.setEnabled(True)
+        self.count_spin.setEnabled(True)
         self.save_button.setEnabled(False)
         self.save_button.setText("Sınavı Kaydet")
         self.result_label.setText("")
+        self.journal.session_changed()
         
     def calculate_and_show_results(self):
         """Sonuçları hesapla ve göster"""
         if not self.is_test_completed:
             return
             
-        # Calculate score
-        total_questions = 20
-        correct_count = sum(1 for q in self.questions if q.state == "correct")
-        wrong_count = sum(1 for q in self.questions if q.state == "wrong")
-        empty_count = sum(1 for q in self.questions if q.state == "empty" or (not q.selected_option and q.state == "unmarked"))
-        
-        score = ((correct_count - (wrong_count / self.wrong_ratio)) / total_questions) * 100
-        score = max(0, score)  # Prevent negative scores
+        # Sayaçlar her işaretlemede güncellenir; burada yeniden saymaya gerek yok
+        correct_count = self.sheet.correct_count
+        wrong_count = self.sheet.wrong_count
+        empty_count = self.sheet.empty_count
+        score = compute_score(correct_count, wrong_count, len(self.sheet), self.wrong_ratio)
         
         result_text = f"Puan: {score:.1f}/100 | Doğru: {correct_count} | Yanlış: {wrong_count} | Boş: {empty_count}"
         self.result_label.setText(result_text)
     
     def save_test_results(self, score, correct, wrong, empty):
         # Test sorularının durumlarını kaydet
-        questions_data = []
-        for i, question in enumerate(self.questions):
-            question_data = {
-                "number": i + 1,
-                "selected_option": question.selected_option,
-                "state": question.state,
-                "is_correct": question.is_correct,
-                "was_empty": question.was_empty
-            }
-            questions_data.append(question_data)
+        questions_data = self.sheet.to_questions_data()
             
         test_data = {
             "title": self.title_input.text(),
@@ -1141,14 +962,14 @@ class TestTab(QWidget):
             "questions": questions_data
         }
         
-        # Ensure data directory exists
-        if not os.path.exists("test_results"):
-            os.makedirs("test_results")
+        # Yazma işi kuyruğa alınır; iş numarası döndürülür
+        if self.results_log is not None:
+            return self.writer.submit(self.results_log.append, test_data)
         
         # Save to file
-        filename = f"test_results/{self.title_input.text()}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, "w") as f:
-            json.dump(test_data, f)
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        filename = result_path(self.title_input.text())
+        return self.writer.submit(save_record, filename, test_data)
 
     def clear_test(self):
         """Testi temizler (yalnızca işaretlemeleri sıfırlar)"""
@@ -1160,13 +981,8 @@ class TestTab(QWidget):
         
         if reply == QMessageBox.Yes:
             # Tüm soruları sıfırla ama test ayarlarını koru
-            for question in self.questions:
-                question.reset()
-                
             # Eğer test bitmişse, bitir durumunu koru ama sıfırla
-            if self.is_test_completed:
-                for question in self.questions:
-                    question.is_locked = True
+            self.answer_model.reset(keep_locked=self.is_test_completed)
                     
             # Sonuç etiketini güncelle
             self.calculate_and_show_results()
@@ -1174,594 +990,12 @@ class TestTab(QWidget):
             # Kaydet butonunu devre dışı bırak
             self.save_button.setEnabled(False)
             self.test_saved = False
+            self.journal.session_changed()
             
             QMessageBox.information(self, "Başarılı", "Test temizlendi.", QMessageBox.Ok)
 
-class HistoryTab(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.main_layout = QVBoxLayout()
-        self.main_layout.setContentsMargins(3, 3, 3, 3)
-        self.main_layout.setSpacing(5)
-        self.setLayout(self.main_layout)
-        
-        # Table for showing test history
-        self.table = QTableWidget()
-        self.table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.table.setColumnCount(4)  # 5'den 4'e düşürüldü (Oran sütunu silindi)
-        self.table.setHorizontalHeaderLabels(['Test Adı', 'Puan', 'D/Y/B', 'Tarih'])  # Yeni sıralama
-        
-        # Sütunların manuel olarak boyutlandırılabilmesi için:
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-        
-        # İlk başta uygun genişlikler ayarla
-        self.table.setColumnWidth(0, 150)  # Test Adı - daha geniş
-        self.table.setColumnWidth(1, 50)   # Puan 
-        self.table.setColumnWidth(2, 70)   # D/Y/B
-        self.table.setColumnWidth(3, 90)   # Tarih
-        
-        # Son sütunun geri kalan alanı doldurmasını sağla
-        self.table.horizontalHeader().setStretchLastSection(True)
-        
-        self.table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                font-size: 11px;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 3px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QTableWidget::item {
-                padding: 2px;
-            }
-            QTableWidget::item:selected {
-                background-color: #e0f2f1;
-            }
-        """)
-        self.main_layout.addWidget(self.table)
-        
-        # Çift tıklamayı bağla
-        self.table.itemDoubleClicked.connect(self.open_test_details)
-        
-        # Butonlar
-        buttons_layout = QHBoxLayout()
-        buttons_layout.setSpacing(3)
-        
-        # Yenile butonu
-        self.refresh_button = QPushButton("Yenile")
-        self.refresh_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 3px 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        self.refresh_button.clicked.connect(self.load_history)
-        buttons_layout.addWidget(self.refresh_button)
-        
-        # Detay Göster butonu
-        self.show_details_button = QPushButton("Detayları Göster")
-        self.show_details_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.show_details_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 3px 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #1976D2;
-            }
-        """)
-        self.show_details_button.clicked.connect(self.show_selected_test_details)
-        buttons_layout.addWidget(self.show_details_button)
-        
-        # Sil butonu
-        self.delete_button = QPushButton("Seçili Testi Sil")
-        self.delete_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.delete_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 3px 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #d32f2f;
-            }
-        """)
-        self.delete_button.clicked.connect(self.delete_selected_test)
-        buttons_layout.addWidget(self.delete_button)
-        
-        # Tüm Kayıtları Sil butonu
-        self.delete_all_button = QPushButton("Tüm Test Geçmişini Sil")
-        self.delete_all_button.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.delete_all_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 3px 5px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #b71c1c;
-            }
-        """)
-        self.delete_all_button.clicked.connect(self.delete_all_tests)
-        buttons_layout.addWidget(self.delete_all_button)
-        
-        self.main_layout.addLayout(buttons_layout)
-        
-        # Load history data
-        self.load_history()
-        
-        # Test dosya adlarını sakla
-        self.test_files = []
-    
-    def load_history(self):
-        # Clear existing data
-        self.table.setRowCount(0)
-        
-        # Check if test_results directory exists
-        if not os.path.exists("test_results"):
-            return
-        
-        # Load all test results
-        self.test_files = glob.glob("test_results/*.json")
-        
-        # Sort by date (newest first)
-        self.test_files.sort(key=os.path.getmtime, reverse=True)
-        
-        row = 0
-        for file_path in self.test_files:
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                self.table.insertRow(row)
-                
-                # Test adı
-                self.table.setItem(row, 0, QTableWidgetItem(data.get('title', 'Bilinmeyen')))
-                
-                # Puan
-                score_item = QTableWidgetItem(f"{data.get('score', 0):.1f}")
-                self.table.setItem(row, 1, score_item)
-                
-                # D/Y/B (Doğru/Yanlış/Boş)
-                correct = data.get('correct', 0)
-                wrong = data.get('wrong', 0)
-                empty = data.get('empty', 0)
-                dyb_item = QTableWidgetItem(f"{correct}/{wrong}/{empty}")
-                self.table.setItem(row, 2, dyb_item)
-                
-                # Tarih
-                self.table.setItem(row, 3, QTableWidgetItem(data.get('date', '-')))
-                
-                # Color based on score
-                score = data.get('score', 0)
-                if score >= 85:
-                    score_item.setBackground(QColor(200, 255, 200))  # Light green
-                elif score >= 70:
-                    score_item.setBackground(QColor(220, 255, 220))  # Lighter green
-                elif score >= 60:
-                    score_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                elif score >= 50:
-                    score_item.setBackground(QColor(255, 230, 200))  # Light orange
-                else:
-                    score_item.setBackground(QColor(255, 200, 200))  # Light red
-                
-                row += 1
-            except Exception as e:
-                print(f"Error loading test result {file_path}: {e}")
-    
-    def delete_selected_test(self):
-        current_row = self.table.currentRow()
-        if current_row >= 0 and current_row < len(self.test_files):
-            file_path = self.test_files[current_row]
-            
-            reply = QMessageBox.question(
-                self, 'Testi Sil',
-                'Seçili testi silmek istediğinize emin misiniz?',
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                try:
-                    os.remove(file_path)
-                    self.load_history()  # Yeniden yükle
-                    QMessageBox.information(self, "Başarılı", "Test başarıyla silindi.", QMessageBox.Ok)
-                except Exception as e:
-                    QMessageBox.warning(self, "Hata", f"Test silinirken hata oluştu: {e}", QMessageBox.Ok)
-    
-    def delete_all_tests(self):
-        # Test dosyalarını yeniden yükle - en güncel listeyi almak için
-        if not os.path.exists("test_results"):
-            QMessageBox.information(self, "Bilgi", "Silinecek test kaydı bulunmamaktadır.", QMessageBox.Ok)
-            return
-            
-        # Yeniden dosyaları oku
-        self.test_files = glob.glob("test_results/*.json")
-        
-        if len(self.test_files) == 0:
-            QMessageBox.information(self, "Bilgi", "Silinecek test kaydı bulunmamaktadır.", QMessageBox.Ok)
-            return
-            
-        reply = QMessageBox.question(
-            self, 'Tüm Test Geçmişini Sil',
-            'TÜM test kayıtlarını silmek istediğinize emin misiniz? Bu işlem geri alınamaz!',
-            QMessageBox.Yes | QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            confirm_reply = QMessageBox.warning(
-                self, 'Son Uyarı',
-                'Bu işlem TÜM test kayıtlarınızı KALICI olarak silecektir. Devam etmek istiyor musunuz?',
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if confirm_reply == QMessageBox.Yes:
-                error_count = 0
-                try:
-                    for file_path in self.test_files:
-                        try:
-                            os.remove(file_path)
-                        except Exception as e:
-                            print(f"Dosya silinirken hata: {file_path}, {str(e)}")
-                            error_count += 1
-                            
-                    self.load_history()  # Yeniden yükle
-                    
-                    if error_count > 0:
-                        QMessageBox.warning(self, "Kısmi Başarı", f"{len(self.test_files) - error_count} test kaydı silindi, {error_count} kayıt silinemedi.", QMessageBox.Ok)
-                    else:
-                        QMessageBox.information(self, "Başarılı", "Tüm test kayıtları başarıyla silindi.", QMessageBox.Ok)
-                except Exception as e:
-                    QMessageBox.warning(self, "Hata", f"Testler silinirken bir hata oluştu: {e}", QMessageBox.Ok)
-
-    def show_selected_test_details(self):
-        """Seçili testin detaylarını göster"""
-        current_row = self.table.currentRow()
-        if current_row >= 0 and current_row < len(self.test_files):
-            self.open_test_details(self.table.item(current_row, 0))
-    
-    def open_test_details(self, item):
-        """Test detaylarını göster"""
-        row = item.row() if hasattr(item, 'row') else self.table.currentRow()
-        if row >= 0 and row < len(self.test_files):
-            file_path = self.test_files[row]
-            
-            try:
-                with open(file_path, 'r') as f:
-                    test_data = json.load(f)
-                
-                # Test detaylarını göster
-                test_window = TestDetailWindow(test_data, self)
-                test_window.show()
-            except Exception as e:
-                QMessageBox.warning(self, "Hata", f"Test detayları yüklenirken bir sorun oluştu: {e}", QMessageBox.Ok)
-
-# Test Detay Penceresi
-class TestDetailWindow(QMainWindow):
-    def __init__(self, test_data, parent=None):
-        super().__init__(parent)
-        self.test_data = test_data
-        
-        # Pencere özellikleri
-        self.setWindowTitle(f"Test Detayları: {test_data['title']}")
-        self.setMinimumSize(800, 600)
-        
-        # Ana widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        
-        # Üst bilgi alanı
-        info_frame = QFrame()
-        info_frame.setFrameShape(QFrame.StyledPanel)
-        info_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
-        info_layout = QGridLayout(info_frame)
-        
-        # Bilgi etiketleri
-        title_label = QLabel(f"<b>Test Adı:</b> {test_data['title']}")
-        date_label = QLabel(f"<b>Tarih:</b> {test_data['date']}")
-        score_label = QLabel(f"<b>Puan:</b> {test_data['score']:.1f}/100")
-        
-        # Puanı renklendir
-        score_value = test_data['score']
-        if score_value >= 85:
-            score_label.setStyleSheet("color: #2E7D32;")  # Koyu yeşil
-        elif score_value >= 70:
-            score_label.setStyleSheet("color: #388E3C;")  # Yeşil
-        elif score_value >= 60:
-            score_label.setStyleSheet("color: #FBC02D;")  # Sarı
-        elif score_value >= 50:
-            score_label.setStyleSheet("color: #F57F17;")  # Turuncu
-        else:
-            score_label.setStyleSheet("color: #C62828;")  # Kırmızı
-            
-        correct_label = QLabel(f"<b>Doğru:</b> {test_data['correct']}")
-        correct_label.setStyleSheet("color: #4CAF50;")
-        
-        wrong_label = QLabel(f"<b>Yanlış:</b> {test_data['wrong']}")
-        wrong_label.setStyleSheet("color: #F44336;")
-        
-        empty_label = QLabel(f"<b>Boş:</b> {test_data['empty']}")
-        empty_label.setStyleSheet("color: #2196F3;")
-        
-        ratio_label = QLabel(f"<b>Yanlış Götürme Oranı:</b> {test_data['wrong_ratio']}")
-        
-        # Düzene ekle
-        info_layout.addWidget(title_label, 0, 0)
-        info_layout.addWidget(date_label, 0, 1)
-        info_layout.addWidget(score_label, 1, 0)
-        info_layout.addWidget(correct_label, 1, 1)
-        info_layout.addWidget(wrong_label, 2, 0)
-        info_layout.addWidget(empty_label, 2, 1)
-        info_layout.addWidget(ratio_label, 3, 0, 1, 2)
-        
-        main_layout.addWidget(info_frame)
-        
-        # Soru detayları tablosu
-        question_frame = QFrame()
-        question_frame.setFrameShape(QFrame.StyledPanel)
-        question_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
-        question_layout = QVBoxLayout(question_frame)
-        
-        # Tablo başlığı
-        table_title = QLabel("<b>Soru Detayları</b>")
-        table_title.setAlignment(Qt.AlignCenter)
-        question_layout.addWidget(table_title)
-        
-        # Soru detayları tablosu
-        self.question_table = QTableWidget()
-        self.question_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.question_table.setColumnCount(4)
-        self.question_table.setHorizontalHeaderLabels(['Soru No', 'Seçilen Şık', 'Durum', 'Açıklama'])
-        
-        # Sütunların manuel olarak boyutlandırılabilmesi için:
-        self.question_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
-        
-        # İlk başta uygun genişlikler ayarla
-        self.question_table.setColumnWidth(0, 60)    # Soru No
-        self.question_table.setColumnWidth(1, 80)    # Seçilen Şık
-        self.question_table.setColumnWidth(2, 80)    # Durum
-        
-        # Son sütunun geri kalan alanı doldurmasını sağla
-        self.question_table.horizontalHeader().setStretchLastSection(True)
-        
-        self.question_table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                font-size: 12px;
-            }
-            QHeaderView::section {
-                background-color: #f0f0f0;
-                padding: 4px;
-                border: 1px solid #ddd;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QTableWidget::item {
-                padding: 4px;
-            }
-            QTableWidget::item:selected {
-                background-color: #e0f2f1;
-            }
-        """)
-        
-        # Sorular varsa yükle
-        if 'questions' in test_data:
-            self.load_questions_data(test_data['questions'])
-        else:
-            # Eski formatta kaydedilmiş testler için
-            no_data_row = self.question_table.rowCount()
-            self.question_table.insertRow(no_data_row)
-            self.question_table.setItem(no_data_row, 0, QTableWidgetItem("--"))
-            self.question_table.setItem(no_data_row, 1, QTableWidgetItem("--"))
-            self.question_table.setItem(no_data_row, 2, QTableWidgetItem("--"))
-            self.question_table.setItem(no_data_row, 3, QTableWidgetItem("Bu test için soru detayları mevcut değil"))
-        
-        question_layout.addWidget(self.question_table)
-        main_layout.addWidget(question_frame)
-        
-        # Grafik gösterimi için bir resim ekleyebiliriz
-        chart_frame = QFrame()
-        chart_frame.setFrameShape(QFrame.StyledPanel)
-        chart_frame.setStyleSheet("background-color: white; border-radius: 8px; padding: 10px;")
-        chart_layout = QVBoxLayout(chart_frame)
-        
-        # Grafik başlığı
-        chart_title = QLabel("<b>Test Sonuç Grafiği</b>")
-        chart_title.setAlignment(Qt.AlignCenter)
-        chart_layout.addWidget(chart_title)
-        
-        # Sonuç grafiği (basit bir görsel temsil)
-        chart_widget = QWidget()
-        chart_widget.setMinimumHeight(150)
-        chart_layout.addWidget(chart_widget)
-        
-        # Grafik çizimi
-        chart_widget.paintEvent = lambda event, d=test_data: self.draw_chart(event, d, chart_widget)
-        
-        main_layout.addWidget(chart_frame)
-        
-        # Layout ağırlıkları
-        main_layout.setStretch(0, 1)  # Bilgi alanı
-        main_layout.setStretch(1, 3)  # Soru detayları
-        main_layout.setStretch(2, 2)  # Grafik
-        
-        # Kapat butonu
-        btn_layout = QHBoxLayout()
-        close_btn = QPushButton("Kapat")
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-        """)
-        close_btn.clicked.connect(self.close)
-        btn_layout.addStretch()
-        btn_layout.addWidget(close_btn)
-        
-        main_layout.addLayout(btn_layout)
-    
-    def load_questions_data(self, questions_data):
-        """Soru verilerini tabloya yükle"""
-        self.question_table.setRowCount(0)
-        
-        for question in questions_data:
-            row = self.question_table.rowCount()
-            self.question_table.insertRow(row)
-            
-            # Soru numarası
-            self.question_table.setItem(row, 0, QTableWidgetItem(str(question['number'])))
-            
-            # Seçilen şık
-            selected_option = question.get('selected_option', '-')
-            self.question_table.setItem(row, 1, QTableWidgetItem(str(selected_option) if selected_option else '-'))
-            
-            # Durum
-            state = question.get('state', 'unmarked')
-            state_item = QTableWidgetItem(self.get_state_text(state))
-            self.question_table.setItem(row, 2, state_item)
-            
-            # Durum rengini ayarla
-            if state == 'correct':
-                state_item.setBackground(QColor(200, 255, 200))  # Açık yeşil
-                state_item.setForeground(QColor(0, 100, 0))      # Koyu yeşil yazı
-            elif state == 'wrong':
-                state_item.setBackground(QColor(255, 200, 200))  # Açık kırmızı
-                state_item.setForeground(QColor(150, 0, 0))      # Koyu kırmızı yazı
-            elif state == 'empty':
-                state_item.setBackground(QColor(200, 220, 255))  # Açık mavi
-                state_item.setForeground(QColor(0, 0, 150))      # Koyu mavi yazı
-            
-            # Açıklama
-            description = self.get_question_description(question)
-            self.question_table.setItem(row, 3, QTableWidgetItem(description))
-    
-    def get_state_text(self, state):
-        """Durum metnini döndür"""
-        if state == 'correct':
-            return 'Doğru'
-        elif state == 'wrong':
-            return 'Yanlış'
-        elif state == 'empty':
-            return 'Boş'
-        else:
-            return 'İşaretlenmemiş'
-    
-    def get_question_description(self, question):
-        """Soru durumuna göre açıklama oluştur"""
-        state = question.get('state', 'unmarked')
-        selected = question.get('selected_option', None)
-        
-        if state == 'correct':
-            return f"{selected} işaretlendi - Doğru"
-        elif state == 'wrong':
-            return f"{selected} işaretlendi - Yanlış"
-        elif state == 'empty':
-            if selected:
-                return f"{selected} işaretlendi - Boş bırakıldı olarak değerlendirildi"
-            else:
-                return "Boş bırakıldı"
-        else:
-            if selected:
-                return f"{selected} işaretlendi - Değerlendirilmedi"
-            else:
-                return "İşaretlenmedi"
-    
-    def draw_chart(self, event, data, widget):
-        """Basit sonuç grafiği çizimi"""
-        painter = QPainter(widget)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Grafik alanı
-        width = widget.width()
-        height = widget.height()
-        margin = 20
-        
-        # Renkleri tanımla
-        colors = {
-            'correct': QColor('#4CAF50'),
-            'wrong': QColor('#F44336'),
-            'empty': QColor('#2196F3')
-        }
-        
-        # Toplam soru sayısı
-        total = data['correct'] + data['wrong'] + data['empty']
-        if total == 0:
-            return
-        
-        # Çubuk grafik çiz
-        bar_width = int((width - 2 * margin) / 3)
-        bar_spacing = 10
-        
-        # Doğrular
-        correct_height = int((data['correct'] / total) * (height - 2 * margin))
-        x = margin
-        y = int(height - margin - correct_height)
-        painter.setBrush(colors['correct'])
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(x, y, bar_width - bar_spacing, correct_height)
-        painter.setPen(Qt.black)
-        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
-                         Qt.AlignCenter, f"Doğru ({data['correct']})")
-        
-        # Yanlışlar
-        wrong_height = int((data['wrong'] / total) * (height - 2 * margin))
-        x = margin + bar_width
-        y = int(height - margin - wrong_height)
-        painter.setBrush(colors['wrong'])
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(x, y, bar_width - bar_spacing, wrong_height)
-        painter.setPen(Qt.black)
-        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
-                         Qt.AlignCenter, f"Yanlış ({data['wrong']})")
-        
-        # Boşlar
-        empty_height = int((data['empty'] / total) * (height - 2 * margin))
-        x = margin + 2 * bar_width
-        y = int(height - margin - empty_height)
-        painter.setBrush(colors['empty'])
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(x, y, bar_width - bar_spacing, empty_height)
-        painter.setPen(Qt.black)
-        painter.drawText(QRect(x, height - margin + 5, bar_width - bar_spacing, 20), 
-                         Qt.AlignCenter, f"Boş ({data['empty']})")
-
 class OptikFormApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, engine="widgets", storage="files"):
         super().__init__()
         self.setWindowTitle("Kaplan Optik Form Uygulaması")
         self.setMinimumSize(800, 600)  # Minimum boyutu küçülttüm
@@ -1815,8 +1049,15 @@ class OptikFormApp(QMainWindow):
         # Header'ı test paneline ekle
         test_layout.addWidget(header_container)
         
+        # Sonuç deposu: her sonuç ayrı dosya ("files") veya tek kayıt günlüğü ("log")
+        if storage == "log":
+            from results_log import ResultsLog
+            self.results_log = ResultsLog()
+        else:
+            self.results_log = None
+        
         # Ana test alanı
-        self.test_tab = TestTab()
+        self.test_tab = TestTab(engine=engine, results_log=self.results_log)
         test_layout.addWidget(self.test_tab)
         
         # Sol panel ana düzene ekleniyor (artık main_layout değil, splitter'a ekliyoruz)
@@ -1840,9 +1081,10 @@ class OptikFormApp(QMainWindow):
         """)
         history_layout.addWidget(history_header)
         
-        # Geçmiş tablosu
-        self.history_tab = HistoryTab()
-        history_layout.addWidget(self.history_tab)
+        # Geçmiş tablosu ilk kare çizildikten sonra kurulur (bkz. paintEvent)
+        self.history_layout = history_layout
+        self.history_tab = None
+        self.history_scheduled = False
         
         # Sağ panel ana düzene ekleniyor (artık main_layout değil, splitter'a ekliyoruz)
         self.main_splitter.addWidget(history_panel)
@@ -1850,9 +1092,32 @@ class OptikFormApp(QMainWindow):
         # Splitter'ın başlangıç boyutlarını ayarla (70-30 oranı)
         self.main_splitter.setSizes([int(self.width() * 0.7), int(self.width() * 0.3)])
     
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        # İlk kare ekrana geldi; geçmiş paneli bir sonraki olay döngüsünde kurulur
+        if not self.history_scheduled:
+            self.history_scheduled = True
+            startup_trace.mark("ilk kare")
+            QTimer.singleShot(0, self.build_history_panel)
+    
+    def build_history_panel(self):
+        """Geçmiş panelini kur (birden fazla çağrılabilir)"""
+        if self.history_tab is not None:
+            return self.history_tab
+        
+        from history_tab import HistoryTab
+        self.history_tab = HistoryTab(results_log=self.results_log)
+        self.test_tab.result_saved.connect(self.history_tab.on_result_saved)
+        self.history_layout.addWidget(self.history_tab)
+        
+        startup_trace.mark("geçmiş paneli")
+        startup_trace.report()
+        return self.history_tab
+    
     def closeEvent(self, event):
         # Eğer test tamamlandı ama kaydedilmediyse uyarı göster
-        if hasattr(self, 'test_tab') and self.test_tab.is_test_completed and not self.test_tab.test_saved:
+        if (hasattr(self, 'test_tab') and self.test_tab.is_test_completed and not self.test_tab.test_saved
+                and self.test_tab.pending_save is None):
             reply = QMessageBox.question(
                 self, 'Sınav Kaydedilmedi',
                 'Tamamlanmış sınavınız henüz kaydedilmedi. Çıkmadan önce kaydetmek ister misiniz?',
@@ -1868,9 +1133,23 @@ class OptikFormApp(QMainWindow):
                 event.ignore()
         else:
             event.accept()
+        
+        # Kapanırken süren geçmiş taraması beklenmez
+        if event.isAccepted():
+            # Kapanış sırasında tamamlanan kayıt için mesaj gösterilmez
+            self.hide()
+            # Otomatik kayıttaki son değişiklikler ve kuyruktaki kayıtlar diske yazılmadan çıkılmaz
+            self.test_tab.finish_writes()
+            shared_writer().flush()
+            if self.history_tab is not None:
+                self.history_tab.stop_loading()
+            if self.results_log is not None:
+                self.results_log.close()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    startup_trace.mark("QApplication")
+    apply_theme(app)
     
     # Uygulama ikonu doğru şekilde ayarlanıyor - QApplication için
     icon_path = ""
@@ -1885,6 +1164,16 @@ if __name__ == "__main__":
     else:
         print("İkon dosyası bulunamadı")
     
-    window = OptikFormApp()
+    # --grid: büyük sınavlar için model/view tabanlı cevap kağıdı
+    engine = "grid" if "--grid" in sys.argv else "widgets"
+    # --log-store: sonuçları tek tek dosyalar yerine kayıt günlüğünde sakla
+    storage = "log" if "--log-store" in sys.argv else "files"
+    
+    # --trace-startup: ilk kareye kadar geçen süreyi aşamalara ayırarak yazdır
+    startup_trace.mark("tema ve ikon")
+    
+    window = OptikFormApp(engine=engine, storage=storage)
+    startup_trace.mark("ana pencere")
     window.show()
+    startup_trace.mark("show")
     sys.exit(app.exec_()) 
\ No newline at end of file
@@ -0,0 +1,76 @@
+import os
+import sys
+import json
+
+from record_format import encode_record, decode_record
+from result_files import RESULTS_DIR, JSON_EXTENSION, BINARY_EXTENSION, load_record
+
+
+def migrate_file(path):
+    """Tek bir JSON kaydını yanına .okr olarak yaz ve JSON dosyasını sil
+
+    Yeni dosya geri okunup asıl kayıtla birebir aynı olduğu doğrulanmadan
+    JSON dosyası silinmez. Dosyanın değiştirilme zamanı korunur, böylece
+    geçmiş listesindeki sıra değişmez. Yeni dosyanın yolunu döndürür.
+    """
+    record = load_record(path)
+    data = encode_record(record)
+
+    # Kayıpsız olduğunu doğrula (anahtar sırası ve türler dahil)
+    if json.dumps(decode_record(data)) != json.dumps(record):
+        raise ValueError("Dönüştürülen kayıt aslıyla aynı değil")
+
+    target = path[:-len(JSON_EXTENSION)] + BINARY_EXTENSION
+    if os.path.exists(target):
+        raise FileExistsError(f"{target} zaten var")
+
+    stat = os.stat(path)
+    temp_path = target + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.utime(temp_path, (stat.st_atime, stat.st_mtime))
+    os.replace(temp_path, target)
+    os.remove(path)
+    return target
+
+
+def migrate_results(results_dir=RESULTS_DIR):
+    """Klasördeki tüm JSON kayıtlarını sıkıştırılmış biçime çevir
+
+    (dönüştürülen, atlanan, önceki toplam bayt, sonraki toplam bayt) döndürür.
+    Dönüştürülemeyen kayıtlar JSON olarak kalır ve okunmaya devam eder.
+    """
+    converted = skipped = 0
+    bytes_before = bytes_after = 0
+
+    for name in sorted(os.listdir(results_dir)):
+        if not name.endswith(JSON_EXTENSION):
+            continue
+        path = os.path.join(results_dir, name)
+        size = os.path.getsize(path)
+        try:
+            target = migrate_file(path)
+        except Exception as e:
+            print(f"Atlandı: {path}: {e}")
+            skipped += 1
+            continue
+        converted += 1
+        bytes_before += size
+        bytes_after += os.path.getsize(target)
+
+    return converted, skipped, bytes_before, bytes_after
+
+
+if __name__ == "__main__":
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else RESULTS_DIR
+    if not os.path.isdir(results_dir):
+        print(f"Klasör bulunamadı: {results_dir}")
+        sys.exit(1)
+
+    converted, skipped, bytes_before, bytes_after = migrate_results(results_dir)
+    print(f"{converted} kayıt dönüştürüldü, {skipped} kayıt atlandı.")
+    if converted:
+        print(f"Boyut: {bytes_before} bayt -> {bytes_after} bayt "
+              f"(%{100 * bytes_after / bytes_before:.1f})")
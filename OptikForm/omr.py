@@ -0,0 +1,370 @@
+"""Taranmış veya fotoğrafı çekilmiş optik formlardan işaretli şıkları okur
+
+    python omr.py TARAMALAR/ --questions 160 [--workers N] [-o cevaplar.csv]
+
+Her görüntü formun bir sayfasıdır. Köşelerdeki dört hizalama işareti
+bulunur, form koordinatlarından (form_layout) görüntüye bir perspektif
+dönüşümü hesaplanır ve her balonun içi tek seferde örneklenir. Tarayıcı
+her öğrencinin sayfalarını sırayla verdiği için dosya sırasında sayfa kodu
+geri dönünce (ör. yeniden 1. sayfa) yeni bir öğrenci başlar; bir öğrencinin
+sayfaları tek bir cevap metninde birleştirilir. Çıktı, "optikform grade"
+komutunun okuyabileceği, öğrenci başına bir satırlık bir CSV dosyasıdır
+(Öğrenci, Sayfalar, Cevaplar); öğrenci adı ilk sayfanın dosya adıdır.
+"""
+import os
+import sys
+import csv
+import math
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from form_layout import (FormLayout, PAGE_WIDTH, PAGE_HEIGHT, MARK_SIZE, PAGE_CODE_SIZE,
+                         BUBBLE_DIAMETER, OPTION_COUNT, mark_centers, page_code_centers)
+from sheet_codes import OPTIONS, NO_OPTION
+
+# Görüntüler en az MIN_WIDTH, en fazla WORK_WIDTH genişliğe küçültülür (A4 için
+# ~100-150 DPI; balonlar yine 15 pikselden büyüktür)
+MIN_WIDTH = 800
+WORK_WIDTH = 1240
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp")
+
+# İşaretler sayfanın köşelerinden bu oran kadar içeride aranır
+SEARCH_FRACTION = 0.45
+# Sayfanın görüntüyü kapladığı tahmini oranlar (tarama ~1, fotoğraf daha az)
+MARK_SCALES = (1.0, 0.8, 0.65, 0.5)
+MARK_SEARCH_STEP = 2
+# İşaret kabul puanı: kare içinin koyu oranı eksi çevresinin koyu oranı
+MARK_SCORE = 0.6
+# Balonun kenar çizgisine değmemek için yalnızca iç kısmı örneklenir
+SAMPLE_RADIUS = 0.3 * BUBBLE_DIAMETER
+SAMPLE_STEPS = 7
+
+# Dolgu, kağıt beyazı (0) ile hizalama işaretinin siyahı (1) arasında ölçülür.
+# Boş balonların ortanca dolgusunun (harf ve çizgi gürültüsü) bu kadar
+# üstündeki balonlar işaretli sayılır.
+FILL_THRESHOLD = 0.35
+# Birden fazla işaretli şıktan en koyusu ikinciden bu kadar koyuysa (ör. silinmiş
+# eski işaret) o seçilir; değilse soru "çoklu işaret" olarak boş bırakılır
+MULTIPLE_MARGIN = 0.25
+
+MULTIPLE_MARK = "?"
+BLANK_MARK = "-"
+
+
+def load_pixels(image):
+    """Görüntüyü gri tonlamaya çevirip çalışma boyutuna küçült; 0 siyah, 1 beyaz
+
+    JPEG dosyaları doğrudan gri ve küçültülmüş olarak çözülür (draft); bu,
+    tam boyutlu renkli çözüp sonra küçültmekten birkaç kat hızlıdır.
+    """
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+    # draft yalnızca henüz çözülmemiş görüntüde etkilidir; döndürmeden önce çağrılır
+    short = min(image.size)
+    if short > MIN_WIDTH:
+        image.draft("L", (image.width * MIN_WIDTH // short, image.height * MIN_WIDTH // short))
+    image = ImageOps.exif_transpose(image).convert("L")
+    if image.width > WORK_WIDTH:
+        image = image.reduce(math.ceil(image.width / WORK_WIDTH))
+    return np.asarray(image, dtype=np.float32) / 255.0
+
+
+def box_sums(integral, size):
+    """Tüm konumlar için size x size kutudaki toplam (sol üst köşeye göre)"""
+    return (integral[size:, size:] - integral[:-size, size:]
+            - integral[size:, :-size] + integral[:-size, :-size])
+
+
+def find_marks(pixels):
+    """Dört hizalama işaretinin piksel merkezleri (x, y) ve kağıt tonu; bulunamazsa ValueError
+
+    Her köşe penceresinde koyu piksel oranı en yüksek, çevresi ise en açık
+    olan kare aranır; kutu toplamları bütünleşik görüntüyle tek seferde
+    hesaplanır. Merkez, bulunan karedeki koyu piksellerin ağırlık merkezidir.
+    Sayfanın görüntüyü kapladığı oran bilinmediği için işaret boyutu önce
+    tam sayfa ölçeğiyle, bulunamazsa daha küçük ölçeklerle denenir.
+    """
+    # Kağıt tonu seyreltilmiş örneklemden yeterince doğru çıkar
+    paper = float(np.percentile(pixels[::4, ::4], 90))
+    dark = pixels < paper * 0.55
+    # Arama yarı çözünürlükte yapılır; merkez tam çözünürlükte bulunur
+    coarse = dark[::MARK_SEARCH_STEP, ::MARK_SEARCH_STEP].astype(np.float32)
+    height, width = coarse.shape
+
+    window_w = int(width * SEARCH_FRACTION)
+    window_h = int(height * SEARCH_FRACTION)
+    integrals = []
+    for right, bottom in ((False, False), (True, False), (True, True), (False, True)):
+        x0 = width - window_w if right else 0
+        y0 = height - window_h if bottom else 0
+        integral = np.zeros((window_h + 1, window_w + 1), dtype=np.float32)
+        integral[1:, 1:] = coarse[y0:y0 + window_h, x0:x0 + window_w].cumsum(0).cumsum(1)
+        integrals.append((x0, y0, integral))
+
+    full_scale = min(width / PAGE_WIDTH, height / PAGE_HEIGHT)
+    for coverage in MARK_SCALES:
+        size = max(3, int(round(MARK_SIZE * full_scale * coverage)))
+        pad = max(2, size // 2)
+        ring_area = (size + 2 * pad) ** 2 - size * size
+        centers = []
+        for x0, y0, integral in integrals:
+            inner = box_sums(integral, size)
+            outer = box_sums(integral, size + 2 * pad)
+            # Dış kutunun sol üst köşesine hizala: iç kutu (pad, pad) kadar içeride
+            inner = inner[pad:pad + outer.shape[0], pad:pad + outer.shape[1]]
+            score = inner / (size * size) - (outer - inner) / ring_area
+
+            best = int(np.argmax(score))
+            y, x = divmod(best, score.shape[1])
+            if score[y, x] < MARK_SCORE:
+                break
+            # Kareyi bir piksel genişletip tam çözünürlükte koyu piksellerin merkezini al
+            left = (x0 + x + pad - 1) * MARK_SEARCH_STEP
+            top = (y0 + y + pad - 1) * MARK_SEARCH_STEP
+            span = (size + 2) * MARK_SEARCH_STEP
+            ys, xs = np.nonzero(dark[max(top, 0):top + span, max(left, 0):left + span])
+            centers.append((max(left, 0) + xs.mean() + 0.5, max(top, 0) + ys.mean() + 0.5))
+        else:
+            return np.array(centers), paper
+    raise ValueError("Hizalama işaretleri bulunamadı")
+
+
+def homography(source, target):
+    """Dört nokta eşlemesinden 3x3 perspektif dönüşüm matrisi"""
+    rows = []
+    values = []
+    for (x, y), (u, v) in zip(source, target):
+        rows.append((x, y, 1, 0, 0, 0, -u * x, -u * y))
+        rows.append((0, 0, 0, x, y, 1, -v * x, -v * y))
+        values.extend((u, v))
+    solution = np.linalg.solve(np.array(rows, dtype=np.float64), np.array(values, dtype=np.float64))
+    return np.append(solution, 1.0).reshape(3, 3)
+
+
+def transform(matrix, points):
+    """(…, 2) boyutlu nokta dizisini dönüştür"""
+    points = np.asarray(points, dtype=np.float64)
+    x = points[..., 0]
+    y = points[..., 1]
+    w = matrix[2, 0] * x + matrix[2, 1] * y + matrix[2, 2]
+    return np.stack(((matrix[0, 0] * x + matrix[0, 1] * y + matrix[0, 2]) / w,
+                     (matrix[1, 0] * x + matrix[1, 1] * y + matrix[1, 2]) / w), axis=-1)
+
+
+def disc_offsets(radius, steps=SAMPLE_STEPS):
+    """Dairenin içine düşen örnekleme noktaları (mm, merkeze göre)"""
+    grid = np.linspace(-radius, radius, steps)
+    x, y = np.meshgrid(grid, grid)
+    inside = x * x + y * y <= radius * radius
+    return np.stack((x[inside], y[inside]), axis=-1)
+
+
+BUBBLE_OFFSETS = disc_offsets(SAMPLE_RADIUS)
+CODE_OFFSETS = disc_offsets(0.3 * PAGE_CODE_SIZE)
+MARK_OFFSETS = disc_offsets(0.3 * MARK_SIZE)
+
+
+def sample_values(pixels, matrix, centers, offsets):
+    """Her merkez çevresindeki daire içindeki piksellerin ortalaması"""
+    points = np.asarray(centers, dtype=np.float64)[:, None, :] + offsets[None, :, :]
+    image_points = transform(matrix, points)
+    height, width = pixels.shape
+    xs = np.clip(np.rint(image_points[..., 0]).astype(np.intp), 0, width - 1)
+    ys = np.clip(np.rint(image_points[..., 1]).astype(np.intp), 0, height - 1)
+    return pixels[ys, xs].mean(axis=1)
+
+
+def sample_fill(pixels, matrix, centers, offsets, paper, ink):
+    """Her dairenin dolgusu: 0 kağıt beyazı, 1 mürekkep siyahı"""
+    values = sample_values(pixels, matrix, centers, offsets)
+    return np.clip((paper - values) / (paper - ink), 0.0, 1.0)
+
+
+def choose_options(fill):
+    """(soru x 5) dolgu matrisinden seçimleri bul
+
+    Sonuç: seçili şık kodları (0 = boş, 1-5 = A-E, AnswerSheet.selected ile
+    aynı) ve birden fazla işaret bulunan sorular.
+    """
+    # Boş balonların dolgusu (içindeki harf, kağıt tonu) sayfa genelinde ölçülür
+    baseline = float(np.median(fill))
+    marked = fill - baseline >= FILL_THRESHOLD
+
+    order = np.argsort(fill, axis=1)
+    rows = np.arange(len(fill))
+    darkest = order[:, -1]
+    first = fill[rows, darkest]
+    second = fill[rows, order[:, -2]]
+
+    counts = np.count_nonzero(marked, axis=1)
+    clear = (counts == 1) | ((counts > 1) & (first - second >= MULTIPLE_MARGIN))
+    selected = np.where(clear, darkest + 1, NO_OPTION).astype(np.uint8)
+    return selected, (counts > 1) & ~clear
+
+
+def read_sheet(image, layout):
+    """Bir sayfayı oku
+
+    Sonuç sözlüğü: page (sayfa), questions (sayfadaki soru sıraları),
+    selected (şık kodları), multiple (çoklu işaretli sorular), fill
+    (soru x 5 dolgu oranları).
+    """
+    pixels = load_pixels(image)
+    marks, paper = find_marks(pixels)
+    matrix = homography(mark_centers(), marks)
+    # Siyah tonu hizalama işaretlerinin içinden ölçülür
+    ink = float(sample_values(pixels, matrix, mark_centers(), MARK_OFFSETS).mean())
+    if paper - ink < 0.2:
+        raise ValueError("Görüntüde yeterli karşıtlık yok")
+
+    bits = sample_fill(pixels, matrix, page_code_centers(), CODE_OFFSETS, paper, ink) > 0.5
+    page = int(sum(1 << bit for bit, value in enumerate(bits) if value))
+    if page >= layout.pages:
+        raise ValueError(f"Sayfa {page + 1} bu soru sayısı için yok (form {layout.pages} sayfa)")
+
+    questions = layout.page_questions(page)
+    fill = sample_fill(pixels, matrix, layout.bubble_centers(page), BUBBLE_OFFSETS, paper, ink)
+    fill = fill.reshape(len(questions), OPTION_COUNT)
+    selected, multiple = choose_options(fill)
+    return {
+        "page": page,
+        "questions": questions,
+        "selected": selected,
+        "multiple": multiple,
+        "fill": fill,
+    }
+
+
+def merge_pages(layout, results):
+    """Sayfa sonuçlarını tek bir (soru sayısı uzunluğunda) seçim dizisine yerleştir
+
+    Dönen dizi TestTab'daki AnswerSheet.selected ile aynı düzendedir;
+    ikinci değer çoklu işaretli soruların (0'dan başlayan) sıralarıdır.
+    """
+    selected = np.zeros(layout.question_count, dtype=np.uint8)
+    multiple = []
+    for result in results:
+        questions = result["questions"]
+        selected[questions.start:questions.stop] = result["selected"]
+        multiple.extend(questions.start + int(i) for i in np.flatnonzero(result["multiple"]))
+    return selected, sorted(multiple)
+
+
+def answer_string(layout, results):
+    """Bir öğrencinin sayfa sonuçlarını tam uzunlukta cevap metnine çevir
+
+    Okunmayan sayfaların soruları boş ("-"), çoklu işaretli sorular "?" olur.
+    """
+    selected, multiple = merge_pages(layout, results)
+    letters = np.frombuffer((BLANK_MARK + "".join(OPTIONS)).encode('ascii'), dtype=np.uint8)
+    text = letters[selected]
+    text[multiple] = ord(MULTIPLE_MARK)
+    return text.tobytes().decode('ascii')
+
+
+def group_pages(pages):
+    """Dosya sırasıyla gelen (dosya, sonuç) çiftlerini öğrencilere ayır
+
+    Sayfa kodu bir öncekinden büyük değilse yeni bir öğrencinin formu
+    başlamıştır; eksik sayfalı formlar da ayrı öğrenci olarak kalır.
+    Her öğrenci için (dosya, sonuç) listesi üretir.
+    """
+    group = []
+    for path, result in pages:
+        if group and result["page"] <= group[-1][1]["page"]:
+            yield group
+            group = []
+        group.append((path, result))
+    if group:
+        yield group
+
+
+def read_file(task):
+    """İşlem havuzunda çalışır: (dosya, sayfa sonucu, hata)
+
+    Dolgu oranları işlemler arasında taşınmaz; yalnızca birleştirme için
+    gereken alanlar döndürülür.
+    """
+    path, question_count = task
+    layout = FormLayout(question_count)
+    try:
+        result = read_sheet(path, layout)
+    except (OSError, ValueError, np.linalg.LinAlgError) as e:
+        return path, None, str(e)
+    del result["fill"]
+    return path, result, None
+
+
+def image_paths(folder):
+    return [os.path.join(folder, name) for name in sorted(os.listdir(folder))
+            if name.lower().endswith(IMAGE_EXTENSIONS)]
+
+
+def read_folder(paths, question_count, workers=None):
+    """Görüntüleri işlem havuzunda oku; sonuçlar dosya sırasıyla üretilir"""
+    tasks = [(path, question_count) for path in paths]
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(read_file, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(read_file, tasks, chunksize=8)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optik form tarama okuyucu")
+    parser.add_argument("folder", help="taranmış form görüntülerinin klasörü")
+    parser.add_argument("--questions", type=int, required=True, help="sınavdaki soru sayısı")
+    parser.add_argument("--workers", type=int, help="işlem sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--output", "-o", help="CSV çıktı dosyası (varsayılan: standart çıktı)")
+    args = parser.parse_args(argv)
+
+    try:
+        FormLayout(args.questions)
+        paths = image_paths(args.folder)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+
+    layout = FormLayout(args.questions)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    began = time.perf_counter()
+    read = failed = students = incomplete = 0
+
+    def readable_pages():
+        nonlocal read, failed
+        for path, result, error in read_folder(paths, args.questions, args.workers):
+            if error:
+                print(f"Okunamadı: {path}: {error}", file=sys.stderr)
+                failed += 1
+                continue
+            read += 1
+            yield path, result
+
+    try:
+        writer = csv.writer(out)
+        writer.writerow(("Öğrenci", "Sayfalar", "Cevaplar"))
+        for group in group_pages(readable_pages()):
+            student = os.path.splitext(os.path.basename(group[0][0]))[0]
+            pages = [result["page"] + 1 for path, result in group]
+            if len(pages) != layout.pages:
+                print(f"Eksik sayfa: {student}: {len(pages)}/{layout.pages} sayfa okundu", file=sys.stderr)
+                incomplete += 1
+            writer.writerow((student, " ".join(map(str, pages)),
+                             answer_string(layout, [result for path, result in group])))
+            students += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - began
+    print(f"{read} sayfa okundu ({students} öğrenci, {incomplete} eksik), {failed} sayfa okunamadı "
+          f"({elapsed:.1f} s, {read / elapsed if elapsed else 0:.1f} sayfa/s)", file=sys.stderr)
+    return 1 if failed or incomplete else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""Kaplan Optik Form komut satırı aracı (Qt gerektirmez)
+
+    python -m optikform stats   [--dir test_results] [--log]
+    python -m optikform export  [--format csv|json] [--full] [--output DOSYA]
+    python -m optikform rescore [--ratio ORAN]
+    python -m optikform import  DOSYA_VEYA_KLASÖR...
+    python -m optikform grade   CEVAPLAR.csv --title BAŞLIK [--key ANAHTAR] [--ratio ORAN]
+
+Geçmiş paneliyle aynı sonuç dizinini (SQLite) kullanır; yalnızca yeni veya
+değişmiş dosyalar okunur. NumPy yalnızca yeniden puanlamada ve toplu
+puanlamada yüklenir.
+"""
+import os
+import sys
+import csv
+import json
+import argparse
+import datetime
+
+from result_files import (RESULTS_DIR, SUMMARY_FIELDS, RESULT_EXTENSIONS, result_path,
+                          load_record, save_record)
+
+EXPORT_FIELDS = SUMMARY_FIELDS + ("path",)
+
+
+class Store:
+    """Sonuçlara dosya deposu veya kayıt günlüğü üzerinden erişim"""
+
+    def __init__(self, results_dir, use_log=False):
+        self.results_dir = results_dir
+        if use_log:
+            from results_log import ResultsLog
+            self.log = ResultsLog(os.path.join(results_dir, "log"))
+            self.index = None
+        else:
+            from results_index import ResultsIndex
+            self.log = None
+            self.index = ResultsIndex(results_dir)
+            self.index.sync()
+
+    def summaries(self):
+        """Tüm özetler, en yeniden eskiye"""
+        if self.log is not None:
+            return self.log.page(self.log.count())
+        return self.index.summaries()
+
+    def load(self, summary):
+        if self.log is not None:
+            return self.log.load(summary["path"])
+        return load_record(summary["path"])
+
+    def add(self, record):
+        if self.log is not None:
+            return self.log.append(record)
+        os.makedirs(self.results_dir, exist_ok=True)
+        return save_record(unique_result_path(record, self.results_dir), record)
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+        else:
+            self.index.close()
+
+
+def unique_result_path(record, results_dir):
+    """İçe aktarılan kayıt için, kaydın tarihini kullanan ve çakışmayan bir yol"""
+    try:
+        when = datetime.datetime.strptime(record.get("date", ""), "%Y-%m-%d %H:%M")
+    except ValueError:
+        when = datetime.datetime.now()
+    path = result_path(record.get("title", "Bilinmeyen"), when, results_dir)
+    stem, extension = os.path.splitext(path)
+    suffix = 2
+    while os.path.exists(path):
+        path = f"{stem}_{suffix}{extension}"
+        suffix += 1
+    return path
+
+
+def command_stats(store, args, out):
+    summaries = store.summaries()
+    if not summaries:
+        print("Kayıtlı test bulunamadı.", file=out)
+        return 0
+
+    count = len(summaries)
+    scores = [summary["score"] for summary in summaries]
+    best = max(summaries, key=lambda summary: summary["score"])
+    worst = min(summaries, key=lambda summary: summary["score"])
+
+    print(f"Test sayısı      : {count}", file=out)
+    print(f"Ortalama puan    : {sum(scores) / count:.1f}", file=out)
+    print(f"En yüksek puan   : {best['score']:.1f} ({best['title']}, {best['date']})", file=out)
+    print(f"En düşük puan    : {worst['score']:.1f} ({worst['title']}, {worst['date']})", file=out)
+    for field, label in (("correct", "Doğru"), ("wrong", "Yanlış"), ("empty", "Boş")):
+        average = sum(summary[field] for summary in summaries) / count
+        print(f"Ortalama {label:<8}: {average:.1f}", file=out)
+    print(f"Son test         : {summaries[0]['title']} ({summaries[0]['date']})", file=out)
+    return 0
+
+
+def command_export(store, args, out):
+    summaries = store.summaries()
+
+    if args.format == "json":
+        if args.full:
+            data = [store.load(summary) for summary in summaries]
+        else:
+            data = [{field: summary[field] for field in EXPORT_FIELDS} for summary in summaries]
+        json.dump(data, out, ensure_ascii=False, indent=1)
+        out.write("\n")
+        return 0
+
+    writer = csv.writer(out)
+    writer.writerow(EXPORT_FIELDS)
+    for summary in summaries:
+        writer.writerow([summary[field] for field in EXPORT_FIELDS])
+    return 0
+
+
+def command_rescore(store, args, out):
+    summaries = store.summaries()
+    if not summaries:
+        print("Kayıtlı test bulunamadı.", file=out)
+        return 0
+
+    # NumPy yalnızca burada gerekir
+    from scoring import score_records
+
+    records = [store.load(summary) for summary in summaries]
+    result = score_records(records, args.ratio)
+
+    writer = csv.writer(out)
+    writer.writerow(("title", "date", "stored_score", "score", "correct", "wrong", "empty", "total"))
+    for i, record in enumerate(records):
+        writer.writerow((record.get("title"), record.get("date"), record.get("score"),
+                         round(float(result["score"][i]), 2), int(result["correct"][i]),
+                         int(result["wrong"][i]), int(result["empty"][i]), int(result["total"][i])))
+    return 0
+
+
+def import_paths(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(RESULT_EXTENSIONS):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def command_import(store, args, out):
+    imported = failed = 0
+    for path in import_paths(args.paths):
+        try:
+            record = load_record(path)
+            if not isinstance(record, dict) or "title" not in record or "score" not in record:
+                raise ValueError("test kaydı değil")
+            store.add(record)
+        except Exception as e:
+            print(f"Aktarılamadı: {path}: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        imported += 1
+
+    print(f"{imported} kayıt aktarıldı, {failed} kayıt aktarılamadı.", file=out)
+    return 1 if failed else 0
+
+
+def command_grade(store, args, out):
+    # NumPy ve işlem havuzu yalnızca burada gerekir
+    from answer_keys import AnswerKeyStore, parse_key, key_codes
+    from bulk_grade import RESULT_FIELDS, read_rows, grade_chunks
+    from record_format import decode_record
+    from result_files import BINARY_EXTENSION, JSON_EXTENSION
+
+    try:
+        if args.key is not None:
+            key = parse_key(args.key)
+        elif args.key_file is not None:
+            with open(args.key_file, "r", encoding="utf-8") as f:
+                key = parse_key(f.read())
+        else:
+            # Arayüzde "Cevap Anahtarı" ile kaydedilmiş anahtar
+            key = AnswerKeyStore(os.path.join(args.dir, "keys", "answer_keys.json")).get(args.title)
+    except (OSError, ValueError) as e:
+        print(f"Cevap anahtarı okunamadı: {e}", file=sys.stderr)
+        return 1
+    if not key:
+        print(f"Cevap anahtarı bulunamadı: {args.title} (--key veya --key-file verin)", file=sys.stderr)
+        return 1
+
+    ratio = int(args.ratio) if float(args.ratio).is_integer() else args.ratio
+    extension = BINARY_EXTENSION if args.format == "okr" else JSON_EXTENSION
+    # Kayıt günlüğüne yalnızca ana işlem yazabilir; işlemler kaydı veri olarak döndürür
+    results_dir = None if store.log is not None else args.dir
+
+    rows = read_rows(args.answers, args.student_column, args.answers_column, args.delimiter)
+    chunks = grade_chunks(rows, key_codes(key), args.title, ratio, results_dir,
+                          extension=extension, workers=args.workers)
+
+    writer = csv.writer(out)
+    writer.writerow(RESULT_FIELDS)
+    graded = failed = 0
+    total_score = 0.0
+    try:
+        for results in chunks:
+            if store.log is not None:
+                # Parçanın kayıtları günlüğe tek yazma ve tek fsync ile eklenir
+                keys = iter(store.log.append_many([decode_record(result[7]) for result in results
+                                                   if not result[8]]))
+            for line, student, title, score, correct, wrong, empty, target, error in results:
+                if error:
+                    print(f"Satır {line} puanlanamadı ({student}): {error}", file=sys.stderr)
+                    failed += 1
+                    writer.writerow((line, student, "", "", "", "", "", "", error))
+                    continue
+                if store.log is not None:
+                    target = next(keys)
+                graded += 1
+                total_score += score
+                writer.writerow((line, student, title, round(score, 2), correct, wrong, empty, target, ""))
+    except (OSError, ValueError, UnicodeDecodeError) as e:
+        print(f"Toplu puanlama durdu: {e}", file=sys.stderr)
+        return 1
+
+    average = total_score / graded if graded else 0.0
+    print(f"{graded} öğrenci puanlandı (ortalama {average:.1f}), {failed} satır puanlanamadı.",
+          file=sys.stderr)
+    return 1 if failed else 0
+
+
+COMMANDS = {
+    "stats": command_stats,
+    "export": command_export,
+    "rescore": command_rescore,
+    "import": command_import,
+    "grade": command_grade,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="optikform", description="Kaplan Optik Form sonuç aracı")
+    parser.add_argument("--dir", default=RESULTS_DIR, help="sonuç klasörü (varsayılan: test_results)")
+    parser.add_argument("--log", action="store_true", help="sonuçları kayıt günlüğünden oku/yaz (--log-store)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="puan istatistiklerini göster")
+
+    export = commands.add_parser("export", help="sonuçları CSV veya JSON olarak dışa aktar")
+    export.add_argument("--format", choices=("csv", "json"), default="csv")
+    export.add_argument("--full", action="store_true", help="JSON'da soru detaylarıyla tam kayıtları yaz")
+    export.add_argument("--output", "-o", help="çıktı dosyası (varsayılan: standart çıktı)")
+
+    rescore = commands.add_parser("rescore", help="kayıtları soru detaylarından yeniden puanla")
+    rescore.add_argument("--ratio", type=float, help="yanlış götürme oranı (varsayılan: kaydın kendi oranı)")
+
+    import_ = commands.add_parser("import", help="JSON veya .okr kayıtlarını sonuç klasörüne aktar")
+    import_.add_argument("paths", nargs="+", help="kayıt dosyaları veya klasörler")
+
+    grade = commands.add_parser("grade", help="CSV/TSV dosyasındaki öğrenci cevaplarını anahtara göre puanla")
+    grade.add_argument("answers", help="öğrenci ve cevap sütunlarını içeren CSV/TSV dosyası")
+    grade.add_argument("--title", required=True, help="sınav başlığı (kayıtlar 'başlık - öğrenci' adını alır)")
+    grade.add_argument("--key", help="cevap anahtarı (varsayılan: bu başlık için kaydedilmiş anahtar)")
+    grade.add_argument("--key-file", help="cevap anahtarını içeren metin dosyası")
+    grade.add_argument("--ratio", type=float, default=4, help="yanlış götürme oranı (varsayılan: 4)")
+    grade.add_argument("--student-column", help="öğrenci sütununun adı veya numarası (1'den başlar)")
+    grade.add_argument("--answers-column", help="cevap sütununun adı veya numarası (1'den başlar)")
+    grade.add_argument("--delimiter", help="alan ayırıcı (varsayılan: dosyadan tahmin edilir)")
+    grade.add_argument("--format", choices=("okr", "json"), default="okr", help="kayıt biçimi")
+    grade.add_argument("--workers", type=int, help="işlem sayısı (varsayılan: işlemci sayısı)")
+    grade.add_argument("--output", "-o", help="özet CSV dosyası (varsayılan: standart çıktı)")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command not in ("import", "grade") and not os.path.isdir(args.dir):
+        print(f"Klasör bulunamadı: {args.dir}", file=sys.stderr)
+        return 1
+
+    store = Store(args.dir, args.log)
+    output = getattr(args, "output", None)
+    try:
+        if output:
+            with open(output, "w", encoding="utf-8", newline="") as out:
+                return COMMANDS[args.command](store, args, out)
+        return COMMANDS[args.command](store, args, sys.stdout)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import os
+import threading
+from collections import OrderedDict
+
+from result_files import load_record
+
+# Çözülmüş bir kaydın bellekte kapladığı yaklaşık yer (tracemalloc ile ölçüldü):
+# soru başına bir sözlük 190-270 bayt, başlık/tarih ve özet alanları 1 KB'tan az.
+# Dosya boyutu bunun ölçüsü değildir; 2000 soruluk bir .okr kaydı diskte 2 KB,
+# bellekte ~440 KB tutar.
+RECORD_BYTES = 1024
+QUESTION_BYTES = 256
+
+
+def record_size(record):
+    """Kaydın bellekte kapladığı yerin tahmini (bayt)"""
+    questions = record.get('questions')
+    return RECORD_BYTES + (len(questions) if isinstance(questions, list) else 0) * QUESTION_BYTES
+
+
+class RecordCache:
+    """Ayrıştırılmış kayıtlar için LRU önbellek
+
+    Anahtar (yol, mtime, boyut) olduğundan değişen dosya otomatik olarak
+    yeniden okunur. Önbellek hem kayıt sayısıyla (max_entries) hem de
+    çözülmüş kayıtların tahmini bellek boyutuyla (max_bytes, record_size)
+    sınırlıdır; dosyaların diskteki boyutu hesaba katılmaz. Sınır aşılınca
+    en uzun süredir kullanılmayan kayıt çıkarılır. Arka plan taramasından da
+    kullanıldığı için erişimler kilitle korunur.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # yol -> ((mtime, boyut), kayıt, tahmini bellek boyutu)
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, path, mtime=None, size=None):
+        """Kaydı önbellekten döndür; yoksa veya dosya değiştiyse diskten oku
+
+        mtime/boyut biliniyorsa verilebilir, yoksa dosyanın bilgisi okunur.
+        Dönen sözlük paylaşıldığı için değiştirilmemelidir.
+        """
+        if mtime is None or size is None:
+            stat = os.stat(path)
+            mtime, size = stat.st_mtime, stat.st_size
+        fingerprint = (mtime, size)
+
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == fingerprint:
+                self.entries.move_to_end(path)
+                return entry[1]
+
+        record = load_record(path)
+        cost = record_size(record)
+
+        with self.lock:
+            self.discard(path)
+            if cost <= self.max_bytes:
+                self.entries[path] = (fingerprint, record, cost)
+                self.total_bytes += cost
+                self.evict()
+        return record
+
+    def invalidate(self, paths):
+        """Silinen kayıtları önbellekten çıkar"""
+        if isinstance(paths, str):
+            paths = [paths]
+        with self.lock:
+            for path in paths:
+                self.discard(path)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def discard(self, path):
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def evict(self):
+        while self.entries and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            path, (fingerprint, record, cost) = self.entries.popitem(last=False)
+            self.total_bytes -= cost
+
+    def __len__(self):
+        return len(self.entries)
+
+
+_shared_cache = None
+
+
+def shared_cache():
+    """Uygulama genelinde kullanılan kayıt önbelleği"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = RecordCache()
+    return _shared_cache
@@ -0,0 +1,231 @@
+import struct
+
+from sheet_codes import OPTIONS, STATE_NAMES, STATE_CODES, OPTION_CODES, NO_OPTION
+
+# Sıkıştırılmış kayıt biçimi (küçük uçlu / little-endian):
+#
+#   başlık   : "OPTK", sürüm (B), bayraklar (B)
+#   sayılar  : puan (d), yanlış götürme oranı (d), doğru, yanlış, boş, soru sayısı (4 x I)
+#   metinler : başlık ve tarih; her biri uzunluk (H) + UTF-8
+#   sorular  : soru başına 1 bayt
+#                bit 0-2 seçilen şık (0 = yok, 1-5 = A-E)
+#                bit 3-4 durum (STATE_CODES)
+#                bit 5   is_correct, bit 6 was_empty
+#   numaralar: yalnızca CUSTOM_NUMBERS bayrağı varsa, soru başına I
+#
+# Biçim kayıpsızdır: okunan kayıt, yazılan JSON kaydıyla aynı anahtarları,
+# sırayı ve türleri içerir. Bu biçime uymayan kayıtlar için ValueError verilir.
+MAGIC = b"OPTK"
+FORMAT_VERSION = 1
+
+HAS_QUESTIONS = 0x01
+SCORE_IS_INT = 0x02
+RATIO_IS_INT = 0x04
+CUSTOM_NUMBERS = 0x08
+
+HEADER = struct.Struct("<4sBB")
+COUNTS = struct.Struct("<ddIIII")
+TEXT_LENGTH = struct.Struct("<H")
+
+RECORD_KEYS = ("title", "date", "score", "correct", "wrong", "empty", "wrong_ratio")
+QUESTION_KEYS = ("number", "selected_option", "state", "is_correct", "was_empty")
+
+OPTION_MASK = 0x07
+STATE_SHIFT = 3
+IS_CORRECT_BIT = 0x20
+WAS_EMPTY_BIT = 0x40
+
+UINT32_MAX = 0xFFFFFFFF
+
+
+def is_binary_record(data):
+    return data[:len(MAGIC)] == MAGIC
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_count(value):
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= UINT32_MAX
+
+
+def _encode_text(value):
+    data = value.encode('utf-8')
+    if len(data) > 0xFFFF:
+        raise ValueError("Metin alanı çok uzun")
+    return TEXT_LENGTH.pack(len(data)) + data
+
+
+def encode_record(record):
+    """Kaydı sıkıştırılmış biçime çevir"""
+    keys = tuple(record)
+    has_questions = keys == RECORD_KEYS + ("questions",)
+    if keys != RECORD_KEYS and not has_questions:
+        raise ValueError(f"Desteklenmeyen kayıt alanları: {keys}")
+
+    if not isinstance(record['title'], str) or not isinstance(record['date'], str):
+        raise ValueError("Başlık ve tarih metin olmalı")
+    if not _is_number(record['score']) or not _is_number(record['wrong_ratio']):
+        raise ValueError("Puan ve oran sayı olmalı")
+    if not all(_is_count(record[key]) for key in ("correct", "wrong", "empty")):
+        raise ValueError("Doğru/yanlış/boş sayıları negatif olmayan tam sayı olmalı")
+
+    flags = 0
+    if isinstance(record['score'], int):
+        flags |= SCORE_IS_INT
+    if isinstance(record['wrong_ratio'], int):
+        flags |= RATIO_IS_INT
+
+    questions = record.get('questions') if has_questions else []
+    if has_questions:
+        flags |= HAS_QUESTIONS
+        if not isinstance(questions, list) or len(questions) > UINT32_MAX:
+            raise ValueError("'questions' bir liste olmalı")
+
+    codes = bytearray(len(questions))
+    numbers = []
+    for i, question in enumerate(questions):
+        if not isinstance(question, dict) or tuple(question) != QUESTION_KEYS:
+            raise ValueError(f"Desteklenmeyen soru alanları: {question}")
+        number = question['number']
+        selected = question['selected_option']
+        state = question['state']
+        if not _is_count(number):
+            raise ValueError(f"Geçersiz soru numarası: {number}")
+        if selected is not None and selected not in OPTION_CODES:
+            raise ValueError(f"Geçersiz şık: {selected}")
+        if state not in STATE_CODES:
+            raise ValueError(f"Geçersiz durum: {state}")
+        if not isinstance(question['is_correct'], bool) or not isinstance(question['was_empty'], bool):
+            raise ValueError("is_correct ve was_empty mantıksal değer olmalı")
+
+        code = OPTION_CODES[selected] if selected is not None else NO_OPTION
+        code |= STATE_CODES[state] << STATE_SHIFT
+        if question['is_correct']:
+            code |= IS_CORRECT_BIT
+        if question['was_empty']:
+            code |= WAS_EMPTY_BIT
+        codes[i] = code
+        numbers.append(number)
+
+    if numbers != list(range(1, len(numbers) + 1)):
+        flags |= CUSTOM_NUMBERS
+
+    parts = [
+        HEADER.pack(MAGIC, FORMAT_VERSION, flags),
+        COUNTS.pack(record['score'], record['wrong_ratio'],
+                    record['correct'], record['wrong'], record['empty'], len(questions)),
+        _encode_text(record['title']),
+        _encode_text(record['date']),
+        bytes(codes),
+    ]
+    if flags & CUSTOM_NUMBERS:
+        parts.append(struct.pack(f"<{len(numbers)}I", *numbers))
+    return b"".join(parts)
+
+
+def encode_codes(title, date, score, wrong_ratio, correct, wrong, empty, codes):
+    """Soru kodları hazır olan (1..n numaralı) bir kaydı doğrulama yapmadan yaz
+
+    codes, soru başına bir bayttır (yukarıdaki bit düzeni). Toplu üretim
+    gibi kaydın zaten doğru olduğu bilinen durumlar içindir; sonuç
+    encode_record ile aynıdır.
+    """
+    flags = HAS_QUESTIONS
+    if isinstance(score, int):
+        flags |= SCORE_IS_INT
+    if isinstance(wrong_ratio, int):
+        flags |= RATIO_IS_INT
+    return b"".join([
+        HEADER.pack(MAGIC, FORMAT_VERSION, flags),
+        COUNTS.pack(score, wrong_ratio, correct, wrong, empty, len(codes)),
+        _encode_text(title),
+        _encode_text(date),
+        bytes(codes),
+    ])
+
+
+def question_codes(data):
+    """Sıkıştırılmış kayıttaki soru kodlarını (soru başına 1 bayt) çözmeden döndür
+
+    Kayıtta soru detayı yoksa None döner. Soru numaraları okunmaz; kodlar
+    kayıttaki sırayla gelir.
+    """
+    try:
+        magic, version, flags = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Kayıt biçimi tanınmadı")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+        count = COUNTS.unpack_from(data, HEADER.size)[5]
+        offset = HEADER.size + COUNTS.size
+        for _ in range(2):
+            (length,) = TEXT_LENGTH.unpack_from(data, offset)
+            offset += TEXT_LENGTH.size + length
+    except struct.error as e:
+        raise ValueError(f"Kayıt dosyası eksik: {e}")
+    if not flags & HAS_QUESTIONS:
+        return None
+    codes = bytes(data[offset:offset + count])
+    if len(codes) != count:
+        raise ValueError("Kayıt dosyası eksik")
+    return codes
+
+
+def decode_record(data):
+    """Sıkıştırılmış kaydı JSON kaydıyla aynı yapıdaki sözlüğe çevir"""
+    try:
+        magic, version, flags = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Kayıt biçimi tanınmadı")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen kayıt sürümü: {version}")
+        offset = HEADER.size
+
+        score, wrong_ratio, correct, wrong, empty, count = COUNTS.unpack_from(data, offset)
+        offset += COUNTS.size
+
+        texts = []
+        for _ in range(2):
+            (length,) = TEXT_LENGTH.unpack_from(data, offset)
+            offset += TEXT_LENGTH.size
+            texts.append(bytes(data[offset:offset + length]).decode('utf-8'))
+            offset += length
+
+        codes = data[offset:offset + count]
+        offset += count
+        if flags & CUSTOM_NUMBERS:
+            numbers = struct.unpack_from(f"<{count}I", data, offset)
+        else:
+            numbers = range(1, count + 1)
+    except struct.error as e:
+        raise ValueError(f"Kayıt dosyası eksik: {e}")
+    if len(codes) != count:
+        raise ValueError("Kayıt dosyası eksik")
+
+    record = {
+        "title": texts[0],
+        "date": texts[1],
+        "score": int(score) if flags & SCORE_IS_INT else score,
+        "correct": correct,
+        "wrong": wrong,
+        "empty": empty,
+        "wrong_ratio": int(wrong_ratio) if flags & RATIO_IS_INT else wrong_ratio,
+    }
+
+    if flags & HAS_QUESTIONS:
+        options = [None] + OPTIONS
+        if any((code & OPTION_MASK) >= len(options) for code in codes):
+            raise ValueError("Kayıtta geçersiz şık kodu var")
+        record["questions"] = [
+            {
+                "number": number,
+                "selected_option": options[code & OPTION_MASK],
+                "state": STATE_NAMES[(code >> STATE_SHIFT) & 0x03],
+                "is_correct": bool(code & IS_CORRECT_BIT),
+                "was_empty": bool(code & WAS_EMPTY_BIT)
+            }
+            for number, code in zip(numbers, codes)
+        ]
+    return record
@@ -0,0 +1,164 @@
+import os
+import json
+import datetime
+
+from record_format import encode_record, decode_record, is_binary_record
+
+# Test sonuçlarının saklandığı klasör (uygulamanın çalıştığı dizine göre)
+RESULTS_DIR = "test_results"
+JSON_EXTENSION = ".json"
+BINARY_EXTENSION = ".okr"
+# Yeni kayıtlar sıkıştırılmış biçimde yazılır; eski JSON kayıtları okunmaya devam eder
+RESULT_EXTENSION = BINARY_EXTENSION
+RESULT_EXTENSIONS = (BINARY_EXTENSION, JSON_EXTENSION)
+
+# Kayıtlardan türetilen SQLite dosyaları (özet dizini, ders istatistikleri) bu alt
+# klasörde tutulur. Geçmiş paneli yalnızca sonuç klasörünü izlediği için
+# uygulamanın bu dosyalara yazması yeni bir taramayı tetiklemez.
+CACHE_DIRNAME = ".cache"
+
+# Geçmiş listesinde gösterilen özet alanları
+SUMMARY_FIELDS = ("title", "date", "score", "correct", "wrong", "empty", "wrong_ratio", "question_count")
+
+
+# Dosya adında kullanılamayan karakterler (klasör ayırıcıları ve Windows'ta yasak olanlar)
+UNSAFE_FILENAME_CHARS = '/\\<>:"|?*'
+
+
+def safe_filename(text):
+    """Başlığı tek bir dosya adı parçasına çevir
+
+    Klasör ayırıcıları, Windows'ta yasak karakterler, kontrol karakterleri ve
+    baştaki noktalar (".." veya gizli dosya) "_" olur; böylece "Ali/Veli" veya
+    "../x" gibi başlıklar alt klasör oluşturamaz, klasör dışına yazamaz ve
+    kayıt her zaman taranan sonuç klasöründe kalır.
+    """
+    name = "".join("_" if char in UNSAFE_FILENAME_CHARS or ord(char) < 32 else char for char in text)
+    for separator in (os.sep, os.altsep):
+        if separator:
+            name = name.replace(separator, "_")
+    stripped = name.lstrip(".")
+    return "_" * (len(name) - len(stripped)) + stripped
+
+
+def result_path(title, when=None, results_dir=RESULTS_DIR):
+    """Yeni bir kayıt için dosya yolu oluştur; başlık dosya adına güvenli biçimde yazılır"""
+    when = when or datetime.datetime.now()
+    return f"{results_dir}/{safe_filename(title)}_{when.strftime('%Y%m%d_%H%M%S')}{RESULT_EXTENSION}"
+
+
+def cache_path(results_dir, filename, legacy_filename=None):
+    """Türetilmiş dosyanın yolu; eski sürümün sonuç klasörüne yazdığı dosya varsa buraya taşınır"""
+    directory = os.path.join(results_dir, CACHE_DIRNAME)
+    path = os.path.join(directory, filename)
+    if legacy_filename is not None:
+        legacy_path = os.path.join(results_dir, legacy_filename)
+        if os.path.exists(legacy_path) and not os.path.exists(path):
+            try:
+                os.makedirs(directory, exist_ok=True)
+                os.replace(legacy_path, path)
+            except OSError:
+                # Taşınamazsa yenisi oluşturulur; dizin kayıtlardan yeniden kurulabilir
+                pass
+    return path
+
+
+def scan_result_files(results_dir=RESULTS_DIR):
+    """Klasördeki kayıt dosyalarını (yol, mtime, boyut) olarak döndür; içerikleri okunmaz"""
+    files = []
+    try:
+        entries = os.scandir(results_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return files
+
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(RESULT_EXTENSIONS):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if not entry.is_file():
+                continue
+            files.append((f"{results_dir}/{entry.name}", stat.st_mtime, stat.st_size))
+    return files
+
+
+def parse_record(data):
+    """Kayıt baytlarını çöz; biçim (JSON veya sıkıştırılmış) içeriğe bakılarak seçilir"""
+    if is_binary_record(data):
+        return decode_record(data)
+    return json.loads(bytes(data).decode('utf-8'))
+
+
+def load_record(path):
+    """Kayıt dosyasını oku"""
+    with open(path, 'rb') as f:
+        return parse_record(f.read())
+
+
+def save_record(path, record, sync=True):
+    """Kaydı dosyaya atomik olarak yaz; klasör önceden var olmalıdır
+
+    Biçim dosya uzantısına göre seçilir (.okr sıkıştırılmış, .json JSON);
+    record o biçimde önceden kodlanmış bayt dizisi de olabilir.
+    Önce geçici dosyaya yazılıp diske aktarılır, sonra asıl adına taşınır;
+    böylece kesinti anında yarım kalmış bir kayıt dosyası oluşmaz. Çok sayıda
+    kayıt yazan çağıran sync=False verip klasörü sonunda bir kez
+    sync_directory ile diske aktarabilir. Yazılan dosyanın yolunu döndürür.
+    Alt klasör oluşturulmaz; sonuç klasörünü çağıran oluşturur (result_path
+    her zaman doğrudan bu klasörün içinde bir yol verir).
+    """
+    directory = os.path.dirname(path)
+
+    if isinstance(record, bytes):
+        data = record
+    elif path.endswith(BINARY_EXTENSION):
+        data = encode_record(record)
+    else:
+        data = json.dumps(record).encode('utf-8')
+
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if sync:
+        sync_directory(directory or ".")
+    return path
+
+
+def sync_directory(directory):
+    """Yeniden adlandırmanın kalıcı olması için klasörü diske aktar (destekleniyorsa)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def summarize(record):
+    """Geçmiş listesi için kaydın özetini çıkar"""
+    questions = record.get('questions')
+    return {
+        "title": record.get('title', 'Bilinmeyen'),
+        "date": record.get('date', '-'),
+        "score": record.get('score', 0),
+        "correct": record.get('correct', 0),
+        "wrong": record.get('wrong', 0),
+        "empty": record.get('empty', 0),
+        "wrong_ratio": record.get('wrong_ratio', 4),
+        "question_count": len(questions) if questions else None,
+    }
@@ -0,0 +1,57 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WriteJob(QRunnable):
+    def __init__(self, writer, job_id, function, args):
+        super().__init__()
+        self.writer = writer
+        self.job_id = job_id
+        self.function = function
+        self.args = args
+
+    def run(self):
+        result, error = None, ""
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        self.writer.finished.emit(self.job_id, result, error)
+
+
+class ResultWriter(QObject):
+    """Kayıt yazma işlerini arayüz iş parçacığı dışında sırayla çalıştırır
+
+    Tek iş parçacıklı bir havuz kullanıldığı için işler gönderildikleri
+    sırayla tamamlanır. Her iş bittiğinde 'finished' sinyali (iş no, sonuç,
+    hata mesajı) yayınlanır; hata yoksa mesaj boş metindir.
+    """
+
+    finished = pyqtSignal(int, object, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.next_job = 1
+
+    def submit(self, function, *args):
+        """Yazma işini kuyruğa ekle ve iş numarasını döndür"""
+        job_id = self.next_job
+        self.next_job += 1
+        self.pool.start(WriteJob(self, job_id, function, args))
+        return job_id
+
+    def flush(self, timeout_ms=-1):
+        """Bekleyen tüm yazmaların bitmesini bekle (kapanışta kullanılır)"""
+        return self.pool.waitForDone(timeout_ms)
+
+
+_shared_writer = None
+
+
+def shared_writer():
+    """Uygulama genelinde kullanılan yazıcı"""
+    global _shared_writer
+    if _shared_writer is None:
+        _shared_writer = ResultWriter()
+    return _shared_writer
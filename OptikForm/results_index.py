@@ -0,0 +1,181 @@
+import os
+import sqlite3
+
+from result_files import RESULTS_DIR, SUMMARY_FIELDS, cache_path, scan_result_files, load_record, summarize
+
+INDEX_FILENAME = "index.sqlite3"
+# Önceki sürümlerde dosya doğrudan sonuç klasöründeydi
+LEGACY_INDEX_FILENAME = ".index.sqlite3"
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        path TEXT PRIMARY KEY,
+        title TEXT,
+        date TEXT,
+        score REAL,
+        correct INTEGER,
+        wrong INTEGER,
+        empty INTEGER,
+        wrong_ratio REAL,
+        question_count INTEGER,
+        mtime REAL,
+        size INTEGER
+    );
+    CREATE INDEX IF NOT EXISTS results_by_mtime ON results (mtime DESC, path DESC);
+    CREATE INDEX IF NOT EXISTS results_by_title ON results (title, mtime);
+"""
+
+COLUMNS = ("path",) + SUMMARY_FIELDS + ("mtime", "size")
+
+
+class ResultsIndex:
+    """Kayıt özetlerini tutan yerel SQLite dizini
+
+    Her satır bir kayıt dosyasının özetini ve dosyanın yolunu içerir.
+    Dosyanın (mtime, boyut) bilgisi saklandığı için yalnızca yeni veya
+    değişmiş dosyalar yeniden okunur.
+    """
+
+    def __init__(self, results_dir=RESULTS_DIR, db_path=None):
+        self.results_dir = results_dir
+        self.db_path = db_path or cache_path(results_dir, INDEX_FILENAME, LEGACY_INDEX_FILENAME)
+        self.connection = self.open_database()
+
+    def open_database(self):
+        try:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            connection = self.connect(self.db_path)
+        except (OSError, sqlite3.DatabaseError) as e:
+            # Bozuk dizin dosyası yeniden oluşturulur; o da olmazsa bellekte tutulur
+            print(f"Sonuç dizini açılamadı, yeniden oluşturuluyor: {e}")
+            try:
+                if os.path.exists(self.db_path):
+                    os.remove(self.db_path)
+                connection = self.connect(self.db_path)
+            except (OSError, sqlite3.DatabaseError):
+                connection = self.connect(":memory:")
+        return connection
+
+    @staticmethod
+    def connect(path):
+        connection = sqlite3.connect(path)
+        connection.row_factory = sqlite3.Row
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS results")
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        connection.executescript(SCHEMA)
+        connection.commit()
+        return connection
+
+    def close(self):
+        self.connection.close()
+
+    def fingerprints(self):
+        """Dizindeki her dosya için (mtime, boyut)"""
+        return {row["path"]: (row["mtime"], row["size"])
+                for row in self.connection.execute("SELECT path, mtime, size FROM results")}
+
+    def sync(self):
+        """Dizini klasörle eşitle; yalnızca yeni/değişmiş dosyalar okunur
+
+        (eklenen/güncellenen, silinen) dosya sayılarını döndürür.
+        """
+        known = self.fingerprints()
+        updated = 0
+
+        with self.connection:
+            for path, mtime, size in scan_result_files(self.results_dir):
+                fingerprint = known.pop(path, None)
+                if fingerprint == (mtime, size):
+                    continue
+                try:
+                    record = load_record(path)
+                except Exception as e:
+                    print(f"Error loading test result {path}: {e}")
+                    continue
+                self.upsert(path, record, mtime, size)
+                updated += 1
+
+            # Klasörde artık bulunmayan dosyalar
+            self.connection.executemany("DELETE FROM results WHERE path = ?",
+                                        [(path,) for path in known])
+
+        return updated, len(known)
+
+    def upsert(self, path, record, mtime, size):
+        self.upsert_summary(path, summarize(record), mtime, size)
+
+    def upsert_summary(self, path, summary, mtime, size):
+        values = [path] + [summary[field] for field in SUMMARY_FIELDS] + [mtime, size]
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO results ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+            values)
+
+    def store(self, items):
+        """Başka yerde ayrıştırılmış (yol, özet, mtime, boyut) kayıtlarını yaz
+
+        Yazılan satırları, dizinden okunan özetlerle aynı biçimde döndürür.
+        """
+        rows = []
+        with self.connection:
+            for path, summary, mtime, size in items:
+                self.upsert_summary(path, summary, mtime, size)
+                rows.append(dict(summary, path=path, mtime=mtime, size=size))
+        return rows
+
+    def add(self, path, record):
+        """Yeni yazılan bir kaydı dizine ekle"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self.connection:
+            self.upsert(path, record, stat.st_mtime, stat.st_size)
+
+    def remove(self, paths):
+        """Silinen kayıtları dizinden çıkar"""
+        if isinstance(paths, str):
+            paths = [paths]
+        with self.connection:
+            self.connection.executemany("DELETE FROM results WHERE path = ?",
+                                        [(path,) for path in paths])
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def attempts(self, title):
+        """Aynı başlıklı kayıtlar (yol, mtime, boyut), eskiden yeniye"""
+        return [tuple(row) for row in self.connection.execute(
+            "SELECT path, mtime, size FROM results WHERE title = ? ORDER BY mtime, path", (title,))]
+
+    def summaries(self, limit=-1, offset=0):
+        """Özetleri en yeniden eskiye doğru döndür"""
+        return [dict(row) for row in self.connection.execute(
+            "SELECT * FROM results ORDER BY mtime DESC, path DESC LIMIT ? OFFSET ?", (limit, offset))]
+
+    def page(self, limit, after=None):
+        """'after' özetinden sonra gelen en fazla 'limit' özet
+
+        OFFSET yerine son satırın (mtime, path) değerinden devam edildiği
+        için sayfanın maliyeti geçmişin büyüklüğünden bağımsızdır.
+        """
+        if after is None:
+            return self.summaries(limit)
+        return [dict(row) for row in self.connection.execute(
+            "SELECT * FROM results WHERE mtime < ? OR (mtime = ? AND path < ?) "
+            "ORDER BY mtime DESC, path DESC LIMIT ?",
+            (after['mtime'], after['mtime'], after['path'], limit))]
+
+
+_shared_index = None
+
+
+def shared_index():
+    """Uygulama genelinde kullanılan dizin (ilk çağrıda açılır)"""
+    global _shared_index
+    if _shared_index is None:
+        _shared_index = ResultsIndex()
+    return _shared_index
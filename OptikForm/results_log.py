@@ -0,0 +1,442 @@
+import os
+import json
+import time
+import bisect
+import struct
+import zlib
+import threading
+
+from record_format import encode_record
+from result_files import RESULTS_DIR, parse_record, summarize
+
+# Kayıt günlüğü (isteğe bağlı depolama):
+#
+# Her kaydedilen sınav, segment dosyalarının sonuna tek bir çerçeve olarak
+# eklenir; silme işlemi de bir "mezar taşı" (tombstone) çerçevesidir. Böylece
+# kaydetme ve silme sabit maliyetli birer eklemedir ve klasörde binlerce
+# küçük dosya oluşmaz.
+#
+#   çerçeve: "OPLG", tür (B), sıra no (Q), hedef (Q), zaman (d), uzunluk (I), crc32 (I), veri
+#
+# Sıra numarası (lsn) her çerçevede artar; PUT çerçevesinin sıra numarası aynı
+# zamanda kaydın kimliğidir. DELETE hedef kimliği, CLEAR ise kendinden önceki
+# tüm kayıtları siler. Kayıtlar değiştirilmediği için segmentlerin okunma sırası
+# sonucu etkilemez; bu da sıkıştırmayı kesintiye karşı güvenli kılar.
+#
+# Açılışta tek bir dizin dosyası (index.json) okunur; dizinden sonra eklenen
+# çerçeveler segmentlerin sonundan tamamlanır.
+LOG_DIR = os.path.join(RESULTS_DIR, "log")
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+SEGMENT_PREFIX = "segment-"
+SEGMENT_SUFFIX = ".log"
+
+FRAME = struct.Struct("<4sBQQdII")
+FRAME_MAGIC = b"OPLG"
+
+PUT = 1
+DELETE = 2
+CLEAR = 3
+
+KEY_PREFIX = "log:"
+
+
+def record_key(record_id):
+    return f"{KEY_PREFIX}{record_id}"
+
+
+def record_id(key):
+    if not key.startswith(KEY_PREFIX):
+        raise KeyError(key)
+    return int(key[len(KEY_PREFIX):])
+
+
+def serialize_record(record):
+    """Kaydı sıkıştırılmış biçimde, o biçime uymuyorsa JSON olarak döndür"""
+    try:
+        return encode_record(record)
+    except ValueError:
+        return json.dumps(record).encode('utf-8')
+
+
+class ResultsLog:
+    """Segment dosyalarına ekleme yapan kayıt deposu
+
+    Geçmiş tablosunun kullandığı count()/page() arayüzünü ResultsIndex ile
+    aynı biçimde sunar; özetlerdeki 'path' alanı burada kayıt anahtarıdır.
+    Tüm işlemler kilitle korunur, sıkıştırma arka planda çalışabilir.
+    """
+
+    SEGMENT_SIZE = 4 * 1024 * 1024
+    # Bu kadar ekleme sonra dizin dosyası yeniden yazılır
+    SNAPSHOT_INTERVAL = 256
+    # Ölü veri hem bu oranı hem de bu boyutu aşınca sıkıştırma önerilir
+    COMPACT_RATIO = 0.5
+    COMPACT_MIN_BYTES = 1024 * 1024
+
+    def __init__(self, directory=LOG_DIR):
+        self.directory = directory
+        self.lock = threading.Lock()
+        # kimlik -> (segment, konum, çerçeve boyutu, özet)
+        self.entries = {}
+        # (zaman, anahtar) çiftleri, eskiden yeniye sıralı
+        self.order = []
+        self.segment_sizes = {}
+        self.next_lsn = 1
+        self.live_bytes = 0
+        self.unsaved_frames = 0
+        self.compacting = False
+
+        os.makedirs(directory, exist_ok=True)
+        self.open()
+
+    # Dosyalar
+
+    def segment_path(self, number):
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}")
+
+    def segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    numbers.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+            elif name.endswith(".tmp"):
+                # Yarım kalmış sıkıştırma veya dizin yazımı
+                os.remove(os.path.join(self.directory, name))
+        return sorted(numbers)
+
+    def open(self):
+        numbers = self.segment_numbers()
+        snapshot = self.read_snapshot()
+
+        if snapshot is not None and self.snapshot_matches(snapshot, numbers):
+            for item in snapshot["entries"]:
+                record_id, segment, offset, length, summary = item
+                self.add_entry(record_id, segment, offset, length, summary)
+            self.next_lsn = snapshot["next_lsn"]
+            start = {int(number): size for number, size in snapshot["segments"].items()}
+        else:
+            # Dizin yok veya eskimiş: tüm segmentler baştan okunur
+            start = {}
+
+        tombstones = set()
+        clear_lsn = 0
+        for number in numbers:
+            for kind, lsn, target, stamp, offset, length, payload in self.read_frames(number, start.get(number, 0)):
+                self.next_lsn = max(self.next_lsn, lsn + 1)
+                if kind == PUT and lsn not in self.entries:
+                    try:
+                        summary = self.make_summary(lsn, stamp, parse_record(payload))
+                    except Exception as e:
+                        print(f"Günlükteki kayıt okunamadı ({lsn}): {e}")
+                        continue
+                    self.add_entry(lsn, number, offset, length, summary)
+                elif kind == DELETE:
+                    tombstones.add(target)
+                elif kind == CLEAR:
+                    clear_lsn = max(clear_lsn, lsn)
+
+        for record_id in list(self.entries):
+            if record_id in tombstones or record_id < clear_lsn:
+                self.drop_entry(record_id)
+
+        self.active_segment = numbers[-1] if numbers else 1
+        self.segment_sizes = {number: os.path.getsize(self.segment_path(number)) for number in numbers}
+        self.segment_sizes.setdefault(self.active_segment, 0)
+        if start != self.segment_sizes:
+            self.write_snapshot()
+
+    def snapshot_matches(self, snapshot, numbers):
+        """Dizin dosyasının gösterdiği segmentler hâlâ yerinde mi"""
+        for number, size in snapshot["segments"].items():
+            number = int(number)
+            if size == 0:
+                continue
+            if number not in numbers or os.path.getsize(self.segment_path(number)) < size:
+                return False
+        return True
+
+    def read_frames(self, number, start=0):
+        """Segmentteki çerçeveleri sırayla döndür; yarım kalmış son çerçeve kesilir"""
+        path = self.segment_path(number)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        offset = start
+        while offset + FRAME.size <= len(data):
+            magic, kind, lsn, target, stamp, length, checksum = FRAME.unpack_from(data, offset)
+            end = offset + FRAME.size + length
+            payload = data[offset + FRAME.size:end]
+            if magic != FRAME_MAGIC or len(payload) != length or zlib.crc32(payload) != checksum:
+                break
+            yield kind, lsn, target, stamp, offset, end - offset, payload
+            offset = end
+
+        if offset < len(data):
+            # Kesinti sırasında yarım yazılmış çerçeve
+            print(f"Günlük segmenti {path} {offset}. baytta kesiliyor")
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+
+    def read_snapshot(self):
+        try:
+            with open(os.path.join(self.directory, INDEX_FILENAME), "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get("version") != INDEX_VERSION:
+            return None
+        return snapshot
+
+    def write_snapshot(self):
+        """Dizini atomik olarak yeniden yaz (kilit tutulurken çağrılır)"""
+        snapshot = {
+            "version": INDEX_VERSION,
+            "next_lsn": self.next_lsn,
+            "segments": {str(number): size for number, size in self.segment_sizes.items()},
+            "entries": [[record_id, segment, offset, length, summary]
+                        for record_id, (segment, offset, length, summary) in self.entries.items()],
+        }
+        path = os.path.join(self.directory, INDEX_FILENAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        self.unsaved_frames = 0
+
+    # Bellekteki dizin
+
+    @staticmethod
+    def make_summary(record_id, stamp, record):
+        summary = summarize(record)
+        summary["path"] = record_key(record_id)
+        summary["mtime"] = stamp
+        return summary
+
+    def add_entry(self, record_id, segment, offset, length, summary):
+        self.entries[record_id] = (segment, offset, length, summary)
+        bisect.insort(self.order, (summary["mtime"], summary["path"]))
+        self.live_bytes += length
+
+    def drop_entry(self, record_id):
+        segment, offset, length, summary = self.entries.pop(record_id)
+        position = bisect.bisect_left(self.order, (summary["mtime"], summary["path"]))
+        del self.order[position]
+        self.live_bytes -= length
+
+    # Yazma
+
+    def append_frames(self, frames):
+        """Çerçeveleri etkin segmentin sonuna tek yazma ve tek fsync ile ekle (kilit tutulurken çağrılır)
+
+        frames: (tür, hedef, veri, zaman) dörtlüleri. Her çerçeve için
+        (sıra no, segment, konum, boyut) döndürür. Kesinti olursa yarım kalan
+        son çerçeve açılışta kesilir, öncekiler geçerli kalır.
+        """
+        if self.segment_sizes[self.active_segment] >= self.SEGMENT_SIZE:
+            self.active_segment = max(self.segment_sizes) + 1
+            self.segment_sizes[self.active_segment] = 0
+
+        offset = self.segment_sizes[self.active_segment]
+        placed = []
+        data = []
+        for kind, target, payload, stamp in frames:
+            lsn = self.next_lsn
+            self.next_lsn += 1
+            if kind == PUT:
+                target = lsn
+            frame = FRAME.pack(FRAME_MAGIC, kind, lsn, target, stamp, len(payload), zlib.crc32(payload)) + payload
+            placed.append((lsn, self.active_segment, offset, len(frame)))
+            data.append(frame)
+            offset += len(frame)
+
+        with open(self.segment_path(self.active_segment), "ab") as f:
+            f.write(b"".join(data))
+            f.flush()
+            os.fsync(f.fileno())
+        self.segment_sizes[self.active_segment] = offset
+        self.unsaved_frames += len(placed)
+        return placed
+
+    def append_frame(self, kind, target, payload=b"", stamp=0.0):
+        """Etkin segmentin sonuna bir çerçeve ekle (kilit tutulurken çağrılır)"""
+        return self.append_frames([(kind, target, payload, stamp)])[0]
+
+    def maybe_snapshot(self):
+        """Yeterince çerçeve birikmişse dizini yeniden yaz (kilit tutulurken çağrılır)
+
+        Bellekteki dizin yeni çerçevelere göre güncellendikten sonra çağrılmalıdır;
+        aksi halde dizin segment boyutunu sayıp kaydı saymaz ve kayıt açılışta kaybolur.
+        """
+        if self.unsaved_frames >= self.SNAPSHOT_INTERVAL:
+            self.write_snapshot()
+
+    def append(self, record):
+        """Kaydı günlüğe ekle ve anahtarını döndür"""
+        payload = serialize_record(record)
+        with self.lock:
+            stamp = time.time()
+            lsn, segment, offset, length = self.append_frame(PUT, 0, payload, stamp)
+            self.add_entry(lsn, segment, offset, length, self.make_summary(lsn, stamp, record))
+            self.maybe_snapshot()
+        return record_key(lsn)
+
+    def append_many(self, records):
+        """Kayıtları tek yazma ve tek fsync ile ekle; anahtarlarını sırayla döndür
+
+        Toplu puanlama gibi çok sayıda kaydı birlikte ekleyen çağıranlar için;
+        kayıt başına diske aktarma maliyeti parça başına bire iner.
+        """
+        payloads = [serialize_record(record) for record in records]
+        if not payloads:
+            return []
+        with self.lock:
+            stamp = time.time()
+            placed = self.append_frames([(PUT, 0, payload, stamp) for payload in payloads])
+            for record, (lsn, segment, offset, length) in zip(records, placed):
+                self.add_entry(lsn, segment, offset, length, self.make_summary(lsn, stamp, record))
+            self.maybe_snapshot()
+        return [record_key(lsn) for lsn, segment, offset, length in placed]
+
+    def delete(self, keys):
+        """Kayıtları mezar taşı ekleyerek sil"""
+        if isinstance(keys, str):
+            keys = [keys]
+        with self.lock:
+            for key in keys:
+                target = record_id(key)
+                if target in self.entries:
+                    self.append_frame(DELETE, target)
+                    self.drop_entry(target)
+            self.maybe_snapshot()
+
+    def clear(self):
+        """Tüm kayıtları tek bir çerçeveyle sil"""
+        with self.lock:
+            self.append_frame(CLEAR, 0)
+            self.entries.clear()
+            self.order.clear()
+            self.live_bytes = 0
+            self.maybe_snapshot()
+
+    # Okuma
+
+    def load(self, key):
+        """Kaydı segmentten oku"""
+        return parse_record(self.load_data(key))
+
+    def load_data(self, key):
+        """Kaydın segmentte saklanan ham verisi (sıkıştırılmış biçim veya JSON)"""
+        with self.lock:
+            segment, offset, length, summary = self.entries[record_id(key)]
+            with open(self.segment_path(segment), "rb") as f:
+                f.seek(offset)
+                frame = f.read(length)
+        return frame[FRAME.size:]
+
+    def attempts(self, title):
+        """Aynı başlıklı kayıtlar (anahtar, mtime, uzunluk), eskiden yeniye"""
+        with self.lock:
+            found = [(summary["mtime"], summary["path"], length)
+                     for segment, offset, length, summary in self.entries.values()
+                     if summary["title"] == title]
+        return [(key, mtime, length) for mtime, key, length in sorted(found)]
+
+    def summary(self, key):
+        with self.lock:
+            return dict(self.entries[record_id(key)][3])
+
+    def count(self):
+        return len(self.order)
+
+    def page(self, limit, after=None):
+        """'after' özetinden sonra gelen en fazla 'limit' özet (yeniden eskiye)"""
+        with self.lock:
+            if after is None:
+                end = len(self.order)
+            else:
+                end = bisect.bisect_left(self.order, (after["mtime"], after["path"]))
+            start = max(0, end - limit)
+            keys = self.order[start:end]
+            return [dict(self.entries[record_id(key)][3]) for stamp, key in reversed(keys)]
+
+    # Sıkıştırma
+
+    def total_bytes(self):
+        return sum(self.segment_sizes.values())
+
+    def needs_compaction(self):
+        garbage = self.total_bytes() - self.live_bytes
+        return (not self.compacting and garbage >= self.COMPACT_MIN_BYTES
+                and garbage >= self.COMPACT_RATIO * self.total_bytes())
+
+    def compact(self):
+        """Canlı kayıtları yeni bir segmente kopyala, eski segmentleri sil
+
+        Etkin segment önce mühürlenir; kopyalama sırasında yeni eklemeler ve
+        silmeler yeni segmente gider ve engellenmez.
+        """
+        with self.lock:
+            if self.compacting:
+                return
+            self.compacting = True
+            sealed = sorted(self.segment_sizes)
+            self.active_segment = sealed[-1] + 1
+            target = self.active_segment + 1
+            self.segment_sizes[self.active_segment] = 0
+            live = [(record_id, segment, offset, length)
+                    for record_id, (segment, offset, length, summary) in self.entries.items()
+                    if segment in sealed]
+
+        try:
+            # Mühürlü segmentler artık değişmez; kilit tutulmadan okunabilir
+            temp_path = self.segment_path(target) + ".tmp"
+            moved = {}
+            live.sort(key=lambda item: (item[1], item[2]))
+            with open(temp_path, "wb") as out:
+                handles = {}
+                try:
+                    for record_id, segment, offset, length in live:
+                        if segment not in handles:
+                            handles[segment] = open(self.segment_path(segment), "rb")
+                        source = handles[segment]
+                        source.seek(offset)
+                        moved[record_id] = (out.tell(), length)
+                        out.write(source.read(length))
+                finally:
+                    for handle in handles.values():
+                        handle.close()
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(temp_path, self.segment_path(target))
+
+            with self.lock:
+                for record_id, (offset, length) in moved.items():
+                    entry = self.entries.get(record_id)
+                    # Kopyalama sırasında silinen kayıtlar atlanır
+                    if entry is not None:
+                        self.entries[record_id] = (target, offset, length, entry[3])
+                self.segment_sizes[target] = os.path.getsize(self.segment_path(target))
+                for number in sealed:
+                    del self.segment_sizes[number]
+                    os.remove(self.segment_path(number))
+                # Yeni eklemeler sıkıştırılmış segmentten sonra gelsin
+                if self.segment_sizes[self.active_segment] == 0:
+                    del self.segment_sizes[self.active_segment]
+                    if os.path.exists(self.segment_path(self.active_segment)):
+                        os.remove(self.segment_path(self.active_segment))
+                    self.active_segment = target
+                self.write_snapshot()
+        finally:
+            with self.lock:
+                self.compacting = False
+
+    def close(self):
+        with self.lock:
+            if self.unsaved_frames:
+                self.write_snapshot()
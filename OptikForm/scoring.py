@@ -0,0 +1,113 @@
+import numpy as np
+
+from answer_sheet import UNMARKED, CORRECT, WRONG, EMPTY, NO_OPTION, STATE_CODES, OPTION_CODES
+
+# Farklı uzunluktaki sınavlar aynı matrise konurken boş kalan hücreler
+PADDING = 255
+
+
+def compute_score(correct, wrong, total, wrong_ratio):
+    """Puanı hesapla: [(Doğru - Yanlış / Oran) / Toplam] x 100
+
+    Skaler değerlerle veya (oturum sayısı uzunluğunda) NumPy dizileriyle
+    çalışır; negatif puanlar 0'a çekilir.
+    """
+    if np.ndim(correct) == 0 and np.ndim(wrong) == 0 and np.ndim(total) == 0 and np.ndim(wrong_ratio) == 0:
+        if total == 0:
+            return 0
+        score = ((correct - (wrong / wrong_ratio)) / total) * 100
+        return max(0, score)  # Prevent negative scores
+
+    correct = np.asarray(correct, dtype=np.float64)
+    wrong = np.asarray(wrong, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+    wrong_ratio = np.asarray(wrong_ratio, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        score = ((correct - (wrong / wrong_ratio)) / total) * 100
+    score = np.where(total > 0, score, 0.0)
+    return np.maximum(score, 0.0)
+
+
+def count_states(states, selected):
+    """Her oturum için doğru, yanlış, boş ve toplam soru sayılarını döndür
+
+    states ve selected (oturum x soru) boyutlu uint8 dizileridir; PADDING
+    hücreleri hiçbir sayıya katılmaz.
+    """
+    states = np.atleast_2d(np.asarray(states, dtype=np.uint8))
+    selected = np.atleast_2d(np.asarray(selected, dtype=np.uint8))
+
+    correct = np.count_nonzero(states == CORRECT, axis=1)
+    wrong = np.count_nonzero(states == WRONG, axis=1)
+    empty = np.count_nonzero((states == EMPTY) | ((states == UNMARKED) & (selected == NO_OPTION)), axis=1)
+    total = np.count_nonzero(states != PADDING, axis=1)
+    return correct, wrong, empty, total
+
+
+def score_sheets(states, selected, wrong_ratio):
+    """Tüm kağıtları tek seferde puanla
+
+    wrong_ratio tek bir sayı ya da oturum başına bir değer içeren dizi
+    olabilir. Sonuç, her anahtar için oturum sayısı uzunluğunda dizi
+    içeren bir sözlüktür.
+    """
+    correct, wrong, empty, total = count_states(states, selected)
+    return {
+        "score": compute_score(correct, wrong, total, wrong_ratio),
+        "correct": correct,
+        "wrong": wrong,
+        "empty": empty,
+        "total": total,
+    }
+
+
+def records_to_arrays(records):
+    """Kayıtlardaki 'questions' listelerini (oturum x soru) dizilerine çevir
+
+    Kısa sınavlar PADDING ile doldurulur. Soru detayı olmayan eski
+    kayıtların satırı tamamen PADDING kalır.
+    """
+    question_counts = [len(record.get('questions') or []) for record in records]
+    width = max(question_counts, default=0)
+
+    states = np.full((len(records), width), PADDING, dtype=np.uint8)
+    selected = np.zeros((len(records), width), dtype=np.uint8)
+
+    for i, record in enumerate(records):
+        questions = record.get('questions') or []
+        if not questions:
+            continue
+        count = len(questions)
+        states[i, :count] = [STATE_CODES.get(q.get('state'), UNMARKED) for q in questions]
+        selected[i, :count] = [OPTION_CODES.get(q.get('selected_option'), NO_OPTION) for q in questions]
+
+    return states, selected
+
+
+def score_records(records, wrong_ratio=None):
+    """Kayıtlı sonuçları yeniden puanla
+
+    wrong_ratio verilmezse her kaydın kendi oranı kullanılır. Soru detayı
+    olmayan eski kayıtlar için kayıttaki doğru/yanlış/boş sayıları esas
+    alınır.
+    """
+    states, selected = records_to_arrays(records)
+    correct, wrong, empty, total = count_states(states, selected)
+    result = {"correct": correct, "wrong": wrong, "empty": empty, "total": total}
+
+    if wrong_ratio is None:
+        wrong_ratio = np.array([record.get('wrong_ratio', 4) for record in records], dtype=np.float64)
+
+    # Detaysız kayıtlar: sayıları kayıttan al
+    legacy = result["total"] == 0
+    if np.any(legacy):
+        for i in np.flatnonzero(legacy):
+            record = records[i]
+            result["correct"][i] = record.get('correct', 0)
+            result["wrong"][i] = record.get('wrong', 0)
+            result["empty"][i] = record.get('empty', 0)
+            result["total"][i] = result["correct"][i] + result["wrong"][i] + result["empty"][i]
+
+    result["score"] = compute_score(result["correct"], result["wrong"], result["total"], wrong_ratio)
+    return result
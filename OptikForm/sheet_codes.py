@@ -0,0 +1,15 @@
+# Şık ve durum kodları; NumPy veya Qt gerektirmeden (ör. komut satırı aracından) kullanılabilir
+OPTIONS = ['A', 'B', 'C', 'D', 'E']
+
+# Soru durumlarının sayısal kodları (durum dizisinde uint8 olarak saklanır)
+UNMARKED = 0
+CORRECT = 1
+WRONG = 2
+EMPTY = 3
+
+STATE_NAMES = ("unmarked", "correct", "wrong", "empty")
+STATE_CODES = {name: code for code, name in enumerate(STATE_NAMES)}
+
+# Seçim dizisinde 0 = şık seçilmedi, 1..5 = A..E
+NO_OPTION = 0
+OPTION_CODES = {option: code for code, option in enumerate(OPTIONS, start=1)}
@@ -0,0 +1,29 @@
+import sys
+import time
+
+# Açılış süresi ölçümü (--trace-startup). Bu modül main.py'de ilk olarak
+# içe aktarılır; süreler o andan itibaren ölçülür.
+_start = time.perf_counter()
+_last = _start
+_phases = []
+
+enabled = "--trace-startup" in sys.argv
+
+
+def mark(phase):
+    """Önceki işaretten bu yana geçen süreyi 'phase' adıyla kaydet"""
+    global _last
+    if not enabled:
+        return
+    now = time.perf_counter()
+    _phases.append((phase, now - _last, now - _start))
+    _last = now
+
+
+def report():
+    """Aşamaları ve toplam süreyi yazdır"""
+    if not enabled:
+        return
+    print("Açılış süreleri (ms):")
+    for phase, duration, total in _phases:
+        print(f"  {phase:<28} {duration * 1000:8.1f}   (toplam {total * 1000:8.1f})")
@@ -0,0 +1,16 @@
+import os
+import sys
+
+# Modüller uygulama klasöründe düz olarak durur (python main.py ile çalıştırıldığı gibi)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+# Pencereler ekran olmadan oluşturulur
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
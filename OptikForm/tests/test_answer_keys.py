@@ -0,0 +1,110 @@
+import json
+
+import numpy as np
+import pytest
+
+from answer_keys import AnswerKeyStore, parse_key, format_key, key_codes, codes_to_key
+from answer_sheet import AnswerSheet
+from sheet_codes import UNMARKED, CORRECT, WRONG, EMPTY, NO_OPTION
+
+
+def test_parse_key_ignores_numbers_and_separators():
+    assert parse_key("1.a 2.b, 3) -\n4:E 5 x") == "AB-E-"
+    assert parse_key("abcde ABCDE") == "ABCDEABCDE"
+
+
+def test_parse_key_rejects_unknown_letters():
+    with pytest.raises(ValueError):
+        parse_key("ABF")
+
+
+def test_key_codes_round_trip():
+    key = "AB-DE-C"
+    codes = key_codes(key)
+    assert codes.tolist() == [1, 2, NO_OPTION, 4, 5, NO_OPTION, 3]
+    assert codes_to_key(codes) == key
+    assert format_key("ABCDEABCDEAB") == "ABCDE ABCDE AB"
+
+
+def sheet_with(answers):
+    sheet = AnswerSheet(len(answers))
+    for index, option in enumerate(answers):
+        if option != "-":
+            sheet.select_option(index, option)
+    return sheet
+
+
+def test_grade_marks_correct_wrong_and_empty():
+    sheet = sheet_with("ABC-E")
+    assert sheet.grade(key_codes("ABDAE")) == 5
+
+    assert sheet.states.tolist() == [CORRECT, CORRECT, WRONG, EMPTY, CORRECT]
+    assert sheet.is_correct.tolist() == [True, True, False, False, True]
+    assert sheet.was_empty.tolist() == [False, False, False, True, False]
+    assert (sheet.correct_count, sheet.wrong_count, sheet.empty_count) == (3, 1, 1)
+    # Seçimler değişmez
+    assert [sheet.selected_option(i) for i in range(5)] == ["A", "B", "C", None, "E"]
+
+
+def test_questions_without_key_keep_their_state():
+    sheet = sheet_with("ABCD")
+    sheet.mark_state(1, "wrong")
+    sheet.mark_state(3, "correct")
+    assert sheet.grade(key_codes("A-")) == 1
+
+    assert sheet.states.tolist() == [CORRECT, WRONG, UNMARKED, CORRECT]
+    assert sheet.is_correct.tolist() == [True, False, False, True]
+    assert (sheet.correct_count, sheet.wrong_count, sheet.empty_count) == (2, 1, 0)
+
+
+def test_key_longer_than_sheet_is_truncated():
+    sheet = sheet_with("AB")
+    assert sheet.grade(key_codes("ABCDE")) == 2
+    assert sheet.states.tolist() == [CORRECT, CORRECT]
+
+
+def test_grade_matches_marking_each_question_by_hand():
+    rng = np.random.default_rng(3)
+    answers = "".join(rng.choice(list("ABCDE-"), 200))
+    key = "".join(rng.choice(list("ABCDE-"), 200))
+
+    graded = sheet_with(answers)
+    graded.grade(key_codes(key))
+
+    by_hand = sheet_with(answers)
+    for index, (answer, correct) in enumerate(zip(answers, key)):
+        if correct == "-":
+            continue
+        if answer == "-":
+            by_hand.mark_state(index, "empty")
+        else:
+            by_hand.mark_state(index, "correct" if answer == correct else "wrong")
+
+    assert graded.to_questions_data() == by_hand.to_questions_data()
+    assert graded.state_counts == by_hand.state_counts
+    assert graded.empty_count == by_hand.empty_count
+
+
+def test_store_persists_keys_by_normalized_title(tmp_path):
+    path = str(tmp_path / "keys" / "answer_keys.json")
+    store = AnswerKeyStore(path)
+    store.set("  Matematik   2024 Güz Vize ", "ABCDE")
+    store.set("Fizik Final", "EDCBA")
+    store.remove("Fizik Final")
+
+    reopened = AnswerKeyStore(path)
+    assert reopened.get("Matematik 2024 Güz Vize") == "ABCDE"
+    assert reopened.get("Fizik Final") is None
+    assert reopened.titles() == ["Matematik 2024 Güz Vize"]
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"Matematik 2024 Güz Vize": "ABCDE"}
+
+
+def test_store_survives_corrupt_file(tmp_path):
+    path = tmp_path / "answer_keys.json"
+    path.write_text("{yarım", encoding="utf-8")
+    store = AnswerKeyStore(str(path))
+    assert store.get("Matematik") is None
+    store.set("Matematik", "AB")
+    assert AnswerKeyStore(str(path)).get("Matematik") == "AB"
+
@@ -0,0 +1,147 @@
+import os
+
+import numpy as np
+import pytest
+
+from answer_sheet import AnswerSheet
+from autosave import AutosaveJournal, read_journal, FRAME, SNAPSHOT, DELTA_FRAME
+from result_writer import ResultWriter
+
+QUESTIONS = 30
+
+
+@pytest.fixture
+def journal(qapp, tmp_path):
+    sheet = AnswerSheet(QUESTIONS)
+    meta = {"question_count": QUESTIONS, "title": "Fizik Vize", "wrong_ratio": 4, "locked": False}
+    writer = ResultWriter()
+    journal = AutosaveJournal(sheet, lambda: dict(meta, question_count=len(sheet)), writer,
+                              str(tmp_path / "autosave" / "sheet.journal"))
+    yield journal
+    writer.flush()
+
+
+def flush(journal):
+    journal.flush()
+    journal.writer.flush()
+
+
+def frame_kinds(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    kinds, offset = [], 0
+    while offset < len(data):
+        kind, length, checksum = FRAME.unpack_from(data, offset)
+        kinds.append(kind)
+        offset += FRAME.size + length
+    return kinds
+
+
+def click(journal, index, option=None, state=None):
+    if option is not None:
+        journal.sheet.select_option(index, option)
+    if state is not None:
+        journal.sheet.mark_state(index, state)
+    journal.question_changed(index)
+
+
+def assert_restored(journal, state):
+    meta, states, selected, is_correct, was_empty = state
+    sheet = journal.sheet
+    assert meta["title"] == "Fizik Vize"
+    assert np.array_equal(states, sheet.states)
+    assert np.array_equal(selected, sheet.selected)
+    assert np.array_equal(is_correct, sheet.is_correct)
+    assert np.array_equal(was_empty, sheet.was_empty)
+
+
+def test_snapshot_and_deltas_replay_to_current_sheet(journal):
+    flush(journal)
+    click(journal, 0, "A")
+    click(journal, 1, "B", "correct")
+    flush(journal)
+    click(journal, 2, state="empty")
+    click(journal, 0, "C")
+    flush(journal)
+
+    assert frame_kinds(journal.path) == [SNAPSHOT, DELTA_FRAME, DELTA_FRAME]
+    assert_restored(journal, read_journal(journal.path))
+
+    restored = AnswerSheet(QUESTIONS)
+    meta, *arrays = read_journal(journal.path)
+    restored.load_state(*arrays)
+    assert (restored.correct_count, restored.wrong_count, restored.empty_count) == \
+        (journal.sheet.correct_count, journal.sheet.wrong_count, journal.sheet.empty_count)
+
+
+def test_torn_last_frame_is_ignored(journal):
+    flush(journal)
+    click(journal, 0, "A")
+    flush(journal)
+    expected = read_journal(journal.path)
+    click(journal, 1, "B")
+    flush(journal)
+
+    # Kesinti: son DELTA çerçevesi yarım yazılmış
+    with open(journal.path, "r+b") as f:
+        f.truncate(os.path.getsize(journal.path) - 2)
+    state = read_journal(journal.path)
+    assert np.array_equal(state[2], expected[2])
+    assert state[2][0] != 0 and state[2][1] == 0
+
+
+def test_corrupt_frame_stops_replay(journal):
+    flush(journal)
+    click(journal, 0, "A")
+    flush(journal)
+    click(journal, 1, "B")
+    flush(journal)
+
+    with open(journal.path, "r+b") as f:
+        data = bytearray(f.read())
+        # İlk DELTA çerçevesinin verisini boz; sonraki çerçeve de uygulanmaz
+        snapshot_end = FRAME.size + FRAME.unpack_from(data, 0)[1]
+        data[snapshot_end + FRAME.size] ^= 0xFF
+        f.seek(0)
+        f.write(data)
+    state = read_journal(journal.path)
+    assert not state[2].any()
+
+
+def test_session_change_rewrites_snapshot(journal):
+    flush(journal)
+    click(journal, 0, "A")
+    flush(journal)
+    journal.sheet.resize(40)
+    journal.session_changed()
+    flush(journal)
+
+    assert frame_kinds(journal.path) == [SNAPSHOT]
+    assert read_journal(journal.path)[0]["question_count"] == 40
+    assert_restored(journal, read_journal(journal.path))
+    assert not any(name.endswith(".tmp") for name in os.listdir(os.path.dirname(journal.path)))
+
+
+def test_long_journal_is_checkpointed(journal):
+    journal.CHECKPOINT_FRAMES = 5
+    flush(journal)
+    for i in range(6):
+        click(journal, i, "D")
+        flush(journal)
+
+    assert frame_kinds(journal.path) == [SNAPSHOT]
+    assert_restored(journal, read_journal(journal.path))
+
+
+def test_changes_are_coalesced_until_flush(journal):
+    flush(journal)
+    for option in "ABCDE":
+        click(journal, 3, option)
+    click(journal, 4, "A")
+    flush(journal)
+    assert frame_kinds(journal.path) == [SNAPSHOT, DELTA_FRAME]
+    assert_restored(journal, read_journal(journal.path))
+
+
+def test_missing_journal(tmp_path):
+    assert read_journal(str(tmp_path / "yok.journal")) is None
@@ -0,0 +1,140 @@
+import csv
+import datetime
+import os
+
+import numpy as np
+import pytest
+
+import optikform
+from answer_keys import key_codes
+from answer_sheet import AnswerSheet
+from bulk_grade import read_rows, grade_rows, grade_matrix
+from record_format import decode_record
+from result_files import load_record
+from results_log import ResultsLog
+from scoring import compute_score
+
+KEY = "ABCDEABCDE"
+WHEN = datetime.datetime(2024, 5, 6, 10, 30)
+
+
+def write_lines(path, lines, encoding="utf-8"):
+    path.write_text("\n".join(lines) + "\n", encoding=encoding)
+    return str(path)
+
+
+def test_read_rows_with_header_and_named_columns(tmp_path):
+    path = write_lines(tmp_path / "sinif.csv", [
+        "Numara,Öğrenci,Cevaplar",
+        "1,Ayşe,ABCDE ABCDE",
+        "",
+        "2,Mehmet,AB-DE",
+    ], encoding="utf-8-sig")
+    assert list(read_rows(path)) == [(2, "Ayşe", "ABCDE ABCDE"), (4, "Mehmet", "AB-DE")]
+    assert [row[1] for row in read_rows(path, student_column="Numara")] == ["1", "2"]
+
+
+def test_read_rows_tsv_without_header(tmp_path):
+    path = write_lines(tmp_path / "sinif.tsv", ["Ayşe\t10\tABCDE", "Mehmet\t11\tEDCBA"])
+    assert list(read_rows(path)) == [(1, "Ayşe", "ABCDE"), (2, "Mehmet", "EDCBA")]
+    assert [row[1] for row in read_rows(path, student_column="2")] == ["10", "11"]
+
+
+def test_read_rows_semicolon(tmp_path):
+    path = write_lines(tmp_path / "sinif.csv", ["ad;cevap", "Ayşe;ABC"])
+    assert list(read_rows(path)) == [(2, "Ayşe", "ABC")]
+
+
+def test_grade_matrix_matches_answer_sheet():
+    rng = np.random.default_rng(5)
+    key = key_codes("".join(rng.choice(list("ABCDE-"), 50)))
+    selected = rng.integers(0, 6, size=(20, 50), dtype=np.uint8)
+    codes, states = grade_matrix(selected, key)
+    for row in range(len(selected)):
+        sheet = AnswerSheet(50)
+        sheet.load_state(np.zeros(50, dtype=np.uint8), selected[row], np.zeros(50, bool), np.zeros(50, bool))
+        sheet.grade(key)
+        assert np.array_equal(states[row], sheet.states)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_grade_rows_writes_one_record_per_student(tmp_path, workers):
+    rows = [(2, "Ayşe", "ABCDEABCDE"), (3, "Mehmet", "AB-DE"), (4, "Zeynep", "ABCXZ"),
+            (5, "Ali", "ABCDEABCDEA"), (6, "Ayşe", "EDCBA")]
+    results = list(grade_rows(rows, key_codes(KEY), "Fizik Vize", 4, str(tmp_path), WHEN,
+                              workers=workers, chunk_rows=2))
+
+    assert [result[0] for result in results] == [2, 3, 4, 5, 6]
+    errors = {result[0]: result[8] for result in results if result[8]}
+    assert sorted(errors) == [4, 5]
+
+    ayse = results[0]
+    assert ayse[2:7] == ("Fizik Vize - Ayşe", 100, 10, 0, 0)
+    mehmet = results[1]
+    assert mehmet[4:7] == (4, 0, 6)
+    assert mehmet[3] == compute_score(4, 0, 10, 4)
+
+    # Aynı adlı öğrenciler satır numarasıyla ayrılır; yarım kalmış geçici dosya yok
+    files = sorted(os.listdir(tmp_path))
+    assert len(files) == 3 and not any(name.endswith(".tmp") for name in files)
+    record = load_record(ayse[7])
+    assert record["title"] == "Fizik Vize - Ayşe"
+    assert record["date"] == "2024-05-06 10:30"
+    assert [q["state"] for q in record["questions"]] == ["correct"] * 10
+
+
+def test_grade_rows_json_format_and_in_memory_records(tmp_path):
+    rows = [(2, "Ayşe", "ABCDE")]
+    written = list(grade_rows(rows, key_codes(KEY), "Fizik", results_dir=str(tmp_path), when=WHEN,
+                              extension=".json", workers=1))
+    in_memory = list(grade_rows(rows, key_codes(KEY), "Fizik", when=WHEN, workers=1))
+    assert written[0][7].endswith(".json")
+    assert load_record(written[0][7]) == decode_record(in_memory[0][7])
+
+
+@pytest.mark.parametrize("use_log", [False, True])
+def test_grade_command(tmp_path, use_log):
+    answers = write_lines(tmp_path / "sinif.tsv", ["Öğrenci\tCevaplar"] +
+                          [f"Öğrenci {i}\t{KEY[:i]}" for i in range(1, 11)])
+    results_dir = tmp_path / "sonuclar"
+    summary = tmp_path / "ozet.csv"
+    argv = ["--dir", str(results_dir)] + (["--log"] if use_log else []) + \
+        ["grade", answers, "--title", "Fizik", "--key", KEY, "--workers", "1", "-o", str(summary)]
+    assert optikform.main(argv) == 0
+
+    with open(summary, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row["correct"]) for row in rows] == list(range(1, 11))
+    if use_log:
+        log = ResultsLog(str(results_dir / "log"))
+        assert [row["path"] for row in rows] == [f"log:{i}" for i in range(1, 11)]
+        assert log.load(rows[2]["path"])["title"] == "Fizik - Öğrenci 3"
+        assert log.count() == 10
+    else:
+        assert all(load_record(row["path"])["correct"] == int(row["correct"]) for row in rows)
+
+
+def test_grade_command_reports_bad_rows(tmp_path, capsys):
+    answers = write_lines(tmp_path / "sinif.csv", ["Öğrenci,Cevaplar", "Ayşe,ABC", "Mehmet,AB?Q"])
+    argv = ["--dir", str(tmp_path / "sonuclar"), "grade", answers, "--title", "Fizik", "--key", KEY,
+            "--workers", "1"]
+    assert optikform.main(argv) == 1
+    assert "Satır 3 puanlanamadı (Mehmet)" in capsys.readouterr().err
+
+
+def test_student_names_cannot_leave_results_dir(tmp_path, capsys):
+    answers = write_lines(tmp_path / "sinif.csv", ["Öğrenci,Cevaplar", "Ali/Veli,ABC", "../escape,ABC",
+                                                   "/../../x,ABC"])
+    results_dir = tmp_path / "sonuclar"
+    argv = ["--dir", str(results_dir), "grade", answers, "--title", "Deneme", "--key", KEY,
+            "--workers", "1", "-o", str(tmp_path / "ozet.csv")]
+    assert optikform.main(argv) == 0
+
+    names = os.listdir(results_dir)
+    assert len([name for name in names if name.endswith(".okr")]) == 3
+    assert all(os.path.isfile(results_dir / name) for name in names if name.endswith(".okr"))
+    assert sorted(os.listdir(tmp_path)) == ["ozet.csv", "sinif.csv", "sonuclar"]
+
+    capsys.readouterr()
+    assert optikform.main(["--dir", str(results_dir), "stats"]) == 0
+    assert "Test sayısı      : 3" in capsys.readouterr().out
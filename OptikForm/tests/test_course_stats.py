@@ -0,0 +1,139 @@
+import glob
+import os
+import random
+
+import pytest
+
+from course_stats import CourseStats, parse_title
+from result_files import load_record, summarize
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUNDLED_TITLES = {
+    "Ağ Yön. ve Bil. Sis. 2018 Bahar Vize": ("Ağ Yön. ve Bil. Sis.", "Vize"),
+    "Ağ Yön. ve Bil. Sis. 2023-2024 Bahar Vize": ("Ağ Yön. ve Bil. Sis.", "Vize"),
+    "Veritabanı Programlama 2019 Bahar Vize": ("Veritabanı Programlama", "Vize"),
+    "Ağ Yönetimi ve Bilgi Güvenliği 2018 Bahar Vize": ("Ağ Yönetimi ve Bilgi Güvenliği", "Vize"),
+    "Yeni Test": ("Yeni Test", ""),
+}
+
+
+def bundled_records():
+    paths = glob.glob(os.path.join(APP_DIR, "test_results", "*.json")) + \
+        glob.glob(os.path.join(APP_DIR, "KaplanOptikForm", "test_results", "*.json"))
+    return [load_record(path) for path in sorted(paths)]
+
+
+@pytest.mark.parametrize("title, expected", sorted(BUNDLED_TITLES.items()))
+def test_parse_title_on_bundled_titles(title, expected):
+    assert parse_title(title) == expected
+
+
+def test_bundled_records_group_by_course():
+    records = bundled_records()
+    if not records:
+        pytest.skip("örnek kayıtlar yok")
+    groups = {parse_title(record["title"]) for record in records}
+    assert {course for course, exam in groups} >= {"Ağ Yön. ve Bil. Sis.", "Veritabanı Programlama"}
+    # Yıl ve dönem gruplamaya katılmaz
+    assert sum(1 for record in records if parse_title(record["title"])[0] == "Veritabanı Programlama") == 4
+
+
+@pytest.mark.parametrize("title, expected", [
+    ("Matematik 2024 Güz Final", ("Matematik", "Final")),
+    ("Matematik 2024/2025 Bahar Bütünleme", ("Matematik", "Bütünleme")),
+    ("Fizik Vize", ("Fizik", "Vize")),
+    ("  Fizik   2020  Büt ", ("Fizik", "Büt")),
+    ("Kimya 2019", ("Kimya", "")),
+    ("Vize", ("Vize", "Vize")),
+])
+def test_parse_title(title, expected):
+    assert parse_title(title) == expected
+
+
+def random_summaries(rng, count, start=0):
+    titles = ["Matematik 2023 Güz Vize", "Matematik 2024 Güz Vize", "Matematik 2024 Bahar Final",
+              "Fizik 2022 Bahar Vize", "Yeni Test"]
+    return [{
+        "path": f"kayit_{start + i}.okr",
+        "title": rng.choice(titles),
+        "date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00",
+        "score": round(rng.uniform(0, 100), 2),
+    } for i in range(count)]
+
+
+def assert_same_groups(stats, expected, by_exam=True):
+    actual = sorted(stats.groups(by_exam), key=lambda group: (group["course"], group["exam"]))
+    wanted = sorted(expected.groups(by_exam), key=lambda group: (group["course"], group["exam"]))
+    assert len(actual) == len(wanted)
+    for group, other in zip(actual, wanted):
+        for field in ("course", "exam", "attempts", "median", "best", "last_date"):
+            assert group[field] == other[field], field
+        for field in ("mean", "std", "trend"):
+            if other[field] is None:
+                assert group[field] is None
+            else:
+                assert group[field] == pytest.approx(other[field], rel=1e-6, abs=1e-6), field
+
+
+@pytest.fixture
+def stats(tmp_path):
+    stats = CourseStats(str(tmp_path), db_path=str(tmp_path / "stats.sqlite3"))
+    yield stats
+    stats.close()
+
+
+@pytest.fixture
+def rebuilt(tmp_path):
+    stats = CourseStats(str(tmp_path), db_path=str(tmp_path / "rebuilt.sqlite3"))
+    yield stats
+    stats.close()
+
+
+def test_incremental_add_and_remove_match_rebuild(stats, rebuilt):
+    rng = random.Random(7)
+    live = {}
+    for batch in range(5):
+        added = random_summaries(rng, 40, start=batch * 40)
+        stats.add(added)
+        live.update((summary["path"], summary) for summary in added)
+
+        removed = rng.sample(sorted(live), 15)
+        stats.remove(removed)
+        for key in removed:
+            del live[key]
+
+        # Değişen kayıt (aynı yol, yeni başlık/puan) yeniden eklenir
+        changed = dict(live[rng.choice(sorted(live))], title="Fizik 2022 Bahar Vize", score=12.5)
+        stats.add([changed])
+        live[changed["path"]] = changed
+
+    rebuilt.rebuild(live.values())
+    assert stats.count() == rebuilt.count() == len(live)
+    assert_same_groups(stats, rebuilt)
+    assert_same_groups(stats, rebuilt, by_exam=False)
+
+
+def test_removing_latest_attempt_updates_last_date(stats, rebuilt):
+    summaries = [
+        {"path": "a", "title": "Fizik Vize", "date": "2024-01-10 10:00", "score": 40},
+        {"path": "b", "title": "Fizik Vize", "date": "2024-03-10 10:00", "score": 80},
+    ]
+    stats.add(summaries)
+    stats.remove("b")
+    rebuilt.rebuild(summaries[:1])
+    assert stats.groups()[0]["last_date"] == "2024-01-10"
+    assert_same_groups(stats, rebuilt)
+
+    stats.remove(["a", "olmayan"])
+    assert stats.groups() == [] and stats.count() == 0
+
+
+def test_bundled_records_incremental_match_rebuild(stats, rebuilt):
+    records = bundled_records()
+    if not records:
+        pytest.skip("örnek kayıtlar yok")
+    summaries = [dict(summarize(record), path=f"kayit_{i}") for i, record in enumerate(records)]
+    for summary in summaries:
+        stats.add([summary])
+    rebuilt.rebuild(summaries)
+    assert_same_groups(stats, rebuilt)
@@ -0,0 +1,108 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from answer_sheet import AnswerSheet
+from exam_analysis import build_matrix, question_difficulty, record_codes, read_file, DifficultyCache
+from record_format import encode_record, encode_codes, OPTION_MASK, STATE_SHIFT, WAS_EMPTY_BIT
+from scoring import PADDING
+from sheet_codes import EMPTY, NO_OPTION
+
+BUNDLED = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "KaplanOptikForm", "test_results")
+
+
+def attempt_codes(marks):
+    """marks: soru başına (şık, durum) listesi; "empty+B" önce boş işaretleyip sonra B seçer"""
+    sheet = AnswerSheet(len(marks))
+    for index, mark in enumerate(marks):
+        if mark == "empty+B":
+            sheet.mark_state(index, "empty")
+            sheet.lock()
+            sheet.select_option(index, "B")
+            sheet.is_locked = False
+            continue
+        option, state = mark
+        if option:
+            sheet.select_option(index, option)
+        if state:
+            sheet.mark_state(index, state)
+    record = {"title": "T", "date": "2024-01-01 10:00", "score": 0, "correct": 0, "wrong": 0,
+              "empty": 0, "wrong_ratio": 4, "questions": sheet.to_questions_data()}
+    return record_codes(encode_record(record))
+
+
+def attempt_record(marks):
+    return encode_codes("T", "2024-01-01 10:00", 0, 4, 0, 0, 0, attempt_codes(marks))
+
+
+def test_build_matrix_pads_short_attempts():
+    matrix = build_matrix([b"\x01\x02\x03", b"\x04", b""])
+    assert matrix.tolist() == [[1, 2, 3], [4, PADDING, PADDING], [PADDING] * 3]
+    assert build_matrix([b"\x01\x02", b"\x03\x04"]).tolist() == [[1, 2], [3, 4]]
+    assert build_matrix([]).shape == (0, 0)
+
+
+def test_question_difficulty_rates():
+    rows = [
+        attempt_codes([("A", "correct"), ("B", "wrong"), (None, "empty"), (None, None)]),
+        attempt_codes([("A", "correct"), ("C", "correct"), "empty+B", ("D", "wrong")]),
+        attempt_codes([("A", "wrong"), ("C", "correct")]),
+    ]
+    result = question_difficulty(build_matrix(rows))
+
+    assert result["attempts"].tolist() == [3, 3, 2, 2]
+    assert np.allclose(result["correct_rate"], [2 / 3, 2 / 3, 0, 0])
+    assert np.allclose(result["error_rate"], [1 / 3, 1 / 3, 0, 0.5])
+    # Boş: boş işaretli (sonradan doldurulan dahil) veya hiç dokunulmamış
+    assert np.allclose(result["empty_rate"], [0, 0, 1, 0.5])
+    # 3. soru iki denemede boş bırakıldı, birinde sonradan B seçildi (durum hâlâ boş, mavi)
+    assert result["recovered_rate"][2] == 0.5
+    assert np.isnan(result["recovered_rate"][0])
+    # İlk yarı / son yarı: 2. soru yanlış -> doğru -> doğru
+    assert result["improvement"][1] == pytest.approx(1.0)
+
+
+def test_filled_in_later_counts_as_recovered():
+    result = question_difficulty(build_matrix([attempt_codes(["empty+B", ("A", "correct")])]))
+    assert result["recovered_rate"][0] == 1.0
+
+
+@pytest.mark.skipif(not os.path.isdir(BUNDLED), reason="örnek kayıtlar yok")
+def test_bundled_records_filled_in_later():
+    paths = sorted(glob.glob(os.path.join(BUNDLED, "Veritabanı*.json")))
+    matrix = build_matrix([record_codes(read_file(path)) for path in paths])
+    present = matrix != PADDING
+    options = matrix & OPTION_MASK
+    was_empty = present & ((matrix & WAS_EMPTY_BIT) != 0)
+    # Örnek kayıtlarda 3 denemede 10 soru boş işaretlenip sonradan doldurulmuş
+    filled_later = present & (((matrix >> STATE_SHIFT) & 0x03) == EMPTY) & (options != NO_OPTION)
+    assert np.count_nonzero(filled_later) == 10
+
+    result = question_difficulty(matrix)
+    recovered = np.rint(np.nan_to_num(result["recovered_rate"]) * np.count_nonzero(was_empty, axis=0))
+    assert recovered.tolist() == np.count_nonzero(was_empty & (options != NO_OPTION), axis=0).tolist()
+    assert np.all(recovered[np.any(filled_later, axis=0)] > 0)
+
+def test_difficulty_cache_reads_only_new_attempts(tmp_path):
+    paths = []
+    for i, marks in enumerate([[("A", "correct")], [("B", "wrong")], ["empty+B"]]):
+        path = tmp_path / f"deneme{i}.okr"
+        path.write_bytes(attempt_record(marks))
+        paths.append(str(path))
+    reads = []
+
+    def read(path):
+        reads.append(path)
+        return read_file(path)
+
+    cache = DifficultyCache()
+    attempts = [(path, 1.0, os.path.getsize(path)) for path in paths]
+    first = cache.get("T", attempts[:2], read)
+    assert first["sessions"] == 2 and len(reads) == 2
+    assert cache.get("T", attempts[:2], read) is first and len(reads) == 2
+    second = cache.get("T", attempts, read)
+    assert second["sessions"] == 3 and reads[2:] == [paths[2]]
+
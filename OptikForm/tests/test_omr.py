@@ -0,0 +1,99 @@
+import csv
+import random
+
+import numpy as np
+import pytest
+
+import omr
+from bulk_grade import read_rows
+from form_layout import FormLayout, OPTION_COUNT
+from benchmarks.bench_omr import draw_page
+
+QUESTIONS = 200
+DPI = 150
+
+
+@pytest.fixture
+def layout():
+    layout = FormLayout(QUESTIONS)
+    assert layout.pages == 2
+    return layout
+
+
+def marked_answers(layout, rng):
+    selected = np.zeros(layout.question_count, dtype=np.uint8)
+    for index in range(layout.question_count):
+        if rng.random() < 0.9:
+            selected[index] = rng.randint(1, OPTION_COUNT)
+    return selected
+
+
+def expected_text(selected):
+    return "".join("-ABCDE"[code] for code in selected)
+
+
+def scan_students(folder, layout, students, skip=()):
+    """Her öğrencinin sayfalarını tarayıcı sırasıyla kaydet; (öğrenci, sayfa) skip'tekiler atlanır"""
+    rng = random.Random(1)
+    answers = []
+    number = 0
+    for student in range(students):
+        selected = marked_answers(layout, rng)
+        answers.append(selected)
+        for page in range(layout.pages):
+            if (student, page) in skip:
+                continue
+            draw_page(layout, page, selected, DPI, rng).save(folder / f"scan_{number:04d}.png")
+            number += 1
+    return answers
+
+
+def read_output(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_group_pages_starts_new_student_when_page_code_goes_back():
+    pages = [("a", {"page": 0}), ("b", {"page": 1}), ("c", {"page": 0}),
+             ("d", {"page": 1}), ("e", {"page": 1}), ("f", {"page": 0})]
+    groups = [[path for path, result in group] for group in omr.group_pages(pages)]
+    assert groups == [["a", "b"], ["c", "d"], ["e"], ["f"]]
+
+
+def test_batch_mode_writes_one_merged_row_per_student(tmp_path, layout):
+    folder = tmp_path / "taramalar"
+    folder.mkdir()
+    answers = scan_students(folder, layout, 3)
+    output = tmp_path / "cevaplar.csv"
+
+    assert omr.main([str(folder), "--questions", str(QUESTIONS), "--workers", "1",
+                     "-o", str(output)]) == 0
+
+    rows = read_output(output)
+    assert rows[0] == ["Öğrenci", "Sayfalar", "Cevaplar"]
+    assert [row[:2] for row in rows[1:]] == [["scan_0000", "1 2"], ["scan_0002", "1 2"],
+                                             ["scan_0004", "1 2"]]
+    assert [row[2] for row in rows[1:]] == [expected_text(selected) for selected in answers]
+
+    # Toplu puanlama dosyayı öğrenci başına bir satır olarak okur
+    graded = list(read_rows(str(output)))
+    assert [(student, len(text)) for line, student, text in graded] == \
+        [("scan_0000", QUESTIONS), ("scan_0002", QUESTIONS), ("scan_0004", QUESTIONS)]
+
+
+def test_missing_page_is_reported_and_left_blank(tmp_path, layout):
+    folder = tmp_path / "taramalar"
+    folder.mkdir()
+    answers = scan_students(folder, layout, 2, skip={(0, 1)})
+    output = tmp_path / "cevaplar.csv"
+
+    assert omr.main([str(folder), "--questions", str(QUESTIONS), "--workers", "1",
+                     "-o", str(output)]) == 1
+
+    rows = read_output(output)[1:]
+    assert [row[:2] for row in rows] == [["scan_0000", "1"], ["scan_0001", "1 2"]]
+    second_page = layout.page_questions(1)
+    first = answers[0].copy()
+    first[second_page.start:second_page.stop] = 0
+    assert rows[0][2] == expected_text(first)
+    assert rows[1][2] == expected_text(answers[1])
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+from PyQt5.QtWidgets import QMessageBox
+
+
+@pytest.fixture
+def app_dir(qapp, tmp_path, monkeypatch):
+    # Sonuç klasörü ve otomatik kayıt günlüğü çalışma klasörüne göre
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(QMessageBox, "question", staticmethod(lambda *args, **kwargs: QMessageBox.Yes))
+    monkeypatch.setattr(QMessageBox, "information", staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+    monkeypatch.setattr(QMessageBox, "warning", staticmethod(lambda *args, **kwargs: QMessageBox.Ok))
+    return tmp_path
+
+
+def saved_files(directory):
+    return sorted(name for name in os.listdir(directory / "test_results") if name.endswith(".okr"))
+
+
+def test_quit_after_save_is_not_restored_as_unsaved(app_dir):
+    import main
+    from autosave import read_journal, AUTOSAVE_PATH
+
+    window = main.OptikFormApp()
+    window.show()
+    tab = window.test_tab
+    tab.title_input.setText("Fizik Vize")
+    for index, option in enumerate("ABCDE"):
+        tab.sheet.select_option(index, option)
+    tab.finish_test()
+
+    # Çıkarken "Kaydetmek ister misiniz?" sorusuna Evet
+    window.close()
+
+    assert len(saved_files(app_dir)) == 1
+    assert tab.test_saved and tab.pending_save is None
+    meta = read_journal(AUTOSAVE_PATH)[0]
+    assert meta["saved"] and meta["completed"]
+
+    # Sonraki açılışta kaydedilmiş sınav tamamlanmış-kaydedilmemiş olarak geri gelmez
+    reopened = main.OptikFormApp()
+    assert not reopened.test_tab.is_test_completed
+    assert not reopened.test_tab.test_saved
+    reopened.close()
+    assert len(saved_files(app_dir)) == 1
@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+import record_cache
+from record_cache import RecordCache, record_size, RECORD_BYTES, QUESTION_BYTES
+from result_files import save_record
+
+
+def make_record(title, questions=0):
+    record = {"title": title, "date": "2024-01-01 10:00", "score": 50.0, "correct": 0, "wrong": 0,
+              "empty": 0, "wrong_ratio": 4}
+    if questions:
+        record["questions"] = [{"number": i + 1, "selected_option": None, "state": "unmarked",
+                                "is_correct": False, "was_empty": False} for i in range(questions)]
+    return record
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Diskten okunan yolları say"""
+    loaded = []
+    original = record_cache.load_record
+
+    def load_record(path):
+        loaded.append(os.path.basename(path))
+        return original(path)
+
+    monkeypatch.setattr(record_cache, "load_record", load_record)
+    return loaded
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(name, questions=0, title=None):
+        return save_record(str(tmp_path / f"{name}.okr"), make_record(title or name, questions))
+    return write
+
+
+def test_record_size_counts_questions_not_file_size():
+    assert record_size(make_record("a")) == RECORD_BYTES
+    assert record_size(make_record("a", 2000)) == RECORD_BYTES + 2000 * QUESTION_BYTES
+
+
+def test_hit_does_not_reread(write, loads):
+    cache = RecordCache()
+    path = write("a")
+    first = cache.get(path)
+    assert cache.get(path) is first
+    assert loads == ["a.okr"]
+
+
+def test_evicts_least_recently_used_by_count(write, loads):
+    cache = RecordCache(max_entries=2)
+    a, b, c = write("a"), write("b"), write("c")
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)          # a en son kullanılan
+    cache.get(c)          # b çıkarılır
+    assert list(cache.entries) == [a, c]
+    cache.get(b)
+    assert loads == ["a.okr", "b.okr", "c.okr", "b.okr"]
+    assert len(cache) == 2
+
+
+def test_evicts_by_decoded_size(write):
+    # İki 100 soruluk kayıt sığar, üçüncüsü en eskiyi çıkarır
+    limit = 2 * record_size(make_record("x", 100))
+    cache = RecordCache(max_entries=100, max_bytes=limit)
+    paths = [write(name, 100) for name in "abc"]
+    for path in paths:
+        cache.get(path)
+    assert list(cache.entries) == paths[1:]
+    assert cache.total_bytes == limit
+
+    # Diskte ~100 bayt olsa da bellekte sınırı aşan kayıt önbelleğe alınmaz
+    big = write("big", 1000)
+    assert os.path.getsize(big) < limit
+    record = cache.get(big)
+    assert len(record["questions"]) == 1000
+    assert big not in cache.entries
+    assert list(cache.entries) == paths[1:]
+
+
+def test_changed_file_is_reloaded(write, loads):
+    cache = RecordCache()
+    path = write("a", title="Eski")
+    assert cache.get(path)["title"] == "Eski"
+
+    # Aynı boyut, farklı içerik ve zaman
+    write("a", title="Yeni")
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    assert cache.get(path)["title"] == "Yeni"
+    assert loads == ["a.okr", "a.okr"]
+    assert len(cache) == 1 and cache.total_bytes == record_size(make_record("Yeni"))
+
+
+def test_deleted_file_is_not_served_from_cache(write):
+    cache = RecordCache()
+    path = write("a", 10)
+    cache.get(path)
+    os.remove(path)
+    with pytest.raises(FileNotFoundError):
+        cache.get(path)
+
+    cache.invalidate(path)
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_invalidate_and_clear_keep_size_in_step(write):
+    cache = RecordCache()
+    paths = [write(name, 10) for name in "abc"]
+    for path in paths:
+        cache.get(path)
+    cache.invalidate(paths[:2] + ["olmayan.okr"])
+    assert list(cache.entries) == paths[2:]
+    assert cache.total_bytes == record_size(make_record("c", 10))
+    cache.clear()
+    assert len(cache) == 0 and cache.total_bytes == 0
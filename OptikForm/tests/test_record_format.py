@@ -0,0 +1,102 @@
+import json
+import os
+
+import pytest
+
+from migrate_results import migrate_file
+from record_format import encode_record, encode_codes, decode_record, question_codes, MAGIC
+from result_files import save_record, load_record
+
+
+def make_record(questions=True, numbers=None):
+    record = {
+        "title": "Ağ Yönetimi ve Bilgi Güvenliği 2018 Bahar Vize",
+        "date": "2024-03-05 14:30",
+        "score": 41.25,
+        "correct": 2,
+        "wrong": 1,
+        "empty": 1,
+        "wrong_ratio": 4,
+    }
+    if questions:
+        options = ("A", "C", None, "E", None)
+        states = ("correct", "wrong", "empty", "correct", "unmarked")
+        record["questions"] = [
+            {
+                "number": number,
+                "selected_option": option,
+                "state": state,
+                "is_correct": state == "correct",
+                "was_empty": option is None or number == 4,
+            }
+            for number, option, state in zip(numbers or range(1, 6), options, states)
+        ]
+    return record
+
+
+@pytest.mark.parametrize("record", [
+    make_record(),
+    make_record(questions=False),
+    make_record(numbers=[3, 7, 8, 40, 41]),
+    dict(make_record(), score=75, wrong_ratio=3.5),
+], ids=["questions", "summary-only", "custom-numbers", "int-score-float-ratio"])
+def test_round_trip_is_lossless(record):
+    data = encode_record(record)
+    assert data.startswith(MAGIC)
+    decoded = decode_record(data)
+    # Anahtar sırası ve türler dahil JSON kaydıyla aynı
+    assert json.dumps(decoded) == json.dumps(record)
+
+
+def test_encode_codes_matches_encode_record():
+    record = make_record()
+    codes = question_codes(encode_record(record))
+    assert len(codes) == len(record["questions"])
+    assert encode_codes(record["title"], record["date"], record["score"], record["wrong_ratio"],
+                        record["correct"], record["wrong"], record["empty"], codes) == encode_record(record)
+
+
+def test_question_codes_without_questions():
+    assert question_codes(encode_record(make_record(questions=False))) is None
+
+
+@pytest.mark.parametrize("change", [
+    {"extra": 1},
+    {"score": "41"},
+    {"correct": -1},
+    {"questions": [{"number": 1, "selected_option": "F", "state": "correct",
+                    "is_correct": True, "was_empty": False}]},
+])
+def test_unsupported_records_are_rejected(change):
+    with pytest.raises(ValueError):
+        encode_record(dict(make_record(), **change))
+
+
+def test_truncated_data_is_rejected():
+    data = encode_record(make_record())
+    for size in (2, 10, len(data) - 1):
+        with pytest.raises(ValueError):
+            decode_record(data[:size])
+
+
+@pytest.mark.parametrize("extension", [".okr", ".json"])
+def test_save_and_load_record(tmp_path, extension):
+    record = make_record()
+    (tmp_path / "kayitlar").mkdir()
+    path = save_record(str(tmp_path / "kayitlar" / f"deneme{extension}"), record)
+    assert load_record(path) == record
+    assert os.listdir(tmp_path / "kayitlar") == [f"deneme{extension}"]
+
+
+def test_migrate_file_replaces_json_with_identical_binary_record(tmp_path):
+    record = make_record()
+    path = str(tmp_path / "eski.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f)
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+
+    target = migrate_file(path)
+    assert target == str(tmp_path / "eski.okr")
+    assert not os.path.exists(path)
+    assert load_record(target) == record
+    assert os.path.getmtime(target) == 1_600_000_000
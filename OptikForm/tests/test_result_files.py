@@ -0,0 +1,44 @@
+import datetime
+import os
+
+import pytest
+
+from result_files import result_path, save_record, scan_result_files, safe_filename
+
+WHEN = datetime.datetime(2024, 5, 6, 10, 30, 15)
+
+
+@pytest.mark.parametrize("title, name", [
+    ("Matematik 2024 Güz Vize", "Matematik 2024 Güz Vize"),
+    ("Ali/Veli", "Ali_Veli"),
+    ("a\\b", "a_b"),
+    ("../escape", "___escape"),
+    ("/../../x", "_.._.._x"),
+    ("Vize: 1?", "Vize_ 1_"),
+    (".gizli", "_gizli"),
+])
+def test_safe_filename(title, name):
+    assert safe_filename(title) == name
+
+
+@pytest.mark.parametrize("title", ["Ali/Veli", "../escape", "/../../x", "..", "a\\b\\c"])
+def test_result_path_stays_in_results_dir(tmp_path, title):
+    results_dir = str(tmp_path / "sonuclar")
+    path = result_path(title, WHEN, results_dir)
+    assert os.path.dirname(path) == results_dir
+    assert path.endswith("_20240506_103015.okr")
+
+    os.makedirs(results_dir)
+    record = {"title": title, "date": "2024-05-06 10:30", "score": 0, "correct": 0, "wrong": 0,
+              "empty": 0, "wrong_ratio": 4}
+    save_record(path, record)
+    assert [found for found, mtime, size in scan_result_files(results_dir)] == [path]
+    assert os.listdir(tmp_path) == ["sonuclar"]
+
+
+def test_save_record_does_not_create_directories(tmp_path):
+    record = {"title": "T", "date": "2024-05-06 10:30", "score": 0, "correct": 0, "wrong": 0,
+              "empty": 0, "wrong_ratio": 4}
+    with pytest.raises(FileNotFoundError):
+        save_record(str(tmp_path / "yok" / "T.okr"), record)
+    assert os.listdir(tmp_path) == []
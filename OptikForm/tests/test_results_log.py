@@ -0,0 +1,150 @@
+import os
+import threading
+
+import pytest
+
+from results_log import ResultsLog, SEGMENT_PREFIX
+
+
+def make_record(number, questions=20):
+    return {
+        "title": f"Deneme {number}",
+        "date": "2024-01-01 10:00",
+        "score": float(number),
+        "correct": number % questions,
+        "wrong": 0,
+        "empty": 0,
+        "wrong_ratio": 4,
+        "questions": [
+            {"number": i + 1, "selected_option": "A", "state": "correct", "is_correct": True,
+             "was_empty": False}
+            for i in range(questions)
+        ],
+    }
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = ResultsLog(str(tmp_path / "log"))
+    # Küçük segmentler: birkaç kayıtta yeni segment açılır
+    log.SEGMENT_SIZE = 1024
+    yield log
+    log.close()
+
+
+def segments(log):
+    return sorted(name for name in os.listdir(log.directory) if name.startswith(SEGMENT_PREFIX))
+
+
+def titles(log):
+    return [summary["title"] for summary in log.page(log.count())]
+
+
+def test_compaction_keeps_live_records_and_removes_dead_segments(log):
+    keys = [log.append(make_record(i)) for i in range(40)]
+    log.delete(keys[::2])
+    assert len(segments(log)) > 2
+    total = log.total_bytes()
+
+    log.compact()
+
+    assert log.total_bytes() < total
+    assert log.total_bytes() == log.live_bytes
+    assert len(segments(log)) == 1
+    assert titles(log) == [f"Deneme {i}" for i in reversed(range(1, 40, 2))]
+    for key in keys[1::2]:
+        assert log.load(key) == make_record(int(log.summary(key)["title"].split()[1]))
+
+
+def test_compacted_log_reopens_with_same_records(log):
+    keys = [log.append(make_record(i)) for i in range(30)]
+    log.delete(keys[:20])
+    log.compact()
+    log.append(make_record(99))
+    expected = titles(log)
+    log.close()
+
+    reopened = ResultsLog(log.directory)
+    assert titles(reopened) == expected
+    assert reopened.load(keys[25]) == make_record(25)
+
+
+def test_writes_during_compaction_go_to_a_new_segment(log):
+    keys = [log.append(make_record(i)) for i in range(20)]
+    log.delete(keys[:10])
+
+    # Kopyalama sırasında (kilit tutulmadan) yeni kayıt eklenir ve bir kayıt silinir
+    original_replace = os.replace
+    during = {}
+
+    def replace(source, target):
+        if source.endswith(".tmp") and "added" not in during:
+            during["added"] = log.append(make_record(100))
+            log.delete(keys[15])
+        return original_replace(source, target)
+
+    os.replace = replace
+    try:
+        log.compact()
+    finally:
+        os.replace = original_replace
+
+    assert log.load(during["added"]) == make_record(100)
+    assert keys[15] not in {summary["path"] for summary in log.page(log.count())}
+    log.close()
+    reopened = ResultsLog(log.directory)
+    assert sorted(titles(reopened)) == sorted(titles(log))
+    assert "Deneme 15" not in titles(reopened)
+
+
+def test_needs_compaction_after_enough_garbage(tmp_path):
+    log = ResultsLog(str(tmp_path / "log"))
+    log.COMPACT_MIN_BYTES = 4096
+    keys = [log.append(make_record(i, questions=200)) for i in range(40)]
+    assert not log.needs_compaction()
+    log.delete(keys[:30])
+    assert log.needs_compaction()
+    log.compact()
+    assert not log.needs_compaction()
+    log.close()
+
+
+def test_concurrent_compaction_runs_once(log):
+    keys = [log.append(make_record(i)) for i in range(20)]
+    log.delete(keys[:10])
+    threads = [threading.Thread(target=log.compact) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert titles(log) == [f"Deneme {i}" for i in reversed(range(10, 20))]
+
+
+def test_interrupted_compaction_leftovers_are_ignored(log):
+    keys = [log.append(make_record(i)) for i in range(10)]
+    log.close()
+    # Kesinti: yarım yazılmış sıkıştırma dosyası kalmış
+    with open(os.path.join(log.directory, f"{SEGMENT_PREFIX}000099.log.tmp"), "wb") as f:
+        f.write(b"yarim")
+
+    reopened = ResultsLog(log.directory)
+    assert reopened.count() == 10
+    assert reopened.load(keys[3]) == make_record(3)
+    assert not any(name.endswith(".tmp") for name in os.listdir(log.directory))
+
+
+def test_snapshot_includes_records_appended_before_it(tmp_path):
+    log = ResultsLog(str(tmp_path / "log"))
+    for i in range(log.SNAPSHOT_INTERVAL):
+        log.append(make_record(i))
+    # close() çağrılmadan yeniden açılır: yalnızca ekleme sırasında yazılan dizin kullanılır
+    assert ResultsLog(log.directory).count() == log.SNAPSHOT_INTERVAL
+
+
+def test_append_many_survives_reopen(tmp_path):
+    log = ResultsLog(str(tmp_path / "log"))
+    keys = log.append_many([make_record(i) for i in range(300)])
+    assert len(keys) == 300
+    assert [log.load(key) for key in keys[:3]] == [make_record(i) for i in range(3)]
+    assert ResultsLog(log.directory).count() == 300
+    assert log.append_many([]) == []
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from scoring import compute_score, score_sheets, score_records
+from sheet_codes import STATE_CODES, OPTION_CODES, NO_OPTION
+
+
+def baseline_result(questions, wrong_ratio):
+    """İlk sürümdeki TestTab.calculate_and_show_results hesabı (20 soruluk test)"""
+    total_questions = 20
+    correct_count = sum(1 for q in questions if q["state"] == "correct")
+    wrong_count = sum(1 for q in questions if q["state"] == "wrong")
+    empty_count = sum(1 for q in questions if q["state"] == "empty" or (not q["selected_option"] and q["state"] == "unmarked"))
+
+    score = ((correct_count - (wrong_count / wrong_ratio)) / total_questions) * 100
+    score = max(0, score)
+
+    return f"Puan: {score:.1f}/100 | Doğru: {correct_count} | Yanlış: {wrong_count} | Boş: {empty_count}"
+
+
+def make_questions(correct, wrong, empty, blank, chosen):
+    """20 soruluk kağıt: doğru, yanlış, boş işaretli, dokunulmamış ve şıkkı seçilmiş ama değerlendirilmemiş"""
+    questions = ([{"selected_option": "A", "state": "correct"}] * correct
+                 + [{"selected_option": "B", "state": "wrong"}] * wrong
+                 + [{"selected_option": None, "state": "empty"}] * empty
+                 + [{"selected_option": None, "state": "unmarked"}] * blank
+                 + [{"selected_option": "C", "state": "unmarked"}] * chosen)
+    assert len(questions) == 20
+    return questions
+
+
+# (doğru, yanlış, boş, dokunulmamış, seçilmiş, oran, ilk sürümün gösterdiği sonuç)
+CASES = [
+    (20, 0, 0, 0, 0, 4, "Puan: 100.0/100 | Doğru: 20 | Yanlış: 0 | Boş: 0"),
+    (0, 0, 0, 20, 0, 4, "Puan: 0.0/100 | Doğru: 0 | Yanlış: 0 | Boş: 20"),
+    (15, 4, 1, 0, 0, 4, "Puan: 70.0/100 | Doğru: 15 | Yanlış: 4 | Boş: 1"),
+    (15, 4, 1, 0, 0, 3, "Puan: 68.3/100 | Doğru: 15 | Yanlış: 4 | Boş: 1"),
+    (15, 4, 1, 0, 0, 5, "Puan: 71.0/100 | Doğru: 15 | Yanlış: 4 | Boş: 1"),
+    (10, 10, 0, 0, 0, 2, "Puan: 25.0/100 | Doğru: 10 | Yanlış: 10 | Boş: 0"),
+    (13, 6, 0, 1, 0, 4, "Puan: 57.5/100 | Doğru: 13 | Yanlış: 6 | Boş: 1"),
+    (11, 1, 4, 4, 0, 3, "Puan: 53.3/100 | Doğru: 11 | Yanlış: 1 | Boş: 8"),
+    (1, 1, 0, 18, 0, 4, "Puan: 3.8/100 | Doğru: 1 | Yanlış: 1 | Boş: 18"),
+    (1, 2, 0, 17, 0, 3, "Puan: 1.7/100 | Doğru: 1 | Yanlış: 2 | Boş: 17"),
+    # Yanlışların götürüsü doğruları aşınca puan 0'a çekilir
+    (3, 17, 0, 0, 0, 4, "Puan: 0.0/100 | Doğru: 3 | Yanlış: 17 | Boş: 0"),
+    (0, 5, 15, 0, 0, 4, "Puan: 0.0/100 | Doğru: 0 | Yanlış: 5 | Boş: 15"),
+    # Şıkkı seçilmiş ama değerlendirilmemiş sorular hiçbir sayıya girmez
+    (8, 2, 0, 5, 5, 4, "Puan: 37.5/100 | Doğru: 8 | Yanlış: 2 | Boş: 5"),
+]
+
+
+def result_text(score, correct, wrong, empty):
+    return f"Puan: {score:.1f}/100 | Doğru: {correct} | Yanlış: {wrong} | Boş: {empty}"
+
+
+@pytest.mark.parametrize("correct, wrong, empty, blank, chosen, ratio, expected", CASES)
+def test_table_matches_baseline(correct, wrong, empty, blank, chosen, ratio, expected):
+    assert baseline_result(make_questions(correct, wrong, empty, blank, chosen), ratio) == expected
+
+
+@pytest.mark.parametrize("correct, wrong, empty, blank, chosen, ratio, expected", CASES)
+def test_compute_score_matches_baseline(correct, wrong, empty, blank, chosen, ratio, expected):
+    score = compute_score(correct, wrong, 20, ratio)
+    assert result_text(score, correct, wrong, empty + blank) == expected
+
+
+def test_score_sheets_matches_baseline():
+    sheets = [make_questions(*case[:5]) for case in CASES]
+    states = np.array([[STATE_CODES[q["state"]] for q in sheet] for sheet in sheets], dtype=np.uint8)
+    selected = np.array([[OPTION_CODES.get(q["selected_option"], NO_OPTION) for q in sheet] for sheet in sheets],
+                        dtype=np.uint8)
+    ratios = np.array([case[5] for case in CASES], dtype=np.float64)
+
+    result = score_sheets(states, selected, ratios)
+    for i, case in enumerate(CASES):
+        text = result_text(result["score"][i], result["correct"][i], result["wrong"][i], result["empty"][i])
+        assert text == case[6]
+        assert result["total"][i] == 20
+        assert result["score"][i] == pytest.approx(compute_score(*case[:2], 20, case[5]))
+
+
+def test_score_records_uses_each_records_ratio():
+    records = [{"wrong_ratio": case[5], "questions": make_questions(*case[:5])} for case in CASES]
+    result = score_records(records)
+    for i, case in enumerate(CASES):
+        assert result_text(result["score"][i], result["correct"][i], result["wrong"][i], result["empty"][i]) == case[6]
+
+
+def test_empty_sheet_scores_zero():
+    assert compute_score(0, 0, 0, 4) == 0
+    assert compute_score(np.array([0, 5]), np.array([0, 0]), np.array([0, 5]), 4).tolist() == [0.0, 100.0]
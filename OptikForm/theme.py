@@ -0,0 +1,64 @@
+# Uygulama genelinde tek seferde yüklenen stil sayfası.
+# Soru satırlarındaki gösterge butonlarının görünümü dinamik özelliklerle seçilir:
+#   QPushButton[indicator="empty"][active="true"] ...
+# Şık butonları (OptionButton) stil sayfası kullanmaz, kendileri çizilir.
+# Böylece her tıklamada CSS yeniden ayrıştırılmaz; yalnızca ilgili widget yeniden cilalanır.
+APP_STYLESHEET = """
+    Question {
+        background-color: #f5f5f5;
+        border-radius: 5px;
+    }
+
+    QPushButton[indicator] {
+        background-color: #e0e0e0;
+        color: #333;
+        border-radius: 12px;
+        font-weight: bold;
+        font-size: 14px;
+    }
+    QPushButton[indicator="correct"]:hover {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QPushButton[indicator="wrong"]:hover {
+        background-color: #f44336;
+        color: white;
+    }
+    QPushButton[indicator="empty"]:hover {
+        background-color: #9e9e9e;
+        color: white;
+    }
+    QPushButton[indicator="correct"][active="true"] {
+        background-color: #4CAF50;
+        color: white;
+    }
+    QPushButton[indicator="wrong"][active="true"] {
+        background-color: #f44336;
+        color: white;
+    }
+    QPushButton[indicator="empty"][active="true"] {
+        background-color: #2196F3;
+        color: white;
+    }
+"""
+
+
+def apply_theme(app):
+    """Stil sayfasını uygulamaya bir kez yükle"""
+    app.setStyleSheet(APP_STYLESHEET)
+
+
+def set_style_property(widget, name, value):
+    """Dinamik özelliği değiştir; değer aynıysa hiçbir şey yapma
+
+    Değişiklik olduğunda yalnızca bu widget yeniden cilalanır, stil
+    sayfası yeniden ayrıştırılmaz.
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
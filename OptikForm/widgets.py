@@ -0,0 +1,16 @@
+from PyQt5.QtWidgets import QTableWidgetItem
+
+# Birden fazla pencerenin kullandığı ortak tablo öğeleri
+
+
+class SortableItem(QTableWidgetItem):
+    """Gösterilen metinden bağımsız bir sıralama anahtarı taşıyan hücre"""
+
+    def __init__(self, text, key):
+        super().__init__(text)
+        self.key = key
+
+    def __lt__(self, other):
+        if isinstance(other, SortableItem):
+            return self.key < other.key
+        return super().__lt__(other)